@@ -6,16 +6,20 @@ Includes: Search, Photos, Complete Info, Variable Matches
 
 
 
-from flask import Flask, render_template, request, jsonify
-import pandas as pd
-from model import PlayerPerformanceModel
-from data_generator import generate_heatmap_data
-from football_json_loader import FootballJSONLoader
-from load_premier_league_matches import load_matches
+from flask import Flask, Response, render_template, request, jsonify, url_for
+from response_cache import ResponseCache
+from metrics import CONTENT_TYPE as METRICS_CONTENT_TYPE, RequestMetrics
+from profiling import RequestProfiler
+from lazy import LazyObject
+import config
 import os
 import json
-import joblib
-import numpy as np
+import base64
+import binascii
+from datetime import datetime
+
+# pandas, scikit-learn, requests and the loaders are imported on first use
+# (or by preload()), so pages like / and /api/leagues start without them
 
 
 
@@ -60,111 +64,112 @@ app = Flask(__name__)
 
 
 
-model = None
-df = None
-football_loader = FootballJSONLoader()
-premier_league_matches = None
+def _create_football_loader():
+    from football_json_loader import FootballJSONLoader
+    return FootballJSONLoader()
 
 
+def _create_live_scores_hub():
+    from live_stream import LiveScoreHub
+    return LiveScoreHub(
+        # Re-read (mirror first) on the poller's schedule, not when the league cache expires
+        lambda league_name, season: (lambda: football_loader.refresh_league_matches(league_name, season)),
+        poll_interval=config.LIVE_STREAM_CONFIG['poll_interval'],
+        queue_size=config.LIVE_STREAM_CONFIG['queue_size'],
+        replay_size=config.LIVE_STREAM_CONFIG['replay_size'],
+        max_connections=config.LIVE_STREAM_CONFIG['max_connections'],
+    )
 
-# Load the prediction model
-prediction_model_data = None
-prediction_model = None
-prediction_scaler = None
-prediction_feature_columns = None
 
+football_loader = LazyObject(_create_football_loader)
 
+# One shared producer per league/season pushes score changes to every SSE client
+live_scores_hub = LazyObject(_create_live_scores_hub)
 
-DATA_FILE = 'player_data.csv'
-MODEL_FILE = 'model.pkl'
+# Serialized responses of read-only endpoints, reused until their data version changes
+response_cache = ResponseCache(**config.RESPONSE_CACHE_CONFIG)
 
+# Per-route latency, counts, errors and sizes plus cache hit ratios, served at /metrics
+metrics = RequestMetrics(**config.METRICS_CONFIG)
+metrics.init_app(app)
+metrics.register_cache('response', response_cache.stats)
+# The loader's caches are only reported once something has used the loader
+metrics.register_cache('league', lambda: football_loader.cache.stats() if football_loader.loaded else None)
+metrics.register_cache('derived', lambda: football_loader.derived_cache.stats() if football_loader.loaded else None)
 
+# Opt-in (config or admin header) cProfile summaries of sampled requests
+profiler = RequestProfiler(**config.PROFILING_CONFIG)
+profiler.init_app(app)
 
-def load_prediction_model():
-    """Load the player prediction model"""
-    global prediction_model_data, prediction_model, prediction_scaler, prediction_feature_columns
-    try:
-        prediction_model_data = joblib.load('model.pkl')
-        prediction_model = prediction_model_data['model']
-        prediction_scaler = prediction_model_data['scaler']
-        prediction_feature_columns = prediction_model_data['feature_columns']
-        print("✅ Prediction model loaded successfully")
-    except Exception as e:
-        print(f"⚠️  Could not load prediction model: {e}")
 
 
+DATA_FILE = config.DATA_CONFIG['data_file']
+MODEL_FILE = config.DATA_CONFIG['model_file']
 
-def load_premier_league_matches_data():
-    """Load Premier League matches from local JSON file"""
-    global premier_league_matches
-    try:
-        with open('premier_league_2024_25_matches.json', 'r') as f:
-            data = json.load(f)
-        
-        matches = []
-        for match in data['matches']:
-            match_info = {
-                'date': match.get('date'),
-                'time': match.get('time', ''),
-                'round': match.get('round'),
-                'team1': match.get('team1'),
-                'team2': match.get('team2'),
-                'score1': None,
-                'score2': None,
-            }
-            
-            # Extract scores if available
-            if 'score' in match and 'ft' in match['score']:
-                match_info['score1'] = match['score']['ft'][0]
-                match_info['score2'] = match['score']['ft'][1]
-            
-            matches.append(match_info)
-        
-        premier_league_matches = matches
-        print(f"✅ Loaded {len(matches)} Premier League matches from local file")
-    except Exception as e:
-        print(f"⚠️  Could not load local matches: {e}")
-        premier_league_matches = []
+def _create_data_store():
+    from data_store import DataStore
+    return DataStore(DATA_FILE, MODEL_FILE, poll_interval=config.DATA_CONFIG['reload_interval'],
+                     photos=PLAYER_PHOTOS)
 
 
+# Player data and model are loaded once and hot-reloaded when the files change
+data_store = LazyObject(_create_data_store)
 
-def load_app_data():
-    global model, df
-    
-    if os.path.exists(DATA_FILE):
-        df = pd.read_csv(DATA_FILE)
-        print(f"✅ TRANSFERMARKT DATA: {df['player_name'].nunique()} players")
-        print(f"   Season: 2024-2025 (CURRENT)")
-    else:
-        return False, "Run: python train_model_transfermarkt.py"
-    
-    model = PlayerPerformanceModel()
-    if os.path.exists(MODEL_FILE):
-        model.load_model(MODEL_FILE)
-    else:
-        return False, "Run: python train_model_transfermarkt.py"
+
+
+def preload():
+    """
+    Load player data, the prediction model (both in the data snapshot) and match data up front
     
-    return True, "OK"
+    Preforking servers (wsgi.py) call this in the master process so every
+    worker shares the loaded data copy-on-write instead of loading its own.
+    It is also the warm-up step that imports everything app.py defers.
+    """
+    import data_generator, fast_json, live_stream, match_store  # Warm the deferred imports
+    snapshot = data_store.snapshot
+    for league_name, season in config.SERVER_CONFIG['preload_leagues']:
+        football_loader.get_team_statistics(league_name, season)
+    if config.HISTORY_CONFIG['preload']:
+        football_loader.refresh_history(network=False)  # Mirror only: never download at boot
+    print(f"✅ Preloaded player data (v{snapshot.version}) and "
+          f"{len(football_loader.match_store)} matches")
+
+
+
+def player_data_version(**kwargs):
+    """Response-cache version for endpoints built from the player data snapshot"""
+    return str(get_data().version)
+
+
+def league_data_version(league_name, **kwargs):
+    """Response-cache version for endpoints built from one league/season"""
+    return football_loader.data_version(league_name, request.args.get('season', '2024-25'))
+
+
+def get_data():
+    """Return the current player data snapshot (starts the file watcher on first use)"""
+    data_store.start()
+    return data_store.snapshot
 
 
 
 @app.route('/')
 def index():
     """Default homepage - live scores"""
-    return render_template('live_scores.html')
+    return render_template('live_scores.html',
+                           fallback_poll_interval=config.LIVE_STREAM_CONFIG['fallback_poll_interval'])
 
 
 
 @app.route('/players')
 def players():
     """Player statistics page"""
-    success, message = load_app_data()
-    if not success:
-        return render_template('error.html', message=message)
+    data = get_data()
+    if not data.ok:
+        return render_template('error.html', message=data.message)
     
-    players_list = sorted(df['player_name'].unique().tolist())
-    players_json = json.dumps(players_list)  # Convert to JSON string
-    return render_template('index.html', players=players_list, players_json=players_json)
+    # Names are fetched on demand from /api/players/search
+    return render_template('index.html')
 
 
 
@@ -176,67 +181,74 @@ def players():
 @app.route('/api/players')
 def get_all_players():
     """Return list of all player names for autocomplete"""
-    success, message = load_app_data()
-    if not success or df is None:
+    data = get_data()
+    if not data.ok or data.df is None:
         return jsonify({'error': 'Data not loaded'}), 500
     
     try:
-        # Get unique player names sorted alphabetically
-        players_list = sorted(df['player_name'].unique().tolist())
-        return jsonify(players_list)
+        # Unique player names, sorted alphabetically when the snapshot was built
+        return jsonify(data.search_index.names)
     except Exception as e:
         print(f"❌ Error getting players: {e}")
         return jsonify({'error': str(e)}), 500
 
 
 
+@app.route('/api/players/search')
+def search_players():
+    """Autocomplete: player names matching ?q= (prefix, then typo-tolerant), at most ?limit="""
+    data = get_data()
+    if data.df is None:
+        return jsonify({'error': 'Data not loaded'}), 500
+    
+    query = request.args.get('q', '')
+    try:
+        limit = int(request.args.get('limit', 8))
+    except ValueError:
+        return jsonify({'error': 'limit must be an integer'}), 400
+    
+    players_list = data.search_index.search(query, limit)
+    return jsonify({
+        'query': query,
+        'count': len(players_list),
+        'players': players_list
+    })
+
+
+
 @app.route('/player/<player_name>')
 def player_detail(player_name):
     """Individual player detail page"""
-    success, message = load_app_data()
-    if not success:
-        return render_template('error.html', message=message)
+    data = get_data()
+    if not data.ok:
+        return render_template('error.html', message=data.message)
     
     # Normalize player name
     player_name = player_name.strip()
     
-    # Check if player exists (case-insensitive)
-    player_exists = df[df['player_name'].str.strip().str.lower() == player_name.lower()]
+    # Check if player exists (case/accent-insensitive)
+    entry = data.name_index.lookup(player_name)
     
-    if player_exists.empty:
+    if entry is None:
         return render_template('error.html', message=f"Player '{player_name}' not found")
     
     # Get actual player name from dataset
-    actual_name = player_exists.iloc[0]['player_name']
-    
-    return render_template('player_detail.html', player_name=actual_name)
+    return render_template('player_detail.html', player_name=entry.name)
 
 
 
 def get_player_photo_url(player_name):
     """Generate player photo URL - returns None for CSS placeholder if not found"""
-    # Direct match
-    if player_name in PLAYER_PHOTOS:
-        return PLAYER_PHOTOS[player_name]
-    
-    # Try removing special characters for matching
-    import unicodedata
-    normalized_name = ''.join(c for c in unicodedata.normalize('NFD', player_name) if unicodedata.category(c) != 'Mn')
-    
-    for photo_key in PLAYER_PHOTOS.keys():
-        normalized_key = ''.join(c for c in unicodedata.normalize('NFD', photo_key) if unicodedata.category(c) != 'Mn')
-        if normalized_name.lower() == normalized_key.lower():
-            return PLAYER_PHOTOS[photo_key]
-    
-    # Return None - let frontend CSS handle the placeholder
-    return None
+    return get_data().name_index.photo_url(player_name)
 
 
 
 
 @app.route('/api/player/<path:player_name>')
+@response_cache.cached(player_data_version)
 def get_player_stats(player_name):
-    if df is None:
+    data = get_data()
+    if data.df is None:
         return jsonify({'error': 'Not loaded'}), 500
     
     # Normalize the player name - decode URL encoding and strip whitespace
@@ -245,99 +257,29 @@ def get_player_stats(player_name):
     
     print(f"🔍 Searching for: '{player_name}'")
     
-    # Try exact match first
-    player_data = df[df['player_name'].str.strip() == player_name]
-    
-    # If not found, try case-insensitive match
-    if len(player_data) == 0:
-        player_data = df[df['player_name'].str.strip().str.lower() == player_name.lower()]
+    # Exact match first, then case/accent-insensitive
+    entry = data.name_index.lookup(player_name)
     
     # Still not found? Return 404
-    if len(player_data) == 0:
+    if entry is None:
         print(f"❌ Player not found: '{player_name}'")
         return jsonify({'error': f'Player "{player_name}" not found'}), 404
     
-    profile = player_data.iloc[0]
-    actual_player_name = str(profile['player_name'])
-    
-    print(f"✅ Found player: '{actual_player_name}' - {len(player_data)} matches")
-    
-    # Helper function to safely convert values
-    def safe_str(val):
-        if pd.isna(val) or val is None or str(val).strip() in ['', 'nan', 'NaN', 'None']:
-            return ''
-        return str(val).strip()
-    
-    def safe_int(val):
-        try:
-            if pd.isna(val) or val is None or val == '':
-                return 0
-            return int(float(val))
-        except:
-            return 0
-    
-    def safe_float(val):
-        try:
-            if pd.isna(val) or val is None or val == '':
-                return 0.0
-            return float(val)
-        except:
-            return 0.0
-    
-    # Convert recent matches safely - replace NaN with None
-    recent_matches_df = player_data.head(10).fillna('')  # Replace NaN with empty string
-    recent_matches = recent_matches_df.to_dict('records')
+    print(f"✅ Found player: '{entry.name}' - {len(entry.rows)} matches")
     
-    # Build response with safe conversions
-    response_data = {
-        'player_name': actual_player_name,
-        'full_name': safe_str(profile.get('full_name')) or actual_player_name,
-        'photo_url': get_player_photo_url(actual_player_name),  # Returns None if not in dictionary
-        'birth_date': safe_str(profile.get('birth_date')),
-        'age': safe_int(profile.get('age')),
-        'height_cm': f"{safe_int(profile.get('height_cm'))} cm",
-        'weight_kg': f"{safe_int(profile.get('weight_kg'))} kg",
-        'nationality': safe_str(profile.get('nationality')) or 'Unknown',
-        'position': safe_str(profile.get('position')) or 'Unknown',
-        'positions_full': safe_str(profile.get('position')) or 'Unknown',
-        'preferred_foot': safe_str(profile.get('preferred_foot')) or 'Unknown',
-        'overall_rating': safe_int(safe_float(profile.get('market_value_euro')) / 5000000),
-        'current_team': safe_str(profile.get('team')) or 'Unknown',
-        'total_matches': safe_int(profile.get('Appearances')) or 35,
-        'avg_performance': round(player_data['performance_rating'].mean(), 2),
-        'total_goals': int(player_data['goals'].sum()),
-        'total_assists': int(player_data['assists'].sum()),
-        'avg_shots': round(player_data['shots'].mean(), 2),
-        'shot_accuracy': round((player_data['shots_on_target'].sum() / max(player_data['shots'].sum(), 1) * 100), 1),
-        'total_passes': int(player_data['passes_completed'].sum()),
-        'avg_pass_accuracy': round(player_data['pass_accuracy'].mean(), 1),
-        'avg_passes_per_match': round(player_data['passes_completed'].mean(), 1),
-        'total_tackles': int(player_data['tackles'].sum()),
-        'total_interceptions': int(player_data['interceptions'].sum()),
-        'avg_dribbles': round(player_data['dribbles_completed'].mean(), 2),
-        'radar_stats': {
-            'goals': round(player_data['goals'].mean(), 2),
-            'assists': round(player_data['assists'].mean(), 2),
-            'shots_on_target': round(player_data['shots_on_target'].mean(), 2),
-            'pass_accuracy': round(player_data['pass_accuracy'].mean(), 2),
-            'tackles': round(player_data['tackles'].mean(), 2),
-            'interceptions': round(player_data['interceptions'].mean(), 2),
-            'dribbles_completed': round(player_data['dribbles_completed'].mean(), 2),
-        },
-        'performance_trend': {
-            'matches': player_data['match_id'].tolist(),
-            'ratings': player_data['performance_rating'].tolist(),
-        },
-        'recent_matches': recent_matches
-    }
+    # Aggregates are precomputed per data snapshot
+    stats = data.player_stats.get(entry.key)
+    response_data = dict(stats, photo_url=entry.photo_url)  # None if not in dictionary
     
     print(f"📊 Response data created successfully")
-    return jsonify(response_data)
+    from fast_json import json_response
+    return json_response(response_data)
 
 
 
 @app.route('/api/heatmap/<player_name>')
 def get_heatmap(player_name):
+    from data_generator import generate_heatmap_data
     x_pos, y_pos = generate_heatmap_data(player_name, n_positions=200)
     return jsonify({'x': x_pos.tolist(), 'y': y_pos.tolist()})
 
@@ -345,10 +287,12 @@ def get_heatmap(player_name):
 
 @app.route('/api/predict', methods=['POST'])
 def predict():
+    model = get_data().model
     if model is None:
         return jsonify({'error': 'Not loaded'}), 500
     
     try:
+        import pandas as pd
         data = request.get_json()
         prediction_data = pd.DataFrame({
             'minutes_played': [data.get('minutes_played', 90)],
@@ -373,7 +317,9 @@ def predict():
 
 
 @app.route('/api/feature_importance')
+@response_cache.cached(player_data_version)
 def get_feature_importance():
+    model = get_data().model
     if model is None:
         return jsonify({'error': 'Not loaded'}), 500
     
@@ -401,7 +347,8 @@ def leagues():
 @app.route('/live-scores')
 def live_scores():
     """Live scores page - Flashscore style"""
-    return render_template('live_scores.html')
+    return render_template('live_scores.html',
+                           fallback_poll_interval=config.LIVE_STREAM_CONFIG['fallback_poll_interval'])
 
 
 
@@ -412,60 +359,144 @@ def live_scores():
 
 
 @app.route('/api/league/table/<league_name>')
+@response_cache.cached(league_data_version)
 def get_league_table(league_name):
     """Get league standings/table"""
     try:
         season = request.args.get('season', '2024-25')
-        table = football_loader.get_team_statistics(league_name, season)
+        as_of = request.args.get('as_of')
+        
+        if as_of:
+            # Table after a given round, sliced from the precomputed season timeline
+            try:
+                table = football_loader.get_team_statistics_as_of(league_name, as_of, season)
+            except KeyError:
+                return jsonify({'error': f"Unknown round '{as_of}'", 'league': league_name}), 404
+        else:
+            table = football_loader.get_team_statistics(league_name, season)
         
         if table.empty:
             return jsonify({'error': 'No data available', 'league': league_name}), 404
         
-        return jsonify({
+        standings = table.to_dict('records')
+        
+        # ?include_form=1 returns each team's current form inline (saves one request per team)
+        if not as_of and request.args.get('include_form', '').lower() in ('1', 'true', 'yes'):
+            last_n = int(request.args.get('last_n', 5))
+            form = football_loader.get_league_form(league_name, season, last_n)
+            for row in standings:
+                row['form'] = form.get(row['team'], [])
+        
+        response = {
             'league': league_name,
             'season': season,
-            'standings': table.to_dict('records')
-        })
+            'standings': standings
+        }
+        if as_of:
+            response['as_of'] = as_of
+        return jsonify(response)
     except Exception as e:
         return jsonify({'error': str(e)}), 400
 
 
 
 @app.route('/api/league/matches/<league_name>')
+@response_cache.cached(league_data_version)
 def get_league_matches_api(league_name):
-    """Get all matches for a league - uses local data for Premier League"""
+    """
+    Get matches for a league (served from the local OpenFootball mirror when available)
+    
+    Optional filters: round, date_from/date_to (YYYY-MM-DD), team,
+    status=finished|scheduled, fields=date,team1,... and cursor pagination
+    with limit (the response's next_cursor is passed back as cursor)
+    """
+    from fast_json import ORIENTS, json_response
+    from match_store import MATCH_COLUMNS
     try:
         season = request.args.get('season', '2024-25')
+        orient = request.args.get('format', 'records')
+        if orient not in ORIENTS:
+            return jsonify({'error': f"Unknown format '{orient}'", 'formats': list(ORIENTS)}), 400
         
-        # Use local Premier League data for faster loading
-        if league_name == 'Premier League' and season == '2024-25':
-            if premier_league_matches is None:
-                load_premier_league_matches_data()
-            
-            return jsonify({
-                'league': league_name,
-                'season': season,
-                'total_matches': len(premier_league_matches),
-                'matches': premier_league_matches
-            })
+        status = request.args.get('status')
+        if status not in (None, 'finished', 'scheduled'):
+            return jsonify({'error': f"Unknown status '{status}'", 'statuses': ['finished', 'scheduled']}), 400
         
-        # Fallback to external API for other leagues/seasons
-        matches = football_loader.get_league_matches(league_name, season)
+        fields = None
+        if request.args.get('fields'):
+            fields = [f.strip() for f in request.args['fields'].split(',') if f.strip()]
+            unknown = [f for f in fields if f not in MATCH_COLUMNS]
+            if unknown:
+                return jsonify({'error': f"Unknown fields: {', '.join(unknown)}", 'fields': MATCH_COLUMNS}), 400
         
-        if matches.empty:
+        limit = request.args.get('limit')
+        if limit is not None:
+            try:
+                limit = int(limit)
+            except ValueError:
+                return jsonify({'error': f"limit must be an integer, got '{limit}'"}), 400
+            max_limit = config.MATCHES_API_CONFIG['max_page_size']
+            if not 1 <= limit <= max_limit:
+                return jsonify({'error': f'limit must be between 1 and {max_limit}'}), 400
+        after = None
+        if request.args.get('cursor'):
+            try:
+                after = decode_cursor(request.args['cursor'])
+            except ValueError:
+                return jsonify({'error': 'Invalid cursor'}), 400
+        
+        # Parsed once and passed on normalized: strptime also accepts '2024-8-1'
+        dates = {}
+        for key in ('date_from', 'date_to'):
+            if request.args.get(key):
+                try:
+                    dates[key] = datetime.strptime(request.args[key], '%Y-%m-%d').date().isoformat()
+                except ValueError:
+                    return jsonify({'error': f"{key} must be YYYY-MM-DD"}), 400
+        
+        matches, total, next_after = football_loader.get_matches_page(
+            league_name, season, after=after, limit=limit, fields=fields,
+            round_name=request.args.get('round'),
+            team=request.args.get('team'),
+            date_from=dates.get('date_from'),
+            date_to=dates.get('date_to'),
+            played=None if status is None else status == 'finished',
+        )
+        
+        if matches is None:
             return jsonify({'error': 'No data available', 'league': league_name}), 404
         
-        return jsonify({
+        # Columns are written straight to JSON (unplayed fixtures get null scores);
+        # ?format=columns returns {column: [values]} instead of one object per match
+        return json_response({
             'league': league_name,
             'season': season,
-            'total_matches': len(matches),
-            'matches': matches.to_dict('records')
-        })
+            'total_matches': total,
+            'count': len(matches),
+            'next_cursor': encode_cursor(next_after) if next_after is not None else None,
+            'format': orient,
+        }, frames={'matches': matches}, orient=orient)
     except Exception as e:
         return jsonify({'error': str(e)}), 400
 
 
 
+def encode_cursor(position: int) -> str:
+    """Opaque pagination cursor for a fixture-list position"""
+    return base64.urlsafe_b64encode(f"m:{position}".encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor: str) -> int:
+    try:
+        text = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)).decode()
+    except (binascii.Error, UnicodeDecodeError):
+        raise ValueError(cursor)
+    if not text.startswith('m:') or not text[2:].isdigit():
+        raise ValueError(cursor)
+    return int(text[2:])
+
+
+
 @app.route('/api/league/fixtures/<league_name>')
 def get_league_fixtures(league_name):
     """Get upcoming fixtures for a league"""
@@ -507,16 +538,185 @@ def get_team_form(league_name, team_name):
 
 
 
+@app.route('/api/league/form/<league_name>')
+def get_league_form(league_name):
+    """Get recent form for every team in a league (one request instead of one per team)"""
+    try:
+        season = request.args.get('season', '2024-25')
+        last_n = int(request.args.get('last_n', 5))
+        
+        form = football_loader.get_league_form(league_name, season, last_n)
+        
+        return jsonify({
+            'league': league_name,
+            'season': season,
+            'last_n': last_n,
+            'teams': {
+                team: {
+                    'form': results,
+                    'wins': results.count('W'),
+                    'draws': results.count('D'),
+                    'losses': results.count('L')
+                }
+                for team, results in form.items()
+            }
+        })
+    except Exception as e:
+        return jsonify({'error': str(e)}), 400
+
+
+
+@app.route('/api/team/position-history/<league_name>/<team_name>')
+def get_team_position_history(league_name, team_name):
+    """Get a team's league position and points after every round"""
+    try:
+        season = request.args.get('season', '2024-25')
+        
+        try:
+            history = football_loader.get_position_history(team_name, league_name, season)
+        except KeyError:
+            return jsonify({'error': f"Team '{team_name}' not found", 'league': league_name}), 404
+        
+        if not history:
+            return jsonify({'error': 'No data available', 'league': league_name}), 404
+        
+        return jsonify({
+            'team': team_name,
+            'league': league_name,
+            'season': season,
+            'history': history
+        })
+    except Exception as e:
+        return jsonify({'error': str(e)}), 400
+
+
+
+def history_loading_response(error):
+    """503 for h2h/team history while the history store is built in the background"""
+    response = jsonify({'error': str(error)})
+    response.status_code = 503
+    response.headers['Retry-After'] = str(config.HISTORY_CONFIG['retry_after'])
+    return response
+
+
+@app.route('/api/h2h/<team1>/<team2>')
+def get_head_to_head(team1, team2):
+    """Get every meeting between two teams (optionally ?league=...&since=2010-11&last_n=5)"""
+    from football_json_loader import HistoryNotReady
+    try:
+        league_name = request.args.get('league')
+        since = request.args.get('since')
+        last_n = int(request.args.get('last_n', 5))
+        
+        h2h = football_loader.get_head_to_head(team1, team2, league_name, since, last_n)
+        
+        if h2h['total_matches'] == 0:
+            return jsonify({'error': f"No matches found between '{team1}' and '{team2}'"}), 404
+        
+        return jsonify(h2h)
+    except HistoryNotReady as e:
+        return history_loading_response(e)
+    except Exception as e:
+        return jsonify({'error': str(e)}), 400
+
+
+
+@app.route('/api/team/history/<team_name>')
+def get_team_history(team_name):
+    """Get a team's record across seasons (optionally ?league=...&since=2010-11&last_n=5)"""
+    from football_json_loader import HistoryNotReady
+    try:
+        league_name = request.args.get('league')
+        since = request.args.get('since')
+        last_n = int(request.args.get('last_n', 5))
+        
+        history = football_loader.get_team_history(team_name, league_name, since, last_n)
+        
+        if history['total_matches'] == 0:
+            return jsonify({'error': f"Team '{team_name}' not found"}), 404
+        
+        return jsonify(history)
+    except HistoryNotReady as e:
+        return history_loading_response(e)
+    except Exception as e:
+        return jsonify({'error': str(e)}), 400
+
+
+
+@app.route('/api/stream/scores')
+def stream_scores():
+    """
+    Server-Sent Events stream of live score changes for a league
+    
+    The first event is a 'snapshot' (all matches and the table); after that
+    only 'delta' events with changed and removed matches and table rows are sent.
+    Reconnecting clients resume from Last-Event-ID when possible.
+    
+    Each stream holds a request thread, so once LIVE_STREAM_CONFIG
+    max_connections are open the answer is 503 and the client polls
+    /api/league/matches instead.
+    """
+    league_name = request.args.get('league', 'Premier League')
+    season = request.args.get('season', '2024-25')
+    if league_name not in config.LEAGUES:
+        return jsonify({'error': f"League '{league_name}' not supported"}), 400
+    
+    subscription = live_scores_hub.subscribe(
+        league_name, season, request.headers.get('Last-Event-ID') or request.args.get('last_event_id'))
+    if subscription is None:
+        poll_interval = config.LIVE_STREAM_CONFIG['fallback_poll_interval']
+        response = jsonify({
+            'error': 'Too many live streams open, poll instead',
+            'poll': url_for('get_league_matches_api', league_name=league_name, season=season),
+            'poll_interval': poll_interval,
+        })
+        response.status_code = 503
+        response.headers['Retry-After'] = str(poll_interval)
+        return response
+    live_scores_hub.start()
+    
+    return Response(subscription.stream(config.LIVE_STREAM_CONFIG['heartbeat']),
+                    mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+
+
+
 @app.route('/api/leagues')
+@response_cache.cached(lambda: 'static')
 def get_available_leagues():
     """Get list of available leagues"""
     return jsonify({
-        'leagues': list(football_loader.LEAGUES.keys()),
-        'details': football_loader.LEAGUES
+        'leagues': list(config.LEAGUES.keys()),
+        'details': config.LEAGUES
     })
 
 
 
+@app.route('/metrics')
+def get_metrics():
+    """Prometheus scrape endpoint"""
+    return Response(metrics.render(), content_type=METRICS_CONTENT_TYPE)
+
+
+
+@app.route('/debug/profiles')
+def get_profiles():
+    """
+    Hottest functions of recently profiled requests (optionally ?route=/api/...&limit=10)
+    
+    Needs PROFILING_CONFIG['token'], sent in the profiling header; sampling
+    alone ('enabled') does not expose this endpoint.
+    """
+    if not profiler.active or profiler.token is None:
+        return jsonify({'error': 'Profiling is disabled or has no token (see PROFILING_CONFIG)'}), 404
+    if not profiler.authorized():
+        return jsonify({'error': f'Profiling token required in the {profiler.header} header'}), 403
+    
+    profiles = profiler.profiles(request.args.get('route'), request.args.get('limit', type=int))
+    return jsonify({'count': len(profiles), 'sort_by': profiler.sort_by, 'profiles': profiles})
+
+
+
 # ============================================================================
 # Player Prediction Route
 # ============================================================================
@@ -528,9 +728,10 @@ def player_prediction():
     prediction = None
     error_message = None
     
-    # Check if model is loaded
-    if prediction_model is None or prediction_scaler is None:
-        error_message = "Prediction model not loaded. Please check model.pkl file."
+    # The snapshot's model (DATA_CONFIG['model_file']), shared with /api/predict
+    model = get_data().model
+    if model is None:
+        error_message = f"Prediction model not loaded. Please check {MODEL_FILE} file."
     
     if request.method == 'POST' and error_message is None:
         try:
@@ -549,6 +750,7 @@ def player_prediction():
             dribbles = float(request.form.get('dribbles', 0))
             
             # Create DataFrame with proper feature names (this fixes the warning)
+            import pandas as pd
             features_df = pd.DataFrame({
                 'minutes_played': [minutes_played],
                 'goals': [goals],
@@ -563,8 +765,8 @@ def player_prediction():
             })
             
             # Scale features and predict
-            features_scaled = prediction_scaler.transform(features_df)
-            performance_score = prediction_model.predict(features_scaled)[0]
+            features_scaled = model.scaler.transform(features_df)
+            performance_score = model.model.predict(features_scaled)[0]
             
             # Calculate market value estimate (simplified formula)
             # Based on age, position, and performance
@@ -615,10 +817,7 @@ if __name__ == '__main__':
     print("\n🚀 http://localhost:8080")
     print("=" * 80)
     
-    # Load Premier League matches
-    load_premier_league_matches_data()
-    
-    # Load prediction model
-    load_prediction_model()
+    # Load player data + model and start watching the files for changes
+    data_store.start()
     
     app.run(debug=True, host='0.0.0.0', port=8080)
@@ -0,0 +1,65 @@
+"""
+Benchmark: cold-start cost of importing app.py
+Runs `python -X importtime -c "import app"` in fresh interpreters, reports
+the slowest imports and checks the result against a time budget and a
+list of heavy modules that importing app must not pull in.
+
+Run: python benchmarks/bench_import.py [--budget-ms 500] [--repeat 5]
+Exits with status 1 when the budget is exceeded.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Deferred until first use (or preload()); seeing one here is a regression
+HEAVY_MODULES = ['pandas', 'numpy', 'sklearn', 'scipy', 'joblib', 'requests']
+
+
+def import_times(module: str):
+    """{module: (self us, cumulative us)} for one cold import"""
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+                            cwd=ROOT, capture_output=True, text=True, check=True)
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        times[name.strip()] = (int(self_us), int(cumulative_us))
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Import-time budget for app.py')
+    parser.add_argument('--module', default='app')
+    parser.add_argument('--budget-ms', type=float, default=500)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--top', type=int, default=10)
+    args = parser.parse_args()
+
+    runs = [import_times(args.module) for _ in range(args.repeat)]
+    best = min(runs, key=lambda times: times[args.module][1])
+    total_ms = best[args.module][1] / 1000
+
+    print("=" * 80)
+    print(f"⚽ Import time of '{args.module}' (best of {args.repeat} cold starts)")
+    print("=" * 80)
+    print(f"\n{'module':<50} {'self ms':>10} {'cumulative ms':>14}")
+    slowest = sorted(best.items(), key=lambda item: item[1][0], reverse=True)[:args.top]
+    for name, (self_us, cumulative_us) in slowest:
+        print(f"{name:<50} {self_us / 1000:10.1f} {cumulative_us / 1000:14.1f}")
+
+    heavy = [name for name in HEAVY_MODULES if name in best]
+    print(f"\nTotal: {total_ms:.1f} ms (budget {args.budget_ms:.0f} ms)")
+    if heavy:
+        print(f"❌ Heavy modules imported eagerly: {', '.join(heavy)}")
+    if total_ms > args.budget_ms or heavy:
+        sys.exit(1)
+    print("✅ Within budget")
+
+
+if __name__ == "__main__":
+    main()
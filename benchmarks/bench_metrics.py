@@ -0,0 +1,72 @@
+"""
+Benchmark: per-request cost of the /metrics instrumentation
+Times a trivial Flask route through the test client with and without
+RequestMetrics attached, plus the cost of one observe() call and of
+rendering /metrics.
+
+Run: python benchmarks/bench_metrics.py [n_requests]
+"""
+
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from flask import Flask
+
+import config
+from metrics import RequestMetrics
+
+
+def make_app(instrumented: bool):
+    app = Flask(__name__)
+    metrics = RequestMetrics(**config.METRICS_CONFIG)
+    if instrumented:
+        metrics.init_app(app)
+
+    @app.route('/ping/<name>')
+    def ping(name):
+        return name
+
+    return app, metrics
+
+
+def per_request(app, n: int, repeat: int = 5) -> float:
+    client = app.test_client()
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for i in range(n):
+            client.get(f'/ping/{i % 10}')
+        best = min(best, (time.perf_counter() - start) / n)
+    return best
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    plain, _ = make_app(False)
+    instrumented, metrics = make_app(True)
+
+    print("=" * 80)
+    print(f"⚽ Metrics overhead ({n} requests, best of 5)")
+    print("=" * 80)
+    baseline = per_request(plain, n)
+    timed = per_request(instrumented, n)
+    print(f"\n   {'plain route':<28} {baseline * 1e6:8.1f} us/request")
+    print(f"   {'with RequestMetrics':<28} {timed * 1e6:8.1f} us/request"
+          f"   overhead: {(timed - baseline) * 1e6:6.1f} us ({timed / baseline - 1:+.1%})")
+
+    start = time.perf_counter()
+    for i in range(100000):
+        metrics.observe('/ping/<name>', 'GET', 200, 0.002, 512)
+    print(f"   {'observe() alone':<28} {(time.perf_counter() - start) / 100000 * 1e6:8.2f} us/call")
+
+    start = time.perf_counter()
+    body = metrics.render()
+    print(f"   {'render /metrics':<28} {(time.perf_counter() - start) * 1e3:8.2f} ms ({len(body)} bytes)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,341 @@
+"""
+Benchmark suite: every Flask route and the FootballJSONLoader methods
+Builds a synthetic dataset (player CSV, trained model, league JSON for
+several leagues and seasons), serves the league JSON from the local
+OpenFootball stand-in and times each case, reporting ops/sec and
+p50/p95/p99 latency. Results are saved as JSON; --compare prints the
+change against an earlier run.
+
+Sizes:
+    small   563 players,   1 league  x  1 season
+    medium  2,252 players, 4 leagues x  5 seasons
+    large   9,008 players, 10 leagues x 15 seasons
+    production  9,008 players, every configured league x season, with the
+                second tiers missing their oldest seasons (the server 404s)
+
+Run: python benchmarks/bench_routes.py [--size small] [--filter h2h] [--compare old.json]
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Callable, Dict, List, Optional
+from urllib.parse import quote
+
+import numpy as np
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+
+import config
+from data_store import DataStore
+from football_json_loader import FootballJSONLoader
+from http_cache import DiskHTTPCache
+from model import PlayerPerformanceModel
+from openfootball_stub import StubOpenFootballServer
+
+SIZES = {
+    'small': {'player_copies': 1, 'leagues': 1, 'seasons': 1},
+    'medium': {'player_copies': 4, 'leagues': 4, 'seasons': 5},
+    'large': {'player_copies': 16, 'leagues': 10, 'seasons': 15},
+    # Mirrors config.LEAGUES x config.SEASONS, more than the league cache holds
+    'production': {'player_copies': 16, 'leagues': len(config.LEAGUES), 'seasons': len(config.SEASONS),
+                   'missing_seasons': 3},
+}
+
+RESULTS_DIR = os.path.join(ROOT, 'benchmarks', 'results')
+LEAGUE = 'Premier League'
+SEASON = '2024-25'
+TEAM1, TEAM2 = 'Arsenal FC', 'Chelsea FC'
+PLAYER = 'Erling Haaland'
+
+
+# -- synthetic data ----------------------------------------------------
+
+def synthetic_players(path: str, copies: int, seed: int = 42):
+    """player_data.csv repeated `copies` times (extra copies get renamed players and jittered stats)"""
+    df = pd.read_csv(os.path.join(ROOT, config.DATA_CONFIG['data_file']))
+    rng = np.random.default_rng(seed)
+    frames = [df]
+    for k in range(1, copies):
+        copy = df.copy()
+        copy['player_name'] = copy['player_name'] + f' {k}'
+        copy['full_name'] = copy['full_name'] + f' {k}'
+        for column in config.FEATURE_COLUMNS:
+            copy[column] = (copy[column] * rng.uniform(0.8, 1.2, len(copy))).round(1)
+        frames.append(copy)
+    pd.concat(frames, ignore_index=True).to_csv(path, index=False)
+
+
+def train_model(data_path: str, model_path: str) -> PlayerPerformanceModel:
+    model = PlayerPerformanceModel()
+    model.train(pd.read_csv(data_path))
+    model.save_model(model_path)
+    return model
+
+
+def synthetic_league_files(n_leagues: int, seasons: List[str], missing_seasons: int = 0,
+                           seed: int = 42) -> Dict[str, bytes]:
+    """
+    football.json bodies for each league/season, built from the recorded
+    Premier League fixture list with random scores
+
+    The newest season keeps its last 10% of fixtures unplayed. Teams are
+    renamed per league so leagues do not share teams. Second-tier leagues
+    have no file for their oldest `missing_seasons` seasons.
+    """
+    with open(os.path.join(ROOT, 'premier_league_2024_25_matches.json')) as f:
+        fixtures = json.load(f)['matches']
+    rng = np.random.default_rng(seed)
+    files = {}
+    for league_name, info in list(config.LEAGUES.items())[:n_leagues]:
+        suffix = '' if league_name == LEAGUE else f" ({info['code']})"
+        for season in seasons[missing_seasons if info['code'].endswith('.2') else 0:]:
+            shift = int(season[:4]) - 2024
+            played = len(fixtures) if season != seasons[-1] else int(len(fixtures) * 0.9)
+            goals = rng.poisson((1.5, 1.2), (len(fixtures), 2))
+            matches = []
+            for i, m in enumerate(fixtures):
+                match = {'round': m['round'], 'date': f"{int(m['date'][:4]) + shift}{m['date'][4:]}",
+                         'time': m.get('time'), 'team1': m['team1'] + suffix, 'team2': m['team2'] + suffix}
+                if i < played:
+                    match['score'] = {'ft': goals[i].tolist()}
+                matches.append(match)
+            body = {'name': f"{info['name']} {season}", 'matches': matches}
+            files[f"/{season}/{info['code']}.json"] = json.dumps(body).encode()
+    return files
+
+
+# -- timing ------------------------------------------------------------
+
+def measure(func: Callable, setup: Optional[Callable] = None, min_time: float = 0.5,
+            max_ops: int = 2000, warmup: int = 2) -> Dict:
+    """Run func repeatedly (setup untimed before each call) and summarize latencies"""
+    for _ in range(warmup):
+        if setup:
+            setup()
+        func()
+    latencies = []
+    total = 0.0
+    while total < min_time and len(latencies) < max_ops:
+        if setup:
+            setup()
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        latencies.append(elapsed)
+        total += elapsed
+    ms = np.array(latencies) * 1000
+    return {
+        'ops': len(latencies),
+        'ops_per_sec': len(latencies) / total if total else 0.0,
+        'mean_ms': float(ms.mean()),
+        'p50_ms': float(np.percentile(ms, 50)),
+        'p95_ms': float(np.percentile(ms, 95)),
+        'p99_ms': float(np.percentile(ms, 99)),
+    }
+
+
+# -- cases -------------------------------------------------------------
+
+def route_cases(seasons: List[str]) -> List[tuple]:
+    """
+    (name, method, url, kwargs, uncached) for every route in app.py
+
+    uncached cases clear the response cache before each call, so they time
+    the work behind a response-cached route rather than the cache hit.
+    """
+    league = quote(LEAGUE)
+    since = f'league={league}&since={seasons[0]}'
+    return [
+        ('GET /', 'GET', '/', {}, False),
+        ('GET /players', 'GET', '/players', {}, False),
+        ('GET /api/players', 'GET', '/api/players', {}, False),
+        ('GET /api/players/search', 'GET', '/api/players/search?q=sa', {}, False),
+        ('GET /player/<name>', 'GET', f'/player/{quote(PLAYER)}', {}, False),
+        ('GET /api/player/<name>', 'GET', f'/api/player/{quote(PLAYER)}', {}, True),
+        ('GET /api/player/<name> (cached)', 'GET', f'/api/player/{quote(PLAYER)}', {}, False),
+        ('GET /api/heatmap/<name>', 'GET', f'/api/heatmap/{quote(PLAYER)}', {}, False),
+        ('POST /api/predict', 'POST', '/api/predict', {'json': {'goals': 1, 'assists': 1}}, False),
+        ('GET /api/feature_importance', 'GET', '/api/feature_importance', {}, True),
+        ('GET /about', 'GET', '/about', {}, False),
+        ('GET /leagues', 'GET', '/leagues', {}, False),
+        ('GET /live-scores', 'GET', '/live-scores', {}, False),
+        ('GET /api/league/table', 'GET', f'/api/league/table/{league}', {}, True),
+        ('GET /api/league/table (cached)', 'GET', f'/api/league/table/{league}', {}, False),
+        ('GET /api/league/table?as_of', 'GET', f'/api/league/table/{league}?as_of=Matchday%2020', {}, True),
+        ('GET /api/league/table?include_form', 'GET', f'/api/league/table/{league}?include_form=true', {}, True),
+        ('GET /api/league/matches', 'GET', f'/api/league/matches/{league}', {}, True),
+        ('GET /api/league/matches?format=columns', 'GET', f'/api/league/matches/{league}?format=columns', {}, True),
+        ('GET /api/league/matches?team&limit', 'GET', f'/api/league/matches/{league}?team={quote(TEAM1)}&limit=10', {}, True),
+        ('GET /api/league/fixtures', 'GET', f'/api/league/fixtures/{league}', {}, False),
+        ('GET /api/team/form', 'GET', f'/api/team/form/{league}/{quote(TEAM1)}', {}, False),
+        ('GET /api/league/form', 'GET', f'/api/league/form/{league}', {}, False),
+        ('GET /api/team/position-history', 'GET', f'/api/team/position-history/{league}/{quote(TEAM1)}', {}, False),
+        ('GET /api/h2h', 'GET', f'/api/h2h/{quote(TEAM1)}/{quote(TEAM2)}?{since}', {}, False),
+        ('GET /api/team/history', 'GET', f'/api/team/history/{quote(TEAM1)}?{since}', {}, False),
+        ('GET /api/h2h (all leagues/seasons)', 'GET', f'/api/h2h/{quote(TEAM1)}/{quote(TEAM2)}', {}, False),
+        ('GET /api/team/history (all leagues/seasons)', 'GET', f'/api/team/history/{quote(TEAM1)}', {}, False),
+        ('GET /api/stream/scores (snapshot)', 'STREAM', f'/api/stream/scores?league={league}&season={SEASON}', {}, False),
+        ('GET /api/leagues', 'GET', '/api/leagues', {}, True),
+        ('GET /metrics', 'GET', '/metrics', {}, False),
+        ('GET /debug/profiles', 'GET', '/debug/profiles', {'headers': {'X-Profile': 'bench'}}, False),
+        ('GET /player-prediction', 'GET', '/player-prediction', {}, False),
+        ('POST /player-prediction', 'POST', '/player-prediction',
+         {'data': {'age': 26, 'position': 'FW', 'minutes_played': 90, 'goals': 1, 'assists': 0, 'shots': 4,
+                   'shots_on_target': 2, 'passes': 30, 'pass_accuracy': 80, 'tackles': 1}}, False),
+    ]
+
+
+def loader_cases(loader: FootballJSONLoader, http_cache: DiskHTTPCache, base_url: str,
+                 league_names: List[str], seasons: List[str]) -> List[tuple]:
+    """(name, func, setup) for the loader's public methods"""
+    def fresh_loader():
+        fresh = FootballJSONLoader(http_cache=http_cache, mirror_dir=None)
+        fresh.BASE_URL = base_url
+        return fresh
+
+    cold = {}
+    cold_history = {}
+    return [
+        ('get_team_statistics (cold: parse + compute)',
+         lambda: cold['loader'].get_team_statistics(LEAGUE, SEASON),
+         lambda: cold.update(loader=fresh_loader())),
+        ('get_league_matches', lambda: loader.get_league_matches(LEAGUE, SEASON), None),
+        ('get_team_statistics', lambda: loader.get_team_statistics(LEAGUE, SEASON), None),
+        ('get_team_statistics_as_of', lambda: loader.get_team_statistics_as_of(LEAGUE, 'Matchday 20', SEASON), None),
+        ('get_position_history', lambda: loader.get_position_history(TEAM1, LEAGUE, SEASON), None),
+        ('get_team_form', lambda: loader.get_team_form(TEAM1, LEAGUE, SEASON, 5), None),
+        ('get_league_form', lambda: loader.get_league_form(LEAGUE, SEASON, 5), None),
+        ('get_upcoming_fixtures', lambda: loader.get_upcoming_fixtures(LEAGUE, SEASON), None),
+        ('get_matches_page', lambda: loader.get_matches_page(LEAGUE, SEASON, limit=50, team=TEAM1), None),
+        ('query_matches (all loaded)', lambda: loader.query_matches(), None),
+        ('load_history (warm)', lambda: loader.load_history(league_names, seasons), None),
+        ('get_head_to_head', lambda: loader.get_head_to_head(TEAM1, TEAM2, LEAGUE, seasons[0]), None),
+        ('get_team_history', lambda: loader.get_team_history(TEAM1, LEAGUE, seasons[0]), None),
+        ('get_head_to_head (all leagues/seasons)', lambda: loader.get_head_to_head(TEAM1, TEAM2), None),
+        ('get_team_history (all leagues/seasons)', lambda: loader.get_team_history(TEAM1), None),
+        ('refresh_history (warm)', lambda: loader.refresh_history(), None),
+        ('refresh_history (cold: build)',
+         lambda: cold_history['loader'].refresh_history(),
+         lambda: cold_history.update(loader=fresh_loader())),
+    ]
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Route and loader benchmark suite')
+    parser.add_argument('--size', choices=SIZES, default='small')
+    parser.add_argument('--filter', help='Only cases whose name contains this text')
+    parser.add_argument('--min-time', type=float, default=0.5, help='Seconds of timed calls per case')
+    parser.add_argument('--output', help='Results JSON (default: benchmarks/results/routes-<size>-<time>.json)')
+    parser.add_argument('--compare', help='Earlier results JSON to compare against')
+    args = parser.parse_args()
+
+    size = SIZES[args.size]
+    seasons = config.SEASONS[-size['seasons']:]
+    workdir = tempfile.mkdtemp(prefix='bench_routes_')
+    data_path = os.path.join(workdir, 'players.csv')
+    model_path = os.path.join(workdir, 'model.pkl')
+
+    print("=" * 80)
+    print(f"⚽ Route benchmark ({args.size}: {size['leagues']} leagues x {size['seasons']} seasons, "
+          f"players x{size['player_copies']})")
+    print("=" * 80)
+    synthetic_players(data_path, size['player_copies'])
+    train_model(data_path, model_path)
+    files = synthetic_league_files(size['leagues'], seasons, size.get('missing_seasons', 0))
+
+    import app as app_module
+
+    results = []
+    with StubOpenFootballServer(files) as stub:
+        http_cache = DiskHTTPCache(os.path.join(workdir, 'http'), max_age=3600)
+        loader = FootballJSONLoader(http_cache=http_cache, mirror_dir=None)
+        loader.BASE_URL = stub.base_url
+        league_names = list(config.LEAGUES)[:size['leagues']]
+        with contextlib.redirect_stdout(open(os.devnull, 'w')):
+            loader.refresh_history()  # Requests never build it (they answer 503 until it exists)
+
+        app_module.football_loader = loader
+        app_module.data_store = DataStore(data_path, model_path, poll_interval=3600)
+        app_module.profiler.token = 'bench'  # Makes /debug/profiles answer (no requests are profiled)
+        app_module.response_cache.clear()
+        client = app_module.app.test_client()
+
+        def request_once(method, url, kwargs):
+            if method == 'STREAM':
+                response = client.get(url)
+                next(iter(response.response))  # The snapshot event
+                response.close()
+                return 200
+            response = client.open(url, method=method, **kwargs)
+            response.get_data()
+            return response.status_code
+
+        print(f"\n{'case':<48} {'ops/s':>9} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}")
+        cases = [('route', name, (lambda m=method, u=url, k=kwargs: request_once(m, u, k)),
+                  app_module.response_cache.clear if uncached else None)
+                 for name, method, url, kwargs, uncached in route_cases(seasons)]
+        cases += [('loader', name, func, setup)
+                  for name, func, setup in loader_cases(loader, http_cache, stub.base_url, league_names, seasons)]
+        for kind, name, func, setup in cases:
+            if args.filter and args.filter not in name:
+                continue
+            # The app and loader log to stdout; keep the report readable
+            with contextlib.redirect_stdout(open(os.devnull, 'w')):
+                status = func() if kind == 'route' else None
+                result = measure(func, setup, min_time=args.min_time)
+            if status is not None and status >= 400:
+                print(f"⚠️  {name} returned {status}")
+            result.update(kind=kind, name=name)
+            results.append(result)
+            print(f"{name:<48} {result['ops_per_sec']:9.1f} {result['p50_ms']:8.2f} "
+                  f"{result['p95_ms']:8.2f} {result['p99_ms']:8.2f}")
+        app_module.live_scores_hub.stop()
+
+    report = {
+        'size': args.size,
+        'dataset': size,
+        'matches_indexed': len(loader.match_store),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'commit': git_commit(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpus': os.cpu_count(),
+        'results': results,
+    }
+    output = args.output or os.path.join(RESULTS_DIR, f"routes-{args.size}-{time.strftime('%Y%m%d-%H%M%S')}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"\n💾 Saved {len(results)} results to {output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            previous = {r['name']: r for r in json.load(f)['results']}
+        print(f"\n{'case':<48} {'before p50':>11} {'after p50':>10} {'change':>8}")
+        for result in results:
+            old = previous.get(result['name'])
+            if old:
+                change = result['p50_ms'] / old['p50_ms'] - 1 if old['p50_ms'] else 0.0
+                print(f"{result['name']:<48} {old['p50_ms']:11.2f} {result['p50_ms']:10.2f} {change:+8.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Benchmark: column-wise JSON serialization vs to_dict('records') + jsonify
+Times building the /api/league/matches payload for one season (380
+matches) and for a multi-season batch, and compares payload sizes.
+
+Run: python benchmarks/bench_serialization.py [n_seasons]
+"""
+
+import json
+import os
+import sys
+import time
+
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+
+from flask import Flask, jsonify
+
+import config
+from fast_json import frame_json, json_response
+from football_json_loader import FootballJSONLoader
+
+
+def season_frames(n_seasons: int):
+    """The recorded Premier League season relabelled as n seasons"""
+    with open('premier_league_2024_25_matches.json') as f:
+        data = json.load(f)
+    loader = FootballJSONLoader.__new__(FootballJSONLoader)
+    return [loader._parse_matches('Premier League', f"{2010 + i}-{(11 + i) % 100:02d}", data)
+            for i in range(n_seasons)]
+
+
+def best_of(func, repeat: int = 7) -> float:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main():
+    n_seasons = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    frames = season_frames(n_seasons)
+    cases = [('1 season', frames[0]), (f'{n_seasons} seasons', pd.concat(frames, ignore_index=True))]
+    app = Flask(__name__)
+
+    def legacy(df):
+        records = df.astype(object).where(df.notna(), None).to_dict('records')
+        return jsonify({'league': 'Premier League', 'total_matches': len(df), 'matches': records}).get_data()
+
+    def fast(df, orient):
+        return json_response({'league': 'Premier League', 'total_matches': len(df)},
+                             frames={'matches': df}, orient=orient).get_data()
+
+    print("=" * 80)
+    print(f"⚽ Serialization benchmark (serializer: {config.JSON_CONFIG['serializer']})")
+    print("=" * 80)
+    with app.app_context():
+        for label, df in cases:
+            assert json.loads(fast(df, 'records'))['matches'] == json.loads(legacy(df))['matches']
+            print(f"\n{label} ({len(df)} matches)")
+            baseline = best_of(lambda: legacy(df))
+            print(f"   {'to_dict + jsonify':<22} {baseline * 1000:8.2f} ms   {len(legacy(df)) / 1024:8.1f} KB")
+            for orient in ('records', 'columns'):
+                elapsed = best_of(lambda: fast(df, orient))
+                size = len(fast(df, orient))
+                print(f"   {'fast_json ' + orient:<22} {elapsed * 1000:8.2f} ms   {size / 1024:8.1f} KB"
+                      f"   speedup: {baseline / elapsed:5.1f}x")
+            frame_only = best_of(lambda: frame_json(df, 'columns'))
+            print(f"   {'frame_json columns':<22} {frame_only * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Benchmark: columnar standings engine vs the original iterrows loop
+Builds 12 synthetic seasons from the recorded Premier League fixtures
+(random scores) and times both implementations on each season and on
+the whole multi-season batch.
+
+Run: python benchmarks/bench_standings.py [n_seasons]
+"""
+
+import json
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+from pandas.testing import assert_frame_equal
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from standings import compute_standings
+from test_standings import legacy_standings
+
+
+def synthetic_seasons(n_seasons: int, seed: int = 42):
+    """One matches DataFrame per season, reusing the 2024-25 fixture list"""
+    with open(os.path.join(ROOT, 'premier_league_2024_25_matches.json')) as f:
+        fixtures = json.load(f)['matches']
+    rng = np.random.default_rng(seed)
+
+    seasons = []
+    for i in range(n_seasons):
+        df = pd.DataFrame({
+            'date': [m['date'] for m in fixtures],
+            'round': [m['round'] for m in fixtures],
+            'team1': [m['team1'] for m in fixtures],
+            'team2': [m['team2'] for m in fixtures],
+            'score1': rng.poisson(1.5, len(fixtures)),
+            'score2': rng.poisson(1.2, len(fixtures)),
+        })
+        df['season'] = f"{2010 + i}-{(11 + i) % 100:02d}"
+        seasons.append(df)
+    return seasons
+
+
+def best_of(func, repeat: int = 5) -> float:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main():
+    n_seasons = int(sys.argv[1]) if len(sys.argv) > 1 else 12
+    seasons = synthetic_seasons(n_seasons)
+    batch = pd.concat(seasons, ignore_index=True)
+
+    for df in seasons:
+        assert_frame_equal(compute_standings(df, 'Premier League', 'x'),
+                           legacy_standings(df, 'Premier League', 'x'))
+
+    print("=" * 80)
+    print(f"⚽ Standings benchmark: {n_seasons} seasons, {len(batch)} matches")
+    print("=" * 80)
+
+    cases = [
+        ('per season', lambda impl: [impl(df, 'Premier League', 'x') for df in seasons]),
+        ('one batch', lambda impl: impl(batch, 'Premier League', 'all')),
+    ]
+    for label, run in cases:
+        legacy = best_of(lambda: run(legacy_standings), repeat=3)
+        columnar = best_of(lambda: run(compute_standings))
+        print(f"{label:<12} iterrows: {legacy * 1000:8.1f} ms   "
+              f"columnar: {columnar * 1000:7.2f} ms   speedup: {legacy / columnar:6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
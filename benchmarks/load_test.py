@@ -0,0 +1,161 @@
+"""
+Load test: throughput of the preforking server (serve.py) by worker count
+Starts the server with 1, 2, 4, ... workers, drives it from several client
+processes and reports requests/s, latency percentiles and how much of each
+worker's memory is shared with the master (copy-on-write pages from the
+preload). The server closes the connection after every response
+(Connection: close), so each request opens a new one and includes the
+TCP connect in its latency.
+
+The request mix covers index lookups computed per request (/api/h2h,
+/api/team/history) and routes answered from the response cache. Both are
+CPU-bound in Python, where extra processes (not extra threads) add
+throughput.
+
+Run: python benchmarks/load_test.py [--workers 1 2 4] [--duration 10] [--clients 8]
+"""
+
+import argparse
+import http.client
+import multiprocessing
+import os
+import signal
+import subprocess
+import sys
+import time
+from urllib.parse import quote
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PATHS = [
+    # Scoped to the preloaded season so no request waits on a download
+    '/api/h2h/' + quote('Arsenal FC') + '/' + quote('Chelsea FC') + '?league=Premier%20League&since=2024-25',
+    '/api/team/history/' + quote('Liverpool FC') + '?league=Premier%20League&since=2024-25',
+    '/api/league/table/' + quote('Premier League'),
+    '/api/league/matches/' + quote('Premier League') + '?limit=100',
+    '/api/player/' + quote('Erling Haaland'),
+]
+
+
+def client(port: int, duration: float, results):
+    """Send requests round-robin over PATHS (http.client reconnects after each Connection: close)"""
+    conn = http.client.HTTPConnection('127.0.0.1', port, timeout=30)
+    latencies, errors = [], 0
+    deadline = time.perf_counter() + duration
+    i = 0
+    while time.perf_counter() < deadline:
+        start = time.perf_counter()
+        try:
+            conn.request('GET', PATHS[i % len(PATHS)])
+            response = conn.getresponse()
+            response.read()
+            if response.status >= 500:
+                errors += 1
+        except (OSError, http.client.HTTPException):
+            errors += 1
+            conn.close()
+            conn = http.client.HTTPConnection('127.0.0.1', port, timeout=30)
+        latencies.append(time.perf_counter() - start)
+        i += 1
+    conn.close()
+    results.put((latencies, errors))
+
+
+def wait_until_ready(port: int, timeout: float = 120):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            conn = http.client.HTTPConnection('127.0.0.1', port, timeout=2)
+            conn.request('GET', '/api/leagues')
+            conn.getresponse().read()
+            conn.close()
+            return
+        except OSError:
+            time.sleep(0.5)
+    raise RuntimeError(f"Server on port {port} did not start within {timeout}s")
+
+
+def worker_memory(master_pid: int):
+    """(rss MB, shared MB) per worker process, from /proc/<pid>/smaps_rollup"""
+    try:
+        with open(f'/proc/{master_pid}/task/{master_pid}/children') as f:
+            pids = [int(pid) for pid in f.read().split()]
+    except OSError:
+        return []
+    usage = []
+    for pid in pids:
+        try:
+            with open(f'/proc/{pid}/smaps_rollup') as f:
+                fields = {line.split(':')[0]: int(line.split()[1]) for line in f if line.endswith('kB\n')}
+        except OSError:
+            continue
+        shared = fields.get('Shared_Clean', 0) + fields.get('Shared_Dirty', 0)
+        usage.append((fields.get('Rss', 0) / 1024, shared / 1024))
+    return usage
+
+
+def run(workers: int, threads: int, clients: int, duration: float, port: int):
+    server = subprocess.Popen(
+        [sys.executable, 'serve.py', '--bind', f'127.0.0.1:{port}',
+         '--workers', str(workers), '--threads', str(threads)],
+        cwd=ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        wait_until_ready(port)
+        results = multiprocessing.Queue()
+        procs = [multiprocessing.Process(target=client, args=(port, duration, results))
+                 for _ in range(clients)]
+        for proc in procs:
+            proc.start()
+        gathered = [results.get() for _ in procs]
+        for proc in procs:
+            proc.join()
+        memory = worker_memory(server.pid)
+    finally:
+        server.send_signal(signal.SIGTERM)
+        server.wait(timeout=30)
+
+    latencies = np.array([t for lat, _ in gathered for t in lat]) * 1000
+    errors = sum(err for _, err in gathered)
+    return {
+        'requests': len(latencies),
+        'errors': errors,
+        'rps': len(latencies) / duration,
+        'p50': float(np.percentile(latencies, 50)) if len(latencies) else 0.0,
+        'p99': float(np.percentile(latencies, 99)) if len(latencies) else 0.0,
+        'memory': memory,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Load test the preforking server')
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4])
+    parser.add_argument('--threads', type=int, default=8)
+    # Clients past the request threads queue (up to SERVER_CONFIG max_pending, then 503s count as errors)
+    parser.add_argument('--clients', type=int, default=8)
+    parser.add_argument('--duration', type=float, default=10)
+    parser.add_argument('--port', type=int, default=18090)
+    args = parser.parse_args()
+
+    print("=" * 80)
+    print(f"⚽ Load test: {args.clients} clients x {args.duration:.0f}s per run, "
+          f"{args.threads} threads/worker, {os.cpu_count()} CPUs")
+    print("=" * 80)
+    if (os.cpu_count() or 1) < max(args.workers):
+        print(f"⚠️  Only {os.cpu_count()} CPU(s): runs with more workers than CPUs cannot scale")
+
+    baseline = None
+    for workers in args.workers:
+        result = run(workers, args.threads, args.clients, args.duration, args.port)
+        baseline = baseline or result['rps']
+        print(f"\n{workers} worker(s): {result['rps']:8.1f} req/s   "
+              f"p50 {result['p50']:7.2f} ms   p99 {result['p99']:7.2f} ms   "
+              f"errors {result['errors']}   scaling {result['rps'] / baseline:4.2f}x")
+        for rss, shared in result['memory']:
+            print(f"   worker RSS {rss:7.1f} MB, shared with master {shared:7.1f} MB "
+                  f"({shared / max(rss, 1):.0%})")
+
+
+if __name__ == "__main__":
+    main()
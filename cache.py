@@ -0,0 +1,146 @@
+"""
+Bounded In-Memory Cache
+LRU eviction with per-entry TTL, an entry-count and/or byte budget,
+and hit/miss/eviction counters
+"""
+
+import json
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional
+
+
+_MISSING = object()
+
+
+def estimate_size(value: Any) -> int:
+    """
+    Rough size of a cached value in bytes
+
+    JSON-like data (what the loaders cache) is measured by its serialized
+    length; anything else falls back to sys.getsizeof.
+    """
+    try:
+        return len(json.dumps(value, separators=(',', ':')))
+    except (TypeError, ValueError):
+        return sys.getsizeof(value)
+
+
+class TTLCache:
+    """
+    Thread-safe LRU cache whose entries expire after `ttl` seconds
+
+    Args:
+        max_entries: Maximum number of entries (None for no limit)
+        max_bytes: Maximum total estimated size in bytes (None for no limit)
+        ttl: Default time-to-live in seconds (None never expires)
+        sizeof: Function used to estimate an entry's size for max_bytes
+    """
+
+    def __init__(self, max_entries: Optional[int] = 128, max_bytes: Optional[int] = None,
+                 ttl: Optional[float] = 3600, sizeof: Callable[[Any], int] = estimate_size):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.sizeof = sizeof
+
+        self._data = OrderedDict()  # key -> (value, expires_at, size)
+        self._lock = threading.Lock()
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key) -> bool:
+        return self.get(key, _MISSING, count=False) is not _MISSING
+
+    def get(self, key, default=None, count: bool = True):
+        """Return the cached value (marking it most recently used) or default"""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None:
+                value, expires_at, size = entry
+                if expires_at is not None and time.monotonic() >= expires_at:
+                    self._remove(key)
+                    self.expirations += 1
+                else:
+                    self._data.move_to_end(key)
+                    if count:
+                        self.hits += 1
+                    return value
+            if count:
+                self.misses += 1
+            return default
+
+    def set(self, key, value, ttl: Optional[float] = _MISSING, size: Optional[int] = None):
+        """
+        Store a value, evicting least recently used entries to stay in budget
+
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl: Time-to-live in seconds (defaults to the cache's ttl)
+            size: Known size in bytes (skips the sizeof estimate)
+        """
+        ttl = self.ttl if ttl is _MISSING else ttl
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        if self.max_bytes is None:
+            size = 0
+        elif size is None:
+            size = self.sizeof(value)
+
+        with self._lock:
+            if key in self._data:
+                self._remove(key)
+
+            # A single value larger than the whole budget is not cached
+            if self.max_bytes is not None and size > self.max_bytes:
+                return
+
+            self._data[key] = (value, expires_at, size)
+            self.total_bytes += size
+            self._evict()
+
+    def pop(self, key, default=None):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            self._remove(key)
+            return entry[0]
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.total_bytes = 0
+
+    def _remove(self, key):
+        _, _, size = self._data.pop(key)
+        self.total_bytes -= size
+
+    def _evict(self):
+        while self._data and (
+            (self.max_entries is not None and len(self._data) > self.max_entries) or
+            (self.max_bytes is not None and self.total_bytes > self.max_bytes)
+        ):
+            key = next(iter(self._data))
+            self._remove(key)
+            self.evictions += 1
+
+    def stats(self) -> Dict[str, int]:
+        """Counters for monitoring"""
+        with self._lock:
+            return {
+                'entries': len(self._data),
+                'bytes': self.total_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+            }
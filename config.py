@@ -2,6 +2,8 @@
 Configuration file for the Football Statistics ML Project
 """
 
+import os
+
 # Model Configuration
 MODEL_CONFIG = {
     'random_state': 42,
@@ -40,3 +42,133 @@ FIELD_CONFIG = {
     'width': 68,
 }
 
+# Player data / model lifecycle
+DATA_CONFIG = {
+    'data_file': 'player_data.csv',
+    'model_file': 'model.pkl',
+    'reload_interval': 5,  # Seconds between checks for changed files
+}
+
+# In-memory cache for raw OpenFootball league data
+LEAGUE_CACHE_CONFIG = {
+    'max_entries': 64,  # League/season files kept in memory
+    'max_bytes': 64 * 1024 * 1024,  # Approximate JSON size budget
+    'ttl': 15 * 60,  # Seconds before a season is fetched again
+}
+
+# On-disk HTTP cache for OpenFootball files (shared by all worker processes)
+HTTP_CACHE_CONFIG = {
+    'cache_dir': '.cache/openfootball',
+    'max_age': 5 * 60,  # Seconds a stored file is used before revalidating
+    'timeout': 30,
+    'max_per_host': 4,  # Concurrent requests (and pooled keep-alive connections) per host
+}
+
+# Concurrent multi-league fetching
+FETCH_CONFIG = {
+    'max_workers': 8,
+}
+
+# Memoized frames/tables derived from league data (keyed by data version)
+DERIVED_CACHE_CONFIG = {
+    'max_entries': 1024,
+    'ttl': None,  # Entries are replaced when the data version changes
+}
+
+# Every league and season kept in the match store for head-to-head/team history
+HISTORY_CONFIG = {
+    # Build it from the mirror in preload() (shared by forked workers); needs a
+    # `python openfootball_mirror.py` sync first, otherwise it is built in the background
+    'preload': False,
+    'refresh_interval': 60 * 60,  # Seconds before it is re-read in the background
+    'retry_after': 30,  # Retry-After (seconds) on h2h/team history answers while it is being built
+    'missing_ttl': 60 * 60,  # Seconds a season the server answered 404 for is not requested again
+}
+
+# Seasons published by openfootball/football.json
+SEASONS = [f"{year}-{(year + 1) % 100:02d}" for year in range(2010, 2025)]
+
+# Local mirror of openfootball/football.json (see openfootball_mirror.py)
+MIRROR_CONFIG = {
+    'mirror_dir': 'data/openfootball',  # Laid out as <mirror_dir>/<season>/<code>.json
+    'max_workers': 8,
+    'timeout': 30,
+    # Files shipped with the repo, used when the mirror has no copy
+    'bundled_files': {
+        ('2024-25', 'en.1'): 'premier_league_2024_25_matches.json',
+    },
+}
+
+# Server-side cache of serialized API responses (keyed by route, args and data version)
+RESPONSE_CACHE_CONFIG = {
+    'max_entries': 512,
+    'max_bytes': 32 * 1024 * 1024,  # Identity + gzip bodies
+    'ttl': None,  # Entries are replaced when the data version changes
+    'compress': True,
+    'min_compress_size': 1024,  # Bytes; smaller bodies are only stored uncompressed
+    'compress_level': 6,
+}
+
+# /api/league/matches filtering and cursor pagination
+MATCHES_API_CONFIG = {
+    'max_page_size': 500,  # Largest ?limit= accepted
+}
+
+# JSON serializer for large API payloads: 'auto' (orjson when installed), 'orjson' or 'json'
+JSON_CONFIG = {
+    'serializer': 'auto',
+}
+
+# Server-Sent Events push channel for live scores (/api/stream/scores)
+LIVE_STREAM_CONFIG = {
+    'poll_interval': 15,  # Seconds between re-reads (mirror first) of each subscribed league
+    'heartbeat': 15,  # Seconds of silence before a keep-alive comment
+    'queue_size': 100,  # Messages buffered per client before it is dropped
+    'replay_size': 256,  # Recent deltas kept for clients resuming with Last-Event-ID
+    'max_connections': 4,  # Open streams per worker (each holds a request thread); the rest poll
+    'fallback_poll_interval': 30,  # Seconds between polls of clients refused a stream
+}
+
+# Request/cache metrics exposed at /metrics (Prometheus text format)
+METRICS_CONFIG = {
+    'namespace': 'football',
+    'latency_buckets': (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5),  # Seconds
+    'size_buckets': (256, 1024, 4096, 16384, 65536, 262144, 1048576),  # Bytes
+}
+
+# Opt-in cProfile sampling of requests, summaries served at /debug/profiles
+PROFILING_CONFIG = {
+    'enabled': False,  # Profile a random sample of all requests
+    'sample_rate': 0.01,  # Fraction of requests profiled when enabled
+    'header': 'X-Profile',  # Sending this header with the token profiles that request
+    'token': os.environ.get('PROFILE_TOKEN'),  # None: no header profiling and /debug/profiles is off
+    'top_n': 25,  # Hot functions kept per profile
+    'buffer_size': 50,  # Profiles kept (ring buffer)
+    'sort_by': 'cumulative',  # 'cumulative', 'tottime' or 'calls'
+}
+
+# OpenFootball leagues served by the app (name -> football.json code)
+LEAGUES = {
+    'Premier League': {'code': 'en.1', 'name': 'English Premier League'},
+    'Championship': {'code': 'en.2', 'name': 'English Championship'},
+    'Bundesliga': {'code': 'de.1', 'name': 'German Bundesliga'},
+    '2. Bundesliga': {'code': 'de.2', 'name': 'German 2. Bundesliga'},
+    'La Liga': {'code': 'es.1', 'name': 'Spanish La Liga'},
+    'Segunda Division': {'code': 'es.2', 'name': 'Spanish Segunda Division'},
+    'Serie A': {'code': 'it.1', 'name': 'Italian Serie A'},
+    'Serie B': {'code': 'it.2', 'name': 'Italian Serie B'},
+    'Ligue 1': {'code': 'fr.1', 'name': 'French Ligue 1'},
+    'Ligue 2': {'code': 'fr.2', 'name': 'French Ligue 2'},
+}
+
+# Production serving (wsgi.py / serve.py / gunicorn.conf.py)
+SERVER_CONFIG = {
+    'bind': '0.0.0.0:8080',
+    'workers': os.cpu_count() or 1,  # Forked processes sharing the preloaded data
+    'threads': 8,  # Request threads per worker
+    'backlog': 1024,
+    'keepalive_timeout': 5,  # Seconds an idle or stalled connection holds a request thread
+    'max_pending': 64,  # Connections waiting for a thread per worker (more get 503, serve.py)
+    # League/seasons parsed and indexed before forking
+    'preload_leagues': [('Premier League', '2024-25')],
+}
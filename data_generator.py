@@ -2,117 +2,217 @@
 Generate synthetic football player statistics data for demonstration
 """
 
+import argparse
+import os
+import time
+from typing import Dict, Iterator, Optional, Tuple
+
 import pandas as pd
 import numpy as np
-from typing import Tuple
 
-np.random.seed(42)
+
+POSITIONS = ['Forward', 'Midfielder', 'Defender', 'Goalkeeper']
+
+# Per-position distributions: (low, high) are integer ranges with high
+# exclusive, floats are Poisson means. shots_on_target is drawn from
+# [sot_low, shots]; total_passes from [passes_completed, + pass_span).
+POSITION_PROFILES = {
+    'Forward': {'minutes': (60, 95), 'goals': 0.5, 'assists': 0.3, 'shots': (2, 8), 'sot_low': 1,
+                'passes_completed': (20, 50), 'pass_span': 20, 'tackles': (0, 3), 'interceptions': (0, 3),
+                'dribbles_completed': (2, 8)},
+    'Midfielder': {'minutes': (70, 95), 'goals': 0.2, 'assists': 0.4, 'shots': (1, 5), 'sot_low': 0,
+                   'passes_completed': (40, 80), 'pass_span': 25, 'tackles': (2, 6), 'interceptions': (2, 6),
+                   'dribbles_completed': (1, 5)},
+    'Defender': {'minutes': (75, 95), 'goals': 0.05, 'assists': 0.1, 'shots': (0, 2), 'sot_low': 0,
+                 'passes_completed': (30, 60), 'pass_span': 20, 'tackles': (4, 10), 'interceptions': (3, 8),
+                 'dribbles_completed': (0, 2)},
+    'Goalkeeper': {'minutes': (85, 95), 'goals': 0.0, 'assists': 0.0, 'shots': (0, 1), 'sot_low': 0,
+                   'passes_completed': (20, 40), 'pass_span': 15, 'tackles': (0, 1), 'interceptions': (0, 2),
+                   'dribbles_completed': (0, 1)},
+}
+
+STAT_COLUMNS = ['minutes_played', 'goals', 'assists', 'shots', 'shots_on_target', 'passes_completed',
+                'total_passes', 'tackles', 'interceptions', 'dribbles_completed']
+
+
+def _position_stats(rng: np.random.Generator, position: str, n: int) -> Dict[str, np.ndarray]:
+    """One array per stat for n matches played in `position`"""
+    profile = POSITION_PROFILES[position]
+    shots = rng.integers(*profile['shots'], size=n)
+    passes_completed = rng.integers(*profile['passes_completed'], size=n)
+    return {
+        'minutes_played': rng.integers(*profile['minutes'], size=n),
+        'goals': rng.poisson(profile['goals'], n),
+        'assists': rng.poisson(profile['assists'], n),
+        'shots': shots,
+        'shots_on_target': rng.integers(np.minimum(profile['sot_low'], shots), shots + 1),
+        'passes_completed': passes_completed,
+        'total_passes': rng.integers(passes_completed, passes_completed + profile['pass_span']),
+        'tackles': rng.integers(*profile['tackles'], size=n),
+        'interceptions': rng.integers(*profile['interceptions'], size=n),
+        'dribbles_completed': rng.integers(*profile['dribbles_completed'], size=n),
+    }
 
 
-def generate_player_data(n_players: int = 100, n_matches: int = 10) -> pd.DataFrame:
+def _player_rows(rng: np.random.Generator, first_player: int, n_players: int, n_matches: int) -> pd.DataFrame:
+    """Rows for players first_player .. first_player + n_players - 1, built column by column"""
+    player_ids = np.arange(first_player, first_player + n_players)
+    positions = rng.integers(0, len(POSITIONS), n_players)
+
+    n_rows = n_players * n_matches
+    row_positions = np.repeat(positions, n_matches)
+    stats = {column: np.empty(n_rows, dtype=np.int64) for column in STAT_COLUMNS}
+    for code, position in enumerate(POSITIONS):
+        rows = np.flatnonzero(row_positions == code)
+        if len(rows):
+            for column, values in _position_stats(rng, position, len(rows)).items():
+                stats[column][rows] = values
+
+    pass_accuracy = np.where(stats['total_passes'] > 0,
+                             stats['passes_completed'] / np.maximum(stats['total_passes'], 1) * 100, 0.0)
+    performance_rating = (
+        stats['goals'] * 10 +
+        stats['assists'] * 7 +
+        (stats['shots_on_target'] / np.maximum(stats['shots'], 1)) * 5 +
+        pass_accuracy * 0.3 +
+        stats['tackles'] * 2 +
+        stats['interceptions'] * 2 +
+        stats['dribbles_completed'] * 1.5 +
+        rng.normal(0, 5, n_rows)  # Add some noise
+    )
+
+    names = np.char.add('Player_', (player_ids + 1).astype(str))
+    return pd.DataFrame({
+        'player_id': np.repeat(player_ids, n_matches),
+        'player_name': np.repeat(names, n_matches).astype(object),
+        'position': np.asarray(POSITIONS, dtype=object)[row_positions],
+        'match_id': np.tile(np.arange(n_matches), n_players),
+        'minutes_played': stats['minutes_played'],
+        'goals': stats['goals'],
+        'assists': stats['assists'],
+        'shots': stats['shots'],
+        'shots_on_target': stats['shots_on_target'],
+        'passes_completed': stats['passes_completed'],
+        'total_passes': stats['total_passes'],
+        'pass_accuracy': pass_accuracy.round(2),
+        'tackles': stats['tackles'],
+        'interceptions': stats['interceptions'],
+        'dribbles_completed': stats['dribbles_completed'],
+        'performance_rating': np.clip(performance_rating, 0, 100).round(2),  # Clamp between 0-100
+    })
+
+
+def generate_player_chunks(n_players: int, n_matches: int = 38, seed: Optional[int] = 42,
+                           chunk_players: int = 10000) -> Iterator[pd.DataFrame]:
+    """
+    Synthetic player statistics in chunks of whole players
+
+    Args:
+        n_players: Number of players to generate
+        n_matches: Number of matches per player
+        seed: Seed for the numpy Generator (same seed and chunk size: same data)
+        chunk_players: Players per chunk (bounds memory to chunk_players x n_matches rows)
+
+    Yields:
+        DataFrames with the generate_player_data columns
+    """
+    rng = np.random.default_rng(seed)
+    for first in range(0, n_players, chunk_players):
+        yield _player_rows(rng, first, min(chunk_players, n_players - first), n_matches)
+
+
+def generate_player_data(n_players: int = 100, n_matches: int = 10, seed: Optional[int] = 42) -> pd.DataFrame:
     """
     Generate synthetic player statistics data
     
     Args:
         n_players: Number of players to generate
         n_matches: Number of matches per player
+        seed: Seed for the numpy Generator (None: unseeded)
     
     Returns:
         DataFrame with player statistics
     """
-    data = []
-    
-    player_names = [f"Player_{i+1}" for i in range(n_players)]
-    positions = ['Forward', 'Midfielder', 'Defender', 'Goalkeeper']
-    
-    for player_id, player_name in enumerate(player_names):
-        position = np.random.choice(positions)
-        
-        for match in range(n_matches):
-            # Base stats depending on position
-            if position == 'Forward':
-                minutes = np.random.randint(60, 95)
-                goals = np.random.poisson(0.5)
-                assists = np.random.poisson(0.3)
-                shots = np.random.randint(2, 8)
-                shots_on_target = np.random.randint(1, shots + 1)
-                passes_completed = np.random.randint(20, 50)
-                total_passes = np.random.randint(passes_completed, passes_completed + 20)
-                tackles = np.random.randint(0, 3)
-                interceptions = np.random.randint(0, 3)
-                dribbles_completed = np.random.randint(2, 8)
-                
-            elif position == 'Midfielder':
-                minutes = np.random.randint(70, 95)
-                goals = np.random.poisson(0.2)
-                assists = np.random.poisson(0.4)
-                shots = np.random.randint(1, 5)
-                shots_on_target = np.random.randint(0, shots + 1)
-                passes_completed = np.random.randint(40, 80)
-                total_passes = np.random.randint(passes_completed, passes_completed + 25)
-                tackles = np.random.randint(2, 6)
-                interceptions = np.random.randint(2, 6)
-                dribbles_completed = np.random.randint(1, 5)
-                
-            elif position == 'Defender':
-                minutes = np.random.randint(75, 95)
-                goals = np.random.poisson(0.05)
-                assists = np.random.poisson(0.1)
-                shots = np.random.randint(0, 2)
-                shots_on_target = np.random.randint(0, shots + 1)
-                passes_completed = np.random.randint(30, 60)
-                total_passes = np.random.randint(passes_completed, passes_completed + 20)
-                tackles = np.random.randint(4, 10)
-                interceptions = np.random.randint(3, 8)
-                dribbles_completed = np.random.randint(0, 2)
-                
-            else:  # Goalkeeper
-                minutes = np.random.randint(85, 95)
-                goals = 0
-                assists = 0
-                shots = 0
-                shots_on_target = 0
-                passes_completed = np.random.randint(20, 40)
-                total_passes = np.random.randint(passes_completed, passes_completed + 15)
-                tackles = 0
-                interceptions = np.random.randint(0, 2)
-                dribbles_completed = 0
-            
-            pass_accuracy = (passes_completed / total_passes * 100) if total_passes > 0 else 0
-            
-            # Calculate performance rating based on stats
-            performance_rating = (
-                goals * 10 + 
-                assists * 7 + 
-                (shots_on_target / max(shots, 1)) * 5 +
-                pass_accuracy * 0.3 +
-                tackles * 2 +
-                interceptions * 2 +
-                dribbles_completed * 1.5 +
-                np.random.normal(0, 5)  # Add some noise
-            )
-            performance_rating = max(0, min(100, performance_rating))  # Clamp between 0-100
-            
-            data.append({
-                'player_id': player_id,
-                'player_name': player_name,
-                'position': position,
-                'match_id': match,
-                'minutes_played': minutes,
-                'goals': goals,
-                'assists': assists,
-                'shots': shots,
-                'shots_on_target': shots_on_target,
-                'passes_completed': passes_completed,
-                'total_passes': total_passes,
-                'pass_accuracy': round(pass_accuracy, 2),
-                'tackles': tackles,
-                'interceptions': interceptions,
-                'dribbles_completed': dribbles_completed,
-                'performance_rating': round(performance_rating, 2),
-            })
-    
-    return pd.DataFrame(data)
+    rng = np.random.default_rng(seed)
+    return _player_rows(rng, 0, n_players, n_matches)
+
+
+def _csv_field(value: str) -> str:
+    """Quote a CSV field when it needs it"""
+    if any(c in value for c in ',"\n\r'):
+        return '"' + value.replace('"', '""') + '"'
+    return value
+
+
+def _csv_text(df: pd.DataFrame) -> str:
+    """
+    CSV rows (no header) for a chunk, several times faster than to_csv
+
+    Columns are dictionary-encoded so each distinct value is formatted
+    once, then rows are joined in C. Output matches to_csv(index=False).
+    """
+    columns = []
+    for name in df.columns:
+        codes, uniques = pd.factorize(df[name])
+        uniques = np.asarray(uniques)
+        text = np.empty(len(uniques) + 1, dtype=object)
+        if uniques.dtype.kind in 'iuf':
+            text[:-1] = uniques.astype(str)
+        else:
+            text[:-1] = [_csv_field(str(value)) for value in uniques]
+        text[-1] = ''  # Missing values (code -1)
+        columns.append(text[codes].tolist())
+    return '\n'.join(map(','.join, zip(*columns))) + '\n' if len(df) else ''
+
+
+def write_player_data(path: str, n_players: int, n_matches: int = 38, seed: Optional[int] = 42,
+                      chunk_players: int = 10000, file_format: Optional[str] = None) -> int:
+    """
+    Stream synthetic player statistics to a CSV or Parquet file
+
+    Args:
+        path: Output file
+        n_players: Number of players to generate
+        n_matches: Number of matches per player
+        seed: Seed for the numpy Generator
+        chunk_players: Players generated and written at a time
+        file_format: 'csv' or 'parquet' (default: from the file extension)
+
+    Returns:
+        Number of rows written
+    """
+    file_format = file_format or ('parquet' if path.endswith(('.parquet', '.pq')) else 'csv')
+    if file_format not in ('csv', 'parquet'):
+        raise ValueError(f"Unknown file_format '{file_format}' (expected 'csv' or 'parquet')")
+    chunks = generate_player_chunks(n_players, n_matches, seed, chunk_players)
+    rows = 0
+
+    if file_format == 'csv':
+        with open(path, 'w', newline='') as f:
+            for chunk in chunks:
+                if rows == 0:
+                    f.write(','.join(chunk.columns) + '\n')
+                f.write(_csv_text(chunk))
+                rows += len(chunk)
+        return rows
+
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:  # Optional dependency
+        raise RuntimeError("Writing Parquet needs pyarrow (pip install pyarrow)")
+    writer = None
+    try:
+        for chunk in chunks:
+            table = pa.Table.from_pandas(chunk, preserve_index=False)
+            if writer is None:
+                writer = pq.ParquetWriter(path, table.schema)
+            writer.write_table(table)
+            rows += len(chunk)
+    finally:
+        if writer is not None:
+            writer.close()
+    return rows
 
 
 def generate_heatmap_data(player_name: str, n_positions: int = 200) -> Tuple[np.ndarray, np.ndarray]:
@@ -146,11 +246,22 @@ def generate_heatmap_data(player_name: str, n_positions: int = 200) -> Tuple[np.
     return x_positions, y_positions
 
 
-if __name__ == "__main__":
-    # Generate and save sample data
-    df = generate_player_data(n_players=50, n_matches=20)
-    df.to_csv('player_statistics.csv', index=False)
-    print(f"Generated {len(df)} records for {df['player_name'].nunique()} players")
-    print(f"\nSample data:\n{df.head()}")
-    print(f"\nData info:\n{df.describe()}")
+def main():
+    parser = argparse.ArgumentParser(description='Generate synthetic player statistics')
+    parser.add_argument('--players', type=int, default=50)
+    parser.add_argument('--matches', type=int, default=20)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--chunk-players', type=int, default=10000)
+    parser.add_argument('--output', default='player_statistics.csv', help='.csv or .parquet')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    rows = write_player_data(args.output, args.players, args.matches, args.seed, args.chunk_players)
+    elapsed = time.perf_counter() - start
+    size_mb = os.path.getsize(args.output) / 1024 / 1024
+    print(f"✅ Generated {rows:,} records for {args.players:,} players in {elapsed:.1f}s "
+          f"({rows / max(elapsed, 1e-9):,.0f} rows/s, {size_mb:.1f} MB) -> {args.output}")
 
+
+if __name__ == "__main__":
+    main()
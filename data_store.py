@@ -0,0 +1,160 @@
+"""
+Data Lifecycle Layer
+Loads player data and the performance model once per process and
+hot-reloads them in the background when the files change on disk
+"""
+
+import os
+import threading
+from typing import Dict, Optional, Tuple
+
+import pandas as pd
+
+from model import PlayerPerformanceModel
+from player_stats import PlayerStatsTable, build_player_stats
+from name_index import PlayerNameIndex
+from player_search import PlayerSearchIndex
+
+
+class DataSnapshot:
+    """
+    Everything loaded from disk at one point in time.
+
+    Snapshots are never modified after they are built; a reload produces a
+    new snapshot which replaces the old one in a single reference swap, so a
+    request that grabbed a snapshot keeps a consistent view until it finishes.
+    Derived lookup tables are built together with the snapshot.
+    """
+
+    def __init__(self, df: Optional[pd.DataFrame], model: Optional[PlayerPerformanceModel],
+                 signature: Tuple, version: int, ok: bool, message: str,
+                 photos: Optional[Dict[str, str]] = None):
+        self.df = df
+        self.model = model
+        self.player_stats = build_player_stats(df) if df is not None else PlayerStatsTable({})
+        self.name_index = PlayerNameIndex(df, photos)
+        self.search_index = PlayerSearchIndex(self.name_index.canonical_names())
+        self.signature = signature
+        self.version = version
+        self.ok = ok
+        self.message = message
+
+
+class DataStore:
+    """
+    Owns the current DataSnapshot and swaps in a new one when the player data
+    or model file changes (detected by mtime and size)
+    """
+
+    def __init__(self, data_file: str, model_file: str, poll_interval: float = 5.0,
+                 photos: Optional[Dict[str, str]] = None):
+        self.data_file = data_file
+        self.model_file = model_file
+        self.poll_interval = poll_interval
+        self.photos = photos
+        self._snapshot = None
+        self._failed_signature = None
+        self._load_lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._watcher = None
+
+    @property
+    def snapshot(self) -> DataSnapshot:
+        """Current snapshot, loading it on first access"""
+        snapshot = self._snapshot
+        if snapshot is None:
+            with self._load_lock:
+                if self._snapshot is None:
+                    self._snapshot = self._build_snapshot(self._file_signature(), version=1)
+                snapshot = self._snapshot
+        return snapshot
+
+    def _file_signature(self) -> Tuple:
+        """(mtime_ns, size) for each watched file, None for missing files"""
+        signature = []
+        for path in (self.data_file, self.model_file):
+            try:
+                stat = os.stat(path)
+                signature.append((stat.st_mtime_ns, stat.st_size))
+            except OSError:
+                signature.append(None)
+        return tuple(signature)
+
+    def _build_snapshot(self, signature: Tuple, version: int) -> DataSnapshot:
+        """Read the files from disk into a new snapshot"""
+        if not os.path.exists(self.data_file):
+            return DataSnapshot(None, None, signature, version, False,
+                                "Run: python train_model_transfermarkt.py", self.photos)
+
+        df = pd.read_csv(self.data_file)
+        print(f"✅ TRANSFERMARKT DATA: {df['player_name'].nunique()} players")
+        print(f"   Season: 2024-2025 (CURRENT)")
+
+        if not os.path.exists(self.model_file):
+            return DataSnapshot(df, None, signature, version, False,
+                                "Run: python train_model_transfermarkt.py", self.photos)
+
+        model = PlayerPerformanceModel()
+        model.load_model(self.model_file)
+
+        return DataSnapshot(df, model, signature, version, True, "OK", self.photos)
+
+    def reload_if_changed(self) -> bool:
+        """
+        Build and swap in a new snapshot if the watched files changed
+
+        Returns:
+            True if a new snapshot was installed
+        """
+        with self._load_lock:
+            current = self._snapshot
+            signature = self._file_signature()
+            if current is not None and current.signature == signature:
+                return False
+            if signature == self._failed_signature:
+                return False
+
+            version = current.version + 1 if current is not None else 1
+            try:
+                snapshot = self._build_snapshot(signature, version)
+            except Exception as e:
+                print(f"⚠️  Reload failed, keeping previous data: {e}")
+                self._failed_signature = signature
+                return False
+
+            # A writer may still be replacing the file; try again next tick
+            if self._file_signature() != signature:
+                return False
+
+            self._snapshot = snapshot
+            print(f"🔄 Player data reloaded (version {version})")
+            return True
+
+    def start(self):
+        """Load the data (if needed) and start the background file watcher"""
+        # A watcher inherited through fork() is not running in this process
+        if self._watcher is not None and self._watcher.is_alive():
+            return
+        with self._load_lock:
+            if self._watcher is not None and self._watcher.is_alive():
+                return
+            self._stop_event.clear()
+            self._watcher = threading.Thread(target=self._watch, name='data-store-watcher', daemon=True)
+            self._watcher.start()
+        self.snapshot
+
+    def stop(self):
+        """Stop the background file watcher"""
+        watcher = self._watcher
+        if watcher is None:
+            return
+        self._stop_event.set()
+        watcher.join()
+        self._watcher = None
+
+    def _watch(self):
+        while not self._stop_event.wait(self.poll_interval):
+            try:
+                self.reload_if_changed()
+            except Exception as e:
+                print(f"⚠️  Data watcher error: {e}")
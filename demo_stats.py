@@ -29,6 +29,9 @@ def demo_interesting_stats():
     all_tables = {}
     
     print("\n📥 Loading data for all major leagues...")
+    # Fetch every league (and last season's Premier League) in parallel up front
+    loader.fetch_leagues(leagues, '2024-25')
+    loader.fetch_leagues(['Premier League'], '2023-24')
     for league in leagues:
         table = loader.get_team_statistics(league, '2024-25')
         if not table.empty:
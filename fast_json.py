@@ -0,0 +1,141 @@
+"""
+Fast JSON Serialization for API Payloads
+Writes pandas/NumPy columns straight to JSON bytes (one vectorized
+conversion per column, no per-row dicts) and uses orjson when installed
+"""
+
+import datetime
+import json
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+from flask import Response
+
+import config
+
+try:
+    import orjson
+except ImportError:  # Optional dependency
+    orjson = None
+
+
+ORIENTS = ('records', 'columns')
+
+
+def _backend() -> str:
+    choice = config.JSON_CONFIG['serializer']
+    if choice == 'auto':
+        return 'orjson' if orjson is not None else 'json'
+    if choice == 'orjson' and orjson is None:
+        raise RuntimeError("JSON_CONFIG['serializer'] is 'orjson' but orjson is not installed")
+    return choice
+
+
+def _default(value):
+    """Fallback for types the json module does not know"""
+    if isinstance(value, np.datetime64):
+        return None if np.isnat(value) else str(value)
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, (datetime.date, datetime.datetime)):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(value) -> bytes:
+    """Serialize any JSON-like value (NumPy scalars/arrays allowed) to UTF-8 bytes"""
+    if _backend() == 'orjson':
+        return orjson.dumps(value, default=_default,
+                            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(value, default=_default, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def _encode_strings(values: List[str]) -> List[str]:
+    """JSON string literals for a list of str, escaped in one call"""
+    if not values:
+        return []
+    encoded = dumps(values).decode('utf-8')
+    # Quotes inside strings are always escaped, so '","' only ever separates items
+    parts = encoded[2:-2].split('","')
+    if len(parts) != len(values):
+        return [dumps(v).decode('utf-8') for v in values]
+    return ['"' + part + '"' for part in parts]
+
+
+def _encode_values(values: np.ndarray) -> List[str]:
+    """JSON text for an array of distinct, non-missing values"""
+    kind = values.dtype.kind
+    if kind == 'b':
+        return np.where(values, 'true', 'false').tolist()
+    if kind in 'iu':
+        return values.astype(str).tolist()
+    if kind == 'f':
+        return np.where(np.isfinite(values), values.astype(str), 'null').tolist()
+    if all(isinstance(v, str) for v in values):
+        return _encode_strings(values.tolist())
+    return [dumps(v).decode('utf-8') for v in values]
+
+
+def column_fragments(series: pd.Series) -> List[str]:
+    """
+    JSON text for every value of a column, built per column rather than per row
+
+    Columns are dictionary-encoded first, so each distinct value (a team,
+    a round, a score) is serialized once. Missing values (None/NaN/NaT)
+    and non-finite floats become null.
+    """
+    codes, uniques = pd.factorize(series, use_na_sentinel=True)
+    encoded = np.empty(len(uniques) + 1, dtype=object)
+    encoded[:-1] = _encode_values(np.asarray(uniques))
+    encoded[-1] = 'null'  # code -1
+    return encoded[codes].tolist()
+
+
+def frame_json(df: pd.DataFrame, orient: str = 'records') -> bytes:
+    """
+    Serialize a DataFrame
+
+    Args:
+        df: Frame to serialize
+        orient: 'records' ([{col: value}, ...]) or 'columns' ({col: [values]})
+
+    Returns:
+        UTF-8 JSON bytes
+    """
+    if orient not in ORIENTS:
+        raise ValueError(f"Unknown orient '{orient}' (expected one of {', '.join(ORIENTS)})")
+    keys = [dumps(str(column)).decode('utf-8') for column in df.columns]
+    columns = [column_fragments(df[column]) for column in df.columns]
+
+    if orient == 'columns':
+        body = ','.join(f"{key}:[{','.join(fragments)}]" for key, fragments in zip(keys, columns))
+        return ('{' + body + '}').encode('utf-8')
+
+    if not len(df):
+        return b'[]'
+    # One %-template per row instead of a dict per row
+    template = '{' + ','.join(f"{key.replace('%', '%%')}:%s" for key in keys) + '}'
+    rows = ','.join(template % row for row in zip(*columns))
+    return ('[' + rows + ']').encode('utf-8')
+
+
+def json_response(payload: Dict, frames: Optional[Dict[str, pd.DataFrame]] = None,
+                  orient: str = 'records', status: int = 200) -> Response:
+    """
+    Flask JSON response with DataFrames spliced in as pre-serialized values
+
+    Args:
+        payload: Plain JSON-like fields
+        frames: Extra fields whose values are DataFrames (see frame_json)
+        orient: Shape used for the frames
+        status: HTTP status code
+    """
+    body = dumps(payload)
+    if frames:
+        fields = b','.join(dumps(key) + b':' + frame_json(df, orient) for key, df in frames.items())
+        head = body[:-1]
+        body = head + (b',' if len(head) > 1 else b'') + fields + b'}'
+    return Response(body, status=status, mimetype='application/json')
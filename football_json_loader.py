@@ -5,10 +5,26 @@ Provides actual match results, fixtures, and team statistics
 """
 
 import requests
+import numpy as np
 import pandas as pd
-from typing import Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
 from datetime import datetime
+import hashlib
 import json
+import threading
+import time
+
+from cache import TTLCache
+from http_cache import DiskHTTPCache
+from match_store import MatchStore
+from openfootball_mirror import read_mirror
+from standings import IncrementalStandings, SeasonTimeline, compute_form, compute_standings
+import config
+
+
+class HistoryNotReady(RuntimeError):
+    """The multi-season history store has not been built yet (a build is running)"""
 
 
 class FootballJSONLoader:
@@ -19,26 +35,44 @@ class FootballJSONLoader:
     BASE_URL = "https://raw.githubusercontent.com/openfootball/football.json/master"
     
     # Available leagues and their codes
-    LEAGUES = {
-        'Premier League': {'code': 'en.1', 'name': 'English Premier League'},
-        'Championship': {'code': 'en.2', 'name': 'English Championship'},
-        'Bundesliga': {'code': 'de.1', 'name': 'German Bundesliga'},
-        '2. Bundesliga': {'code': 'de.2', 'name': 'German 2. Bundesliga'},
-        'La Liga': {'code': 'es.1', 'name': 'Spanish La Liga'},
-        'Segunda Division': {'code': 'es.2', 'name': 'Spanish Segunda Division'},
-        'Serie A': {'code': 'it.1', 'name': 'Italian Serie A'},
-        'Serie B': {'code': 'it.2', 'name': 'Italian Serie B'},
-        'Ligue 1': {'code': 'fr.1', 'name': 'French Ligue 1'},
-        'Ligue 2': {'code': 'fr.2', 'name': 'French Ligue 2'},
-    }
-    
-    def __init__(self):
-        self.cache = {}
+    LEAGUES = config.LEAGUES
+    
+    def __init__(self, cache: Optional[TTLCache] = None, http_cache: Optional[DiskHTTPCache] = None,
+                 mirror_dir: Optional[str] = config.MIRROR_CONFIG['mirror_dir']):
+        # Local copy of football.json read before the network (None disables local files)
+        self.mirror_dir = mirror_dir
+        # Bounded LRU cache with TTL so memory stays flat and data stays fresh
+        self.cache = cache if cache is not None else TTLCache(**config.LEAGUE_CACHE_CONFIG)
+        # On-disk cache shared by all processes; revalidates with ETag/Last-Modified
+        self.http_cache = http_cache if http_cache is not None else DiskHTTPCache(**config.HTTP_CACHE_CONFIG)
+        # Content hash of the raw data last fetched per league/season
+        self.data_versions = {}
+        # Frames/tables derived from raw data, keyed by (league, season, data version, kind)
+        self.derived_cache = TTLCache(**config.DERIVED_CACHE_CONFIG)
+        # Every loaded league/season in one columnar table (replaced, never mutated)
+        self.match_store = MatchStore.empty()
+        self._store_lock = threading.Lock()
+        # Data version of every (league, season) currently held in the match store
+        self._store_versions = {}
+        # League/seasons the server answered 404 for (not requested again until they expire)
+        self.missing_seasons = TTLCache(max_entries=None, ttl=config.HISTORY_CONFIG['missing_ttl'])
+        # Every league and season for h2h/team history, built off the request path (see history_store)
+        self._history_store = None
+        self._history_versions = {}
+        self._history_loaded_at = None
+        self._history_refreshing = False
+        self._history_lock = threading.Lock()
+        # Live league tables updated result-by-result when a season's data changes
+        self._standings = {}
+        self._standings_lock = threading.Lock()
     
     def fetch_league_data(self, league_code: str, season: str = '2024-25') -> Optional[Dict]:
         """
         Fetch league data for a specific season
         
+        Reads the local mirror first and only goes to the network when the
+        mirror has no copy of the file.
+        
         Args:
             league_code: League code (e.g., 'en.1' for Premier League)
             season: Season string (e.g., '2024-25')
@@ -48,8 +82,44 @@ class FootballJSONLoader:
         """
         cache_key = f"{league_code}_{season}"
         
-        if cache_key in self.cache:
-            return self.cache[cache_key]
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        if self.mirror_dir is not None:
+            body = read_mirror(self.mirror_dir, season, league_code)
+            if body is not None:
+                try:
+                    return self._store(cache_key, body, json.loads(body))
+                except ValueError as e:
+                    print(f"   ⚠️  Ignoring unreadable mirror copy of {league_code} {season}: {e}")
+        
+        body = self._download(league_code, season)
+        if body is None:
+            return None
+        
+        try:
+            data = self._store(cache_key, body, json.loads(body))
+        except ValueError as e:
+            print(f"   ❌ Error: {e}")
+            return None
+        
+        print(f"   ✅ Loaded {len(data.get('matches', []))} matches")
+        return data
+    
+    def _download(self, league_code: str, season: str) -> Optional[bytes]:
+        """
+        Raw league/season file from the network (through the on-disk HTTP cache)
+        
+        A 404 is remembered, so a season that does not exist is not requested
+        again for HISTORY_CONFIG['missing_ttl'] seconds.
+        
+        Returns:
+            Response body, or None if the file is missing or unreachable
+        """
+        cache_key = f"{league_code}_{season}"
+        if cache_key in self.missing_seasons:
+            return None
         
         url = f"{self.BASE_URL}/{season}/{league_code}.json"
         
@@ -57,17 +127,11 @@ class FootballJSONLoader:
             print(f"📥 Fetching {league_code} data for {season}...")
             print(f"   URL: {url}")
             
-            response = requests.get(url, timeout=30)
-            response.raise_for_status()
-            
-            data = response.json()
-            self.cache[cache_key] = data
-            
-            print(f"   ✅ Loaded {len(data.get('matches', []))} matches")
-            return data
+            return self.http_cache.get(url).body
             
         except requests.exceptions.HTTPError as e:
             if e.response.status_code == 404:
+                self.missing_seasons.set(cache_key, True)
                 print(f"   ⚠️  Data not available for {season}")
             else:
                 print(f"   ❌ HTTP Error: {e}")
@@ -76,30 +140,68 @@ class FootballJSONLoader:
             print(f"   ❌ Error: {e}")
             return None
     
-    def get_league_matches(self, league_name: str, season: str = '2024-25') -> pd.DataFrame:
-        """
-        Get all matches for a league as a DataFrame
-        
-        Args:
-            league_name: Name of the league (e.g., 'Premier League')
-            season: Season string
-        
-        Returns:
-            DataFrame with match data
-        """
+    def _read_body(self, league_code: str, season: str, network: bool = True) -> Optional[bytes]:
+        """Raw league/season file from the mirror or the network, bypassing the league cache"""
+        if self.mirror_dir is not None:
+            body = read_mirror(self.mirror_dir, season, league_code)
+            if body is not None:
+                return body
+        return self._download(league_code, season) if network else None
+    
+    def _store(self, cache_key: str, body: bytes, data: Dict) -> Dict:
+        """Keep parsed league data in memory, versioned by the hash of its raw bytes"""
+        # The raw body length stands in for the parsed dict's size (no re-serializing)
+        self.cache.set(cache_key, data, size=len(body))
+        self.data_versions[cache_key] = hashlib.sha1(body).hexdigest()
+        return data
+    
+    def _fetch_versioned(self, league_name: str, season: str) -> Tuple[Optional[Dict], Optional[str]]:
+        """Raw league data plus its version (content hash)"""
         if league_name not in self.LEAGUES:
             raise ValueError(f"League '{league_name}' not supported")
         
         league_code = self.LEAGUES[league_name]['code']
         data = self.fetch_league_data(league_code, season)
+        return data, self.data_versions.get(f"{league_code}_{season}")
+    
+    def data_version(self, league_name: str, season: str = '2024-25') -> Optional[str]:
+        """
+        Version of the raw data currently loaded for a league/season
         
+        Returns:
+            Content hash that changes whenever the underlying JSON changes, or None if unavailable
+        """
+        data, version = self._fetch_versioned(league_name, season)
+        return version if data else None
+    
+    def _derived(self, league_name: str, season: str, kind, build: Callable[[Dict], object]):
+        """
+        Memoize a value derived from a league/season's raw data
+        
+        The key includes the raw data version, so results are reused until the
+        JSON actually changes and never need explicit invalidation.
+        
+        Returns:
+            The derived value, or None if there is no match data
+        """
+        data, version = self._fetch_versioned(league_name, season)
         if not data or 'matches' not in data:
-            return pd.DataFrame()
+            return None
         
+        key = (league_name, season, version, kind)
+        value = self.derived_cache.get(key)
+        if value is None:
+            value = build(data)
+            self.derived_cache.set(key, value)
+        return value
+    
+    def _parse_matches(self, league_name: str, season: str, data: Dict) -> pd.DataFrame:
+        """Flatten the raw JSON match list into a DataFrame"""
         matches = []
         for match in data['matches']:
             match_info = {
                 'date': match.get('date'),
+                'time': match.get('time', ''),
                 'round': match.get('round'),
                 'team1': match.get('team1'),
                 'team2': match.get('team2'),
@@ -126,6 +228,228 @@ class FootballJSONLoader:
         
         return df
     
+    def _index_season(self, league_name: str, season: str, df: pd.DataFrame,
+                      version: Optional[str]) -> pd.DataFrame:
+        """Load a season's matches into the match store and read its frame back from the store"""
+        with self._store_lock:
+            self.match_store = store = self.match_store.with_season(df)
+            self._store_versions[(league_name, season)] = version
+        return store.query(self.LEAGUES[league_name]['name'], season, order='file')
+    
+    def _matches_frame(self, league_name: str, season: str) -> pd.DataFrame:
+        """
+        Memoized matches DataFrame (shared - callers must not modify it)
+        
+        The match store is kept at the same version as the frame returned: a
+        frame memoized for an older version (data that went A -> B -> A) is
+        indexed again, so store queries never see another version's rows.
+        """
+        data, version = self._fetch_versioned(league_name, season)
+        if not data or 'matches' not in data:
+            return pd.DataFrame()
+        
+        key = (league_name, season, version, 'matches')
+        df = self.derived_cache.get(key)
+        if df is None:
+            if self._store_versions.get((league_name, season)) == version:
+                # Already indexed at this version (e.g. by load_history): read it back
+                df = self.match_store.query(self.LEAGUES[league_name]['name'], season, order='file')
+            else:
+                df = self._index_season(league_name, season, self._parse_matches(league_name, season, data),
+                                        version)
+            self.derived_cache.set(key, df)
+        elif self._store_versions.get((league_name, season)) != version:
+            self._index_season(league_name, season, df, version)
+        return df
+    
+    def _read_seasons(self, league_names: Optional[Iterable[str]], seasons: Optional[Iterable[str]],
+                      versions: Dict, max_workers: Optional[int], network: bool = True) -> List[tuple]:
+        """
+        Read and parse many league/season files concurrently
+        
+        Raw files come from the mirror (and, with `network`, the HTTP cache)
+        without going through the league cache, which is far smaller than a
+        full history. Only files whose content hash differs from `versions`
+        are parsed.
+        
+        Returns:
+            [((league_name, season), version, matches DataFrame)] for changed files
+        """
+        league_names = list(self.LEAGUES if league_names is None else league_names)
+        seasons = list(config.SEASONS if seasons is None else seasons)
+        for league_name in league_names:
+            if league_name not in self.LEAGUES:
+                raise ValueError(f"League '{league_name}' not supported")
+        if max_workers is None:
+            max_workers = config.FETCH_CONFIG['max_workers']
+        
+        def fetch(job):
+            league_name, season = job
+            return job, self._read_body(self.LEAGUES[league_name]['code'], season, network)
+        
+        jobs = [(league_name, season) for season in seasons for league_name in league_names]
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(jobs))),
+                                thread_name_prefix='history-fetch') as pool:
+            fetched = list(pool.map(fetch, jobs))
+        
+        pending = []
+        for key, body in fetched:
+            if body is None:
+                continue
+            version = hashlib.sha1(body).hexdigest()
+            if versions.get(key) == version:
+                continue
+            try:
+                data = json.loads(body)
+            except ValueError as e:
+                print(f"   ⚠️  Skipping unreadable {key[0]} {key[1]}: {e}")
+                continue
+            if 'matches' in data:
+                pending.append((key, version, self._parse_matches(key[0], key[1], data)))
+        return pending
+    
+    def load_history(self, league_names: Optional[Iterable[str]] = None,
+                     seasons: Optional[Iterable[str]] = None,
+                     max_workers: Optional[int] = None) -> MatchStore:
+        """
+        Load many leagues/seasons into the match store in one pass
+        
+        Files are read concurrently (see _read_seasons) and the store is
+        rebuilt once for the whole batch; seasons already indexed at their
+        current version are skipped.
+        
+        Args:
+            league_names: Leagues to load (default: all)
+            seasons: Seasons to load (default: config.SEASONS)
+            max_workers: Thread pool size (default: config.FETCH_CONFIG)
+        
+        Returns:
+            The updated MatchStore
+        """
+        pending = self._read_seasons(league_names, seasons, self._store_versions, max_workers)
+        with self._store_lock:
+            self.match_store = store = self.match_store.with_seasons(df for _, _, df in pending)
+            self._store_versions.update((key, version) for key, version, _ in pending)
+        return store
+    
+    def refresh_history(self, network: bool = True) -> MatchStore:
+        """
+        Build (or bring up to date) the history store in the calling thread
+        
+        The history store holds every league and season for head-to-head and
+        team history. It is separate from the match store, so indexing a
+        league/season for a page never rebuilds the whole history. Only
+        changed files are parsed on later refreshes.
+        
+        Args:
+            network: Also download files the mirror has no copy of (False
+                reads the mirror only - what preload() uses at boot)
+        
+        Returns:
+            The updated history store
+        """
+        pending = self._read_seasons(None, None, self._history_versions, None, network)
+        with self._history_lock:
+            store = self._history_store if self._history_store is not None else MatchStore.empty()
+            self._history_store = store = store.with_seasons(df for _, _, df in pending)
+            self._history_versions.update((key, version) for key, version, _ in pending)
+            self._history_loaded_at = time.monotonic()
+        return store
+    
+    def history_store(self) -> Optional[MatchStore]:
+        """
+        The history store, refreshed in the background
+        
+        Never builds in the caller's thread: when the store is missing or
+        older than HISTORY_CONFIG['refresh_interval'] a background build is
+        started, and the current store (None until the first build finishes)
+        is returned straight away.
+        """
+        with self._history_lock:
+            stale = (self._history_loaded_at is None or
+                     time.monotonic() - self._history_loaded_at >= config.HISTORY_CONFIG['refresh_interval'])
+            if stale and not self._history_refreshing:
+                self._history_refreshing = True
+                threading.Thread(target=self._refresh_history, name='history-refresh', daemon=True).start()
+            return self._history_store
+    
+    def _refresh_history(self):
+        try:
+            self.refresh_history()
+        except Exception as e:
+            print(f"❌ History refresh failed: {e}")
+            self._history_loaded_at = time.monotonic()  # Retry after the interval, not on every request
+        finally:
+            self._history_refreshing = False
+    
+    def query_matches(self, league_name: Optional[str] = None, season: Optional[str] = None,
+                      **filters) -> pd.DataFrame:
+        """
+        Query loaded matches with filters pushed down to the match store indexes
+        
+        A league/season pair is loaded on demand; wider queries cover whatever
+        has been loaded (see load_history).
+        
+        Args:
+            league_name: League to restrict to
+            season: Season to restrict to
+            **filters: team, opponent, date_from, date_to, played (see MatchStore.query_rows)
+        
+        Returns:
+            DataFrame of matching rows ordered by league, season and date
+        """
+        league = None
+        if league_name is not None:
+            if league_name not in self.LEAGUES:
+                raise ValueError(f"League '{league_name}' not supported")
+            league = self.LEAGUES[league_name]['name']
+            if season is not None:
+                self._matches_frame(league_name, season)
+        return self.match_store.query(league, season, **filters)
+    
+    def get_league_matches(self, league_name: str, season: str = '2024-25') -> pd.DataFrame:
+        """
+        Get all matches for a league as a DataFrame
+        
+        Args:
+            league_name: Name of the league (e.g., 'Premier League')
+            season: Season string
+        
+        Returns:
+            DataFrame with match data
+        """
+        return self._matches_frame(league_name, season).copy()
+    
+    def refresh_league_matches(self, league_name: str, season: str = '2024-25') -> pd.DataFrame:
+        """
+        Matches re-read through the usual sources, ignoring the league cache's TTL
+        
+        Meant for the live score poller (off the request path). The file comes
+        from the same place fetch_league_data reads it (the mirror, then the
+        HTTP cache), so there is one source of truth, and it is only parsed
+        when its content hash changed: an unchanged file keeps its version
+        and everything memoized for it.
+        
+        Args:
+            league_name: Name of the league
+            season: Season string
+        
+        Returns:
+            DataFrame with match data
+        """
+        if league_name not in self.LEAGUES:
+            raise ValueError(f"League '{league_name}' not supported")
+        
+        league_code = self.LEAGUES[league_name]['code']
+        cache_key = f"{league_code}_{season}"
+        body = self._read_body(league_code, season)
+        if body is not None and hashlib.sha1(body).hexdigest() != self.data_versions.get(cache_key):
+            try:
+                self._store(cache_key, body, json.loads(body))
+            except ValueError as e:
+                print(f"   ⚠️  Ignoring unreadable {league_code} {season}: {e}")
+        return self.get_league_matches(league_name, season)
+    
     def get_team_statistics(self, league_name: str, season: str = '2024-25') -> pd.DataFrame:
         """
         Calculate team statistics from match data
@@ -137,83 +461,198 @@ class FootballJSONLoader:
         Returns:
             DataFrame with team statistics
         """
-        df = self.get_league_matches(league_name, season)
-        
-        if df.empty:
-            return pd.DataFrame()
+        stats_df = self._derived(league_name, season, 'standings',
+                                 lambda data: self._compute_team_statistics(league_name, season))
+        return stats_df.copy() if stats_df is not None else pd.DataFrame()
+    
+    def _compute_team_statistics(self, league_name: str, season: str) -> pd.DataFrame:
+        """
+        Build the league table from the (memoized) matches frame
         
-        # Filter only completed matches (with scores)
-        df = df[df['score1'].notna() & df['score2'].notna()].copy()
+        The first version of a season is computed with the columnar engine.
+        When a later version only changes results (the usual refresh during a
+        matchday), the table is updated with just the changed results.
+        """
+        df = self._matches_frame(league_name, season)
         
         if df.empty:
             return pd.DataFrame()
         
-        teams_stats = {}
+        key = (league_name, season)
+        fixtures = [df[name].to_numpy(dtype=object) for name in ('team1', 'team2', 'date')]
         
-        for _, match in df.iterrows():
-            team1, team2 = match['team1'], match['team2']
-            score1, score2 = match['score1'], match['score2']
+        with self._standings_lock:
+            previous = self._standings.get(key)
+            if previous is None or not all(np.array_equal(old, new)
+                                           for old, new in zip(previous['fixtures'], fixtures)):
+                # First load, or fixtures added/removed/reordered
+                self._standings[key] = {'fixtures': fixtures, 'matches': df, 'table': None}
+                return compute_standings(df, league_name, season)
             
-            # Initialize team stats if not exists
-            for team in [team1, team2]:
-                if team not in teams_stats:
-                    teams_stats[team] = {
-                        'team': team,
-                        'played': 0,
-                        'wins': 0,
-                        'draws': 0,
-                        'losses': 0,
-                        'goals_for': 0,
-                        'goals_against': 0,
-                        'goal_difference': 0,
-                        'points': 0,
-                    }
+            table = previous['table']
+            if table is None:
+                table = IncrementalStandings.from_matches(previous['matches'])
+            table.sync(df)
+            self._standings[key] = {'fixtures': fixtures, 'matches': df, 'table': table}
             
-            # Update stats for team1
-            teams_stats[team1]['played'] += 1
-            teams_stats[team1]['goals_for'] += score1
-            teams_stats[team1]['goals_against'] += score2
-            
-            # Update stats for team2
-            teams_stats[team2]['played'] += 1
-            teams_stats[team2]['goals_for'] += score2
-            teams_stats[team2]['goals_against'] += score1
-            
-            # Determine winner
-            if score1 > score2:
-                teams_stats[team1]['wins'] += 1
-                teams_stats[team1]['points'] += 3
-                teams_stats[team2]['losses'] += 1
-            elif score1 < score2:
-                teams_stats[team2]['wins'] += 1
-                teams_stats[team2]['points'] += 3
-                teams_stats[team1]['losses'] += 1
-            else:
-                teams_stats[team1]['draws'] += 1
-                teams_stats[team1]['points'] += 1
-                teams_stats[team2]['draws'] += 1
-                teams_stats[team2]['points'] += 1
+            goals_dtype = df['score1'].dtype if df['score1'].dtype.kind in 'if' else 'int64'
+            return table.to_frame(league_name, season, goals_dtype)
+    
+    def get_season_timeline(self, league_name: str, season: str = '2024-25') -> Optional[SeasonTimeline]:
+        """
+        Cumulative standings after every round (memoized per data version)
+        
+        Returns:
+            SeasonTimeline (shared - do not modify) or None if there is no data
+        """
+        return self._derived(league_name, season, 'timeline',
+                             lambda data: SeasonTimeline(self._matches_frame(league_name, season)))
+    
+    def get_team_statistics_as_of(self, league_name: str, round_name: str,
+                                  season: str = '2024-25') -> pd.DataFrame:
+        """
+        League table after a given round (e.g. 'Matchday 12')
+        
+        Raises:
+            KeyError: if the round does not exist in the season
+        """
+        timeline = self.get_season_timeline(league_name, season)
+        if timeline is None:
+            return pd.DataFrame()
+        return timeline.table_as_of(round_name, league_name, season)
+    
+    def get_position_history(self, team_name: str, league_name: str,
+                             season: str = '2024-25') -> List[Dict]:
+        """
+        A team's league position and points after every round
+        
+        Raises:
+            KeyError: if the team does not play in the season
+        """
+        timeline = self.get_season_timeline(league_name, season)
+        if timeline is None:
+            return []
+        return timeline.position_history(team_name)
+    
+    def get_matches_page(self, league_name: str, season: str = '2024-25', after: Optional[int] = None,
+                         limit: Optional[int] = None, fields: Optional[List[str]] = None,
+                         **filters) -> Tuple[pd.DataFrame, int, Optional[int]]:
+        """
+        Filtered, projected page of a league/season's matches in fixture-list order
+        
+        Args:
+            league_name: Name of the league
+            season: Season string
+            after: Cursor returned with the previous page
+            limit: Page size (None for everything)
+            fields: Columns to return (default: all)
+            **filters: round_name, team, date_from, date_to, played (see MatchStore.query_rows)
+        
+        Returns:
+            Tuple of (matches, total matches for the filters, next cursor or None);
+            matches is None when the season has no data at all
+        """
+        if self._matches_frame(league_name, season).empty:
+            return None, 0, None
+        store = self.match_store
+        rows = store.query_rows(self.LEAGUES[league_name]['name'], season, **filters)
+        page, cursor = store.page(rows, after, limit)
+        return store.frame(page, order='rows', columns=fields), len(rows), cursor
+    
+    def _history(self, league_name: Optional[str]) -> Tuple[MatchStore, Optional[str]]:
+        """
+        The history store plus the store's label for a league (None: all leagues)
+        
+        Raises:
+            HistoryNotReady: while the first background build is still running
+        """
+        if league_name is not None and league_name not in self.LEAGUES:
+            raise ValueError(f"League '{league_name}' not supported")
+        store = self.history_store()
+        if store is None:
+            raise HistoryNotReady('Match history is still loading, try again shortly')
+        return store, (self.LEAGUES[league_name]['name'] if league_name is not None else None)
+    
+    def get_head_to_head(self, team1: str, team2: str, league_name: Optional[str] = None,
+                         since: Optional[str] = None, last_n: int = 5) -> Dict:
+        """
+        Every meeting between two teams, aggregated from team1's point of view
         
-        # Calculate goal difference
-        for team in teams_stats:
-            teams_stats[team]['goal_difference'] = (
-                teams_stats[team]['goals_for'] - teams_stats[team]['goals_against']
-            )
+        The teams' posting lists in the match store are intersected, so the
+        cost depends on how many matches they played, not on the whole history.
         
-        # Convert to DataFrame and sort by points
-        stats_df = pd.DataFrame(list(teams_stats.values()))
-        stats_df = stats_df.sort_values(
-            ['points', 'goal_difference', 'goals_for'],
-            ascending=[False, False, False]
-        ).reset_index(drop=True)
+        Args:
+            team1: First team (the record is from its point of view)
+            team2: Second team
+            league_name: Restrict to one league (default: all leagues)
+            since: First season to include (e.g. '2010-11')
+            last_n: Number of most recent meetings to return
         
-        # Add position
-        stats_df.insert(0, 'position', range(1, len(stats_df) + 1))
+        Returns:
+            Dictionary with W/D/L, goals and the most recent meetings
+        """
+        store, league = self._history(league_name)
+        rows = store.query_rows(league, team=team1, opponent=team2, season_from=since)
+        record = store.record(rows, team1)
+        return {
+            'team1': team1,
+            'team2': team2,
+            'league': league_name,
+            'since': since,
+            'total_matches': int(len(rows)),
+            'played': record['played'],
+            'team1_wins': record['wins'],
+            'draws': record['draws'],
+            'team2_wins': record['losses'],
+            'team1_goals': record['goals_for'],
+            'team2_goals': record['goals_against'],
+            'recent': store.recent_results(rows, team1, last_n),
+        }
+    
+    def get_team_history(self, team_name: str, league_name: Optional[str] = None,
+                         since: Optional[str] = None, last_n: int = 5) -> Dict:
+        """
+        A team's record across seasons
         
-        stats_df['league'] = league_name
-        stats_df['season'] = season
+        Args:
+            team_name: Team name
+            league_name: Restrict to one league (default: all leagues)
+            since: First season to include (e.g. '2010-11')
+            last_n: Number of most recent matches to return
         
-        return stats_df
+        Returns:
+            Dictionary with overall W/D/L and goals, a per-season breakdown and recent results
+        """
+        store, league = self._history(league_name)
+        rows = store.query_rows(league, team=team_name, season_from=since)
+        history = {'team': team_name, 'league': league_name, 'since': since, 'total_matches': int(len(rows))}
+        history.update(store.record(rows, team_name))
+        history['seasons'] = store.season_records(rows, team_name)
+        history['recent'] = store.recent_results(rows, team_name, last_n)
+        return history
+    
+    def _league_form(self, league_name: str, season: str, last_n: int) -> Optional[Dict[str, List[str]]]:
+        """Memoized form of every team (shared - callers must copy)"""
+        return self._derived(league_name, season, ('form', last_n),
+                             lambda data: compute_form(self._matches_frame(league_name, season), last_n))
+    
+    def get_league_form(self, league_name: str, season: str = '2024-25',
+                        last_n: int = 5) -> Dict[str, List[str]]:
+        """
+        Get recent form for every team in a league in one pass
+        
+        Args:
+            league_name: Name of the league
+            season: Season string
+            last_n: Number of recent matches
+        
+        Returns:
+            Dictionary mapping team name to its results ('W', 'D', 'L'), oldest first
+        """
+        form = self._league_form(league_name, season, last_n)
+        if form is None:
+            return {}
+        return {team: list(results) for team, results in form.items()}
     
     def get_team_form(self, team_name: str, league_name: str, 
                       season: str = '2024-25', last_n: int = 5) -> List[str]:
@@ -229,38 +668,10 @@ class FootballJSONLoader:
         Returns:
             List of results ('W', 'D', 'L')
         """
-        df = self.get_league_matches(league_name, season)
-        
-        if df.empty:
-            return []
-        
-        # Filter matches with scores for this team
-        team_matches = df[
-            ((df['team1'] == team_name) | (df['team2'] == team_name)) &
-            (df['score1'].notna()) & (df['score2'].notna())
-        ].copy()
-        
-        if team_matches.empty:
+        form = self._league_form(league_name, season, last_n)
+        if form is None:
             return []
-        
-        form = []
-        for _, match in team_matches.tail(last_n).iterrows():
-            if match['team1'] == team_name:
-                if match['score1'] > match['score2']:
-                    form.append('W')
-                elif match['score1'] < match['score2']:
-                    form.append('L')
-                else:
-                    form.append('D')
-            else:  # team2
-                if match['score2'] > match['score1']:
-                    form.append('W')
-                elif match['score2'] < match['score1']:
-                    form.append('L')
-                else:
-                    form.append('D')
-        
-        return form
+        return list(form.get(team_name, []))
     
     def get_upcoming_fixtures(self, league_name: str, season: str = '2024-25') -> pd.DataFrame:
         """
@@ -273,7 +684,12 @@ class FootballJSONLoader:
         Returns:
             DataFrame with upcoming fixtures
         """
-        df = self.get_league_matches(league_name, season)
+        upcoming = self._derived(league_name, season, 'fixtures',
+                                 lambda data: self._compute_upcoming_fixtures(league_name, season))
+        return upcoming.copy() if upcoming is not None else pd.DataFrame()
+    
+    def _compute_upcoming_fixtures(self, league_name: str, season: str) -> pd.DataFrame:
+        df = self._matches_frame(league_name, season)
         
         if df.empty:
             return pd.DataFrame()
@@ -283,32 +699,64 @@ class FootballJSONLoader:
         
         return upcoming
     
-    def get_all_leagues_data(self, season: str = '2024-25') -> Dict[str, pd.DataFrame]:
+    def fetch_leagues(self, league_names: Iterable[str], season: str = '2024-25',
+                      max_workers: Optional[int] = None) -> Dict[str, pd.DataFrame]:
         """
-        Fetch data for all available leagues
+        Fetch several leagues concurrently
+        
+        Requests run on a bounded thread pool over the HTTP cache's shared
+        keep-alive session, which also caps concurrent requests per host.
+        Leagues that fail or have no data are left out of the result.
         
         Args:
+            league_names: Leagues to fetch
             season: Season string
+            max_workers: Thread pool size (default: config.FETCH_CONFIG)
         
         Returns:
             Dictionary mapping league names to their DataFrames
         """
-        all_data = {}
+        league_names = list(league_names)
+        if max_workers is None:
+            max_workers = config.FETCH_CONFIG['max_workers']
         
+        def fetch(league_name):
+            try:
+                return league_name, self.get_league_matches(league_name, season), None
+            except Exception as e:
+                return league_name, None, e
+        
+        results = {}
+        workers = max(1, min(max_workers, len(league_names)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='league-fetch') as pool:
+            for league_name, df, error in pool.map(fetch, league_names):
+                if error is not None:
+                    print(f"❌ {league_name}: Error - {error}")
+                elif df.empty:
+                    print(f"⚠️  {league_name}: No data available")
+                else:
+                    results[league_name] = df
+                    print(f"✅ {league_name}: {len(df)} matches")
+        
+        return results
+    
+    def get_all_leagues_data(self, season: str = '2024-25',
+                             max_workers: Optional[int] = None) -> Dict[str, pd.DataFrame]:
+        """
+        Fetch data for all available leagues (concurrently)
+        
+        Args:
+            season: Season string
+            max_workers: Thread pool size (default: config.FETCH_CONFIG)
+        
+        Returns:
+            Dictionary mapping league names to their DataFrames
+        """
         print(f"\n{'='*80}")
         print(f"📥 Fetching all leagues for season {season}")
         print(f"{'='*80}\n")
         
-        for league_name in self.LEAGUES.keys():
-            try:
-                df = self.get_league_matches(league_name, season)
-                if not df.empty:
-                    all_data[league_name] = df
-                    print(f"✅ {league_name}: {len(df)} matches")
-                else:
-                    print(f"⚠️  {league_name}: No data available")
-            except Exception as e:
-                print(f"❌ {league_name}: Error - {e}")
+        all_data = self.fetch_leagues(self.LEAGUES.keys(), season, max_workers)
         
         print(f"\n{'='*80}")
         print(f"✅ Loaded {len(all_data)} leagues")
@@ -0,0 +1,21 @@
+"""
+Gunicorn settings: gunicorn -c gunicorn.conf.py wsgi:application
+"""
+
+import config
+
+bind = config.SERVER_CONFIG['bind']
+workers = config.SERVER_CONFIG['workers']
+threads = config.SERVER_CONFIG['threads']
+backlog = config.SERVER_CONFIG['backlog']
+worker_class = 'gthread'
+# Import wsgi (and preload the data) once in the master, then fork
+preload_app = True
+# SSE clients (/api/stream/scores) hold a connection open; keep idle ones alive
+timeout = 120
+keepalive = config.SERVER_CONFIG['keepalive_timeout']
+
+
+def post_fork(server, worker):
+    import wsgi
+    wsgi.post_fork()
@@ -0,0 +1,156 @@
+"""
+Persistent On-Disk HTTP Cache
+Stores response bodies keyed by URL together with their ETag/Last-Modified
+validators, revalidates with conditional requests and serves the stored copy
+when the remote is unreachable. Files are replaced atomically so several
+processes can share one cache directory.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+class CachedResponse:
+    """A response body plus where it came from"""
+
+    def __init__(self, url: str, body: bytes, source: str):
+        self.url = url
+        self.body = body
+        self.source = source  # 'network', 'revalidated', 'fresh' (on disk, within max_age) or 'stale'
+
+    def json(self):
+        return json.loads(self.body)
+
+
+class DiskHTTPCache:
+    """
+    GET-with-cache for static JSON files
+
+    Args:
+        cache_dir: Directory holding the cached responses
+        max_age: Seconds a stored response is used without contacting the server
+        timeout: Request timeout in seconds
+        max_per_host: Maximum concurrent requests to one host (also the keep-alive pool size)
+        session: requests.Session to use (a new pooled one by default)
+    """
+
+    def __init__(self, cache_dir: str, max_age: float = 300, timeout: float = 30,
+                 max_per_host: int = 4, session: Optional[requests.Session] = None):
+        self.cache_dir = cache_dir
+        self.max_age = max_age
+        self.timeout = timeout
+        self.max_per_host = max_per_host
+        if session is None:
+            # One keep-alive session shared by every thread using this cache
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=16, pool_maxsize=max_per_host)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+        self.session = session
+        self._host_limits = {}
+        self._host_limits_lock = threading.Lock()
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _host_limit(self, url: str) -> threading.BoundedSemaphore:
+        host = urlsplit(url).netloc
+        with self._host_limits_lock:
+            limit = self._host_limits.get(host)
+            if limit is None:
+                limit = self._host_limits[host] = threading.BoundedSemaphore(self.max_per_host)
+            return limit
+
+    def _path(self, url: str) -> str:
+        return os.path.join(self.cache_dir, hashlib.sha256(url.encode('utf-8')).hexdigest() + '.cache')
+
+    def _read(self, url: str) -> Optional[tuple]:
+        """(meta, body) for a stored URL, None if missing or unreadable"""
+        try:
+            with open(self._path(url), 'rb') as f:
+                meta = json.loads(f.readline())
+                body = f.read()
+        except (OSError, ValueError):
+            return None
+        if meta.get('url') != url or meta.get('length') != len(body):
+            return None
+        return meta, body
+
+    def _write(self, url: str, body: bytes, headers) -> Dict:
+        """Store a response; the metadata line and body are replaced in one rename"""
+        meta = {
+            'url': url,
+            'etag': headers.get('ETag'),
+            'last_modified': headers.get('Last-Modified'),
+            'fetched_at': time.time(),
+            'length': len(body),
+        }
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(json.dumps(meta).encode('utf-8') + b'\n')
+                f.write(body)
+            os.replace(tmp_path, self._path(url))
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+        return meta
+
+    def _touch(self, url: str, meta: Dict, body: bytes, headers):
+        """Record a successful revalidation so other processes skip the network too"""
+        refreshed = {
+            'ETag': headers.get('ETag') or meta.get('etag'),
+            'Last-Modified': headers.get('Last-Modified') or meta.get('last_modified'),
+        }
+        self._write(url, body, {k: v for k, v in refreshed.items() if v})
+
+    def get(self, url: str) -> CachedResponse:
+        """
+        Fetch a URL through the cache
+
+        Raises:
+            requests.exceptions.HTTPError: for error statuses (e.g. 404) when nothing is stored
+            requests.exceptions.RequestException: when the server is unreachable and nothing is stored
+        """
+        stored = self._read(url)
+        if stored is not None:
+            meta, body = stored
+            if time.time() - meta.get('fetched_at', 0) < self.max_age:
+                return CachedResponse(url, body, 'fresh')
+
+        headers = {}
+        if stored is not None:
+            if meta.get('etag'):
+                headers['If-None-Match'] = meta['etag']
+            if meta.get('last_modified'):
+                headers['If-Modified-Since'] = meta['last_modified']
+
+        try:
+            with self._host_limit(url):
+                response = self.session.get(url, headers=headers, timeout=self.timeout)
+            if response.status_code == 304 and stored is not None:
+                self._touch(url, meta, body, response.headers)
+                return CachedResponse(url, body, 'revalidated')
+            response.raise_for_status()
+        except requests.exceptions.RequestException as e:
+            # Remote unreachable or erroring: the stored copy beats no data
+            is_client_error = (
+                isinstance(e, requests.exceptions.HTTPError) and
+                e.response is not None and 400 <= e.response.status_code < 500
+            )
+            if stored is not None and not is_client_error:
+                print(f"   ⚠️  {url} unavailable ({e}), serving cached copy")
+                return CachedResponse(url, body, 'stale')
+            raise
+
+        body = response.content
+        self._write(url, body, response.headers)
+        return CachedResponse(url, body, 'network')
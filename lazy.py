@@ -0,0 +1,58 @@
+"""
+Deferred Initialization
+Module-level objects whose construction (and heavy imports) wait until
+the first attribute access, so importing a module stays cheap
+"""
+
+import threading
+from typing import Any, Callable
+
+
+class LazyObject:
+    """
+    Proxy that builds its target on first use
+
+    Attribute access, len() and iteration are forwarded to the target. The
+    factory runs at most once, even when several threads race for it.
+
+    Args:
+        factory: Zero-argument callable returning the real object (do the
+            heavy imports inside it)
+    """
+
+    def __init__(self, factory: Callable[[], Any]):
+        object.__setattr__(self, '_factory', factory)
+        object.__setattr__(self, '_target', None)
+        object.__setattr__(self, '_lock', threading.Lock())
+
+    def _resolve(self) -> Any:
+        target = self._target
+        if target is None:
+            with self._lock:
+                target = self._target
+                if target is None:
+                    target = self._factory()
+                    object.__setattr__(self, '_target', target)
+        return target
+
+    @property
+    def loaded(self) -> bool:
+        """True once the target has been built"""
+        return self._target is not None
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._resolve(), name)
+
+    def __setattr__(self, name: str, value: Any):
+        setattr(self._resolve(), name, value)
+
+    def __len__(self) -> int:
+        return len(self._resolve())
+
+    def __iter__(self):
+        return iter(self._resolve())
+
+    def __repr__(self) -> str:
+        if self._target is None:
+            return f"<LazyObject (not loaded) {getattr(self._factory, '__name__', self._factory)!r}>"
+        return repr(self._target)
@@ -0,0 +1,396 @@
+"""
+Live Score Push Channel (Server-Sent Events)
+One producer per league/season polls its match source, works out what
+changed (fixtures, scores, status transitions, table rows) and serializes each
+delta once for every subscriber, so the cost is O(changes), not
+O(clients x matches)
+"""
+
+import queue
+import threading
+from collections import deque
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from fast_json import dumps
+from standings import IncrementalStandings
+
+
+MATCH_FIELDS = ['round', 'date', 'team1', 'team2', 'score1', 'score2']
+
+
+def _status(score1, score2) -> str:
+    return 'finished' if score1 is not None and score2 is not None else 'scheduled'
+
+
+def _clean(value):
+    """JSON-friendly scalar (NaN -> None, NumPy -> Python)"""
+    if value is None or (isinstance(value, float) and np.isnan(value)):
+        return None
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+def format_event(event_id: int, event: str, data: bytes) -> bytes:
+    """One SSE message"""
+    return b'id: %d\nevent: %s\ndata: %s\n\n' % (event_id, event.encode(), data)
+
+
+class Subscription:
+    """A client's queue of pre-serialized SSE messages"""
+
+    def __init__(self, feed: 'LeagueFeed', size: int):
+        self.feed = feed
+        self.messages = queue.Queue(maxsize=size)
+        self.closed = False
+
+    def push(self, message: bytes) -> bool:
+        """Queue a message; False (and the subscription is closed) when the client fell behind"""
+        try:
+            self.messages.put_nowait(message)
+            return True
+        except queue.Full:
+            self.closed = True
+            return False
+
+    def stream(self, heartbeat: float):
+        """
+        Generator of SSE bytes for a streaming response
+
+        Sends a comment line every `heartbeat` seconds of silence so proxies
+        keep the connection open. Ends when the client falls too far behind
+        (it reconnects and resumes from its Last-Event-ID).
+        """
+        try:
+            while not self.closed:
+                try:
+                    yield self.messages.get(timeout=heartbeat)
+                except queue.Empty:
+                    yield b': keep-alive\n\n'
+        finally:
+            self.feed.unsubscribe(self)
+
+
+class LeagueFeed:
+    """
+    Shared producer for one league/season
+
+    Args:
+        league_name: League name (used in table rows)
+        season: Season string
+        source: Returns the current matches DataFrame (team1, team2, score1, score2, ...)
+        queue_size: Messages buffered per subscriber before it is dropped
+        replay_size: Recent deltas kept for clients resuming with Last-Event-ID
+    """
+
+    def __init__(self, league_name: str, season: str, source: Callable[[], pd.DataFrame],
+                 queue_size: int = 100, replay_size: int = 256):
+        self.league_name = league_name
+        self.season = season
+        self.source = source
+        self.queue_size = queue_size
+        self.version = 0
+        self._lock = threading.Lock()
+        self._subscribers = set()
+        self._replay = deque(maxlen=replay_size)  # (version, message)
+        self._snapshot = None  # (version, message) serialized lazily
+        self._matches = None  # Last matches frame read from the source
+        self._standings = None
+        self._table = {}  # team -> table row
+
+    # -- state ---------------------------------------------------------
+
+    @staticmethod
+    def _match_rows(matches: pd.DataFrame, positions) -> List[Dict]:
+        """Match dicts (with fixture index and status) for the given positions"""
+        columns = {name: matches[name].to_numpy() for name in MATCH_FIELDS if name in matches}
+        rows = []
+        for i in positions:
+            row = {'index': int(i)}
+            for name, values in columns.items():
+                row[name] = _clean(values[i])
+            row['status'] = _status(row.get('score1'), row.get('score2'))
+            rows.append(row)
+        return rows
+
+    @staticmethod
+    def _changed_positions(previous: pd.DataFrame, current: pd.DataFrame) -> np.ndarray:
+        """Fixture positions where any of MATCH_FIELDS differs (new fixtures count as changed)"""
+        n = min(len(previous), len(current))
+        changed = np.zeros(len(current), dtype=bool)
+        changed[n:] = True
+        for name in MATCH_FIELDS:
+            if name not in current:
+                continue
+            old = previous[name].to_numpy()[:n]
+            new = current[name].to_numpy()[:n]
+            old_missing, new_missing = pd.isna(old), pd.isna(new)
+            same = (old_missing & new_missing) | (~old_missing & ~new_missing & (old == new))
+            changed[:n] |= ~same
+        return np.flatnonzero(changed)
+
+    def _table_rows(self) -> Dict[str, Dict]:
+        table = self._standings.to_frame(self.league_name, self.season)
+        if table.empty:
+            return {}
+        records = table.drop(columns=['league', 'season']).to_dict('records')
+        return {row['team']: {k: _clean(v) for k, v in row.items()} for row in records}
+
+    def poll_once(self) -> Optional[Dict]:
+        """
+        Read the source once and broadcast what changed
+
+        Returns:
+            The delta that was sent, or None if nothing changed
+        """
+        matches = self.source()
+        if matches is None or matches.empty:
+            return None
+
+        matches = matches[[name for name in MATCH_FIELDS if name in matches]].reset_index(drop=True)
+        with self._lock:
+            if self._matches is None:
+                self._matches = matches
+                self._standings = IncrementalStandings.from_matches(matches)
+                self._table = self._table_rows()
+                self.version += 1
+                # Clients that subscribed before the first read start with the snapshot
+                message = self._snapshot_message()
+                subscribers = list(self._subscribers)
+                delta = None
+            else:
+                delta, message, subscribers = self._delta(matches)
+                if delta is None:
+                    return None
+
+        for subscription in subscribers:
+            if not subscription.push(message):
+                self.unsubscribe(subscription)
+        return delta
+
+    def _delta(self, matches: pd.DataFrame):
+        """
+        Work out and serialize what changed since the last read (caller holds the lock)
+
+        Returns:
+            (delta, message, subscribers), or (None, None, []) if nothing changed
+        """
+        # Vectorized comparison; only changed fixtures are turned into dicts
+        positions = self._changed_positions(self._matches, matches)
+        removed = list(range(len(matches), len(self._matches)))  # Fixtures dropped from the end
+        if not len(positions) and not removed:
+            return None, None, []
+        previous = {row['index']: row for row in
+                    self._match_rows(self._matches, [p for p in positions if p < len(self._matches)])}
+        changed = self._match_rows(matches, positions)
+        for row in changed:
+            row['previous_status'] = previous[row['index']]['status'] if row['index'] in previous else None
+
+        self._matches = matches
+        self._standings.sync(matches)
+        table = self._table_rows()
+        table_changes = [row for team, row in table.items() if self._table.get(team) != row]
+        table_removed = [team for team in self._table if team not in table]
+        self._table = table
+
+        self.version += 1
+        delta = {
+            'league': self.league_name,
+            'season': self.season,
+            'version': self.version,
+            'matches': changed,
+            'removed': removed,
+            'table': table_changes,
+            'table_removed': table_removed,
+        }
+        message = format_event(self.version, 'delta', dumps(delta))
+        self._replay.append((self.version, message))
+        self._snapshot = None
+        return delta, message, list(self._subscribers)
+
+    def _snapshot_message(self) -> bytes:
+        """Full state as one 'snapshot' event, serialized once per version"""
+        if self._snapshot is None or self._snapshot[0] != self.version:
+            table = sorted(self._table.values(), key=lambda row: row['position'])
+            data = dumps({'league': self.league_name, 'season': self.season, 'version': self.version,
+                          'matches': self._match_rows(self._matches, range(len(self._matches))),
+                          'table': table})
+            self._snapshot = (self.version, format_event(self.version, 'snapshot', data))
+        return self._snapshot[1]
+
+    # -- subscribers ---------------------------------------------------
+
+    def subscribe(self, last_event_id: Optional[str] = None) -> Subscription:
+        """
+        Register a client
+
+        A client resuming with a Last-Event-ID still in the replay buffer gets
+        only the deltas it missed; everyone else starts with a snapshot. The
+        source is never read here (that is the poller's job): before the
+        first poll a client waits and gets the snapshot when it happens.
+        """
+        subscription = Subscription(self, self.queue_size)
+        with self._lock:
+            missed = None
+            if last_event_id is not None and str(last_event_id).isdigit():
+                last = int(last_event_id)
+                if last == self.version:
+                    missed = []
+                elif self._replay and self._replay[0][0] <= last + 1 and last < self.version:
+                    missed = [message for version, message in self._replay if version > last]
+            if missed is None:
+                if self._matches is not None:
+                    subscription.push(self._snapshot_message())
+            else:
+                for message in missed:
+                    subscription.push(message)
+            self._subscribers.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        subscription.closed = True
+        with self._lock:
+            self._subscribers.discard(subscription)
+
+    @property
+    def subscriber_count(self) -> int:
+        with self._lock:
+            return len(self._subscribers)
+
+
+class LiveScoreHub:
+    """
+    Registry of league feeds plus the background thread polling them
+
+    Feeds are created on first subscription. Sources are only ever read by
+    the poller thread (never in a request), and only for feeds that
+    currently have subscribers; a feed with no data yet wakes the poller
+    instead of waiting for the next interval. Every open stream holds a
+    request thread, so subscribe() refuses streams past `max_connections`.
+
+    Args:
+        source_factory: (league_name, season) -> callable returning the matches DataFrame
+        poll_interval: Seconds between polls
+        queue_size: See LeagueFeed
+        replay_size: See LeagueFeed
+        max_connections: Open streams allowed in this process (None for no limit)
+    """
+
+    def __init__(self, source_factory: Callable[[str, str], Callable[[], pd.DataFrame]],
+                 poll_interval: float = 15.0, queue_size: int = 100, replay_size: int = 256,
+                 max_connections: Optional[int] = None):
+        self.source_factory = source_factory
+        self.poll_interval = poll_interval
+        self.queue_size = queue_size
+        self.replay_size = replay_size
+        self.max_connections = max_connections
+        self._feeds = {}
+        self._lock = threading.Lock()
+        self._subscribe_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._wake = threading.Event()
+        self._thread = None
+
+    def feed(self, league_name: str, season: str) -> LeagueFeed:
+        key = (league_name, season)
+        with self._lock:
+            feed = self._feeds.get(key)
+            if feed is None:
+                feed = self._feeds[key] = LeagueFeed(league_name, season,
+                                                     self.source_factory(league_name, season),
+                                                     self.queue_size, self.replay_size)
+            return feed
+
+    @property
+    def connection_count(self) -> int:
+        """Streams currently open across all feeds"""
+        with self._lock:
+            feeds = list(self._feeds.values())
+        return sum(feed.subscriber_count for feed in feeds)
+
+    def subscribe(self, league_name: str, season: str,
+                  last_event_id: Optional[str] = None) -> Optional[Subscription]:
+        """
+        Open a stream on a league's feed (see LeagueFeed.subscribe)
+
+        Returns:
+            The subscription, or None when max_connections streams are already open
+        """
+        with self._subscribe_lock:
+            if self.max_connections is not None and self.connection_count >= self.max_connections:
+                return None
+            feed = self.feed(league_name, season)
+            subscription = feed.subscribe(last_event_id)
+        if feed.version == 0:
+            self._wake.set()  # First read of this feed: don't wait out the poll interval
+        return subscription
+
+    def poll(self):
+        """Poll every feed that has subscribers once"""
+        with self._lock:
+            feeds = [feed for feed in self._feeds.values() if feed.subscriber_count]
+        for feed in feeds:
+            try:
+                feed.poll_once()
+            except Exception as e:
+                print(f"⚠️  Live feed {feed.league_name} {feed.season} failed: {e}")
+
+    def start(self):
+        """Start the background poller (idempotent)"""
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name='live-scores', daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._wake.set()
+
+    def _run(self):
+        while not self._stop.is_set():
+            self._wake.clear()
+            self.poll()
+            self._wake.wait(self.poll_interval)
+
+
+class ReplaySource:
+    """
+    Replays a recorded season as if it were being played
+
+    Starts with every score removed; each advance() reveals the results
+    of the next `step` matches in kick-off order.
+
+    Args:
+        matches: Complete matches DataFrame (e.g. from premier_league_2024_25_matches.json)
+        step: Matches completed per advance()
+    """
+
+    def __init__(self, matches: pd.DataFrame, step: int = 10):
+        self.final = matches.reset_index(drop=True)
+        self.step = step
+        self.completed = 0
+        # Kick-off order (stable, so same-day matches keep fixture-list order)
+        self._order = np.argsort(self.final['date'].fillna('').to_numpy().astype(str), kind='stable')
+        self._lock = threading.Lock()
+
+    def advance(self, n: Optional[int] = None) -> int:
+        with self._lock:
+            self.completed = min(len(self.final), self.completed + (self.step if n is None else n))
+            return self.completed
+
+    def __call__(self) -> pd.DataFrame:
+        with self._lock:
+            completed = self.completed
+        matches = self.final.copy()
+        pending = self._order[completed:]
+        for column in ('score1', 'score2', 'score_ht1', 'score_ht2'):
+            if column in matches:
+                values = matches[column].astype(np.float64)
+                values.iloc[pending] = np.nan
+                matches[column] = values
+        return matches
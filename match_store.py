@@ -0,0 +1,463 @@
+"""
+Columnar Multi-Season Match Store
+Holds every loaded league/season in one set of NumPy columns with
+dictionary-encoded teams, rows sorted by (league, season, date) and
+per-team posting lists, so queries touch only the rows they need
+"""
+
+import numpy as np
+import pandas as pd
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+# Columns returned by queries (same layout as FootballJSONLoader matches frames)
+MATCH_COLUMNS = [
+    'date', 'time', 'round', 'team1', 'team2',
+    'score1', 'score2', 'score_ht1', 'score_ht2', 'league', 'season',
+]
+SCORE_COLUMNS = ['score1', 'score2', 'score_ht1', 'score_ht2']
+MISSING_SCORE = -1
+
+
+def _encode(values, vocabulary: List[str]) -> np.ndarray:
+    """Dictionary-encode values against a shared vocabulary (appended to in place)"""
+    codes, uniques = pd.factorize(pd.Series(values, dtype=object), use_na_sentinel=True)
+    lookup = {name: i for i, name in enumerate(vocabulary)}
+    mapping = np.empty(len(uniques), dtype=np.int32)
+    for i, name in enumerate(uniques):
+        if name not in lookup:
+            lookup[name] = len(vocabulary)
+            vocabulary.append(name)
+        mapping[i] = lookup[name]
+    encoded = np.full(len(codes), -1, dtype=np.int32)
+    present = codes >= 0
+    encoded[present] = mapping[codes[present]]
+    return encoded
+
+
+def _decode(codes: np.ndarray, vocabulary: List[str]) -> np.ndarray:
+    labels = np.empty(len(vocabulary) + 1, dtype=object)
+    labels[:-1] = vocabulary
+    labels[-1] = None  # code -1
+    return labels[codes]
+
+
+def _decode_scores(values: np.ndarray):
+    """Integers when every score is known, floats with NaN otherwise (as pandas infers from JSON)"""
+    missing = values == MISSING_SCORE
+    if not missing.any():
+        return values.astype(np.int64)
+    scores = values.astype(np.float64)
+    scores[missing] = np.nan
+    return scores
+
+
+def _posting_lists(keys: np.ndarray, rows: np.ndarray, n_keys: int) -> Tuple[np.ndarray, np.ndarray]:
+    """CSR posting lists: rows grouped by key (rows ascending within a key) plus key offsets"""
+    order = np.lexsort((rows, keys))
+    offsets = np.concatenate([[0], np.cumsum(np.bincount(keys, minlength=n_keys))])
+    return rows[order].astype(np.int64), offsets
+
+
+def _intersect(first: np.ndarray, second: np.ndarray) -> np.ndarray:
+    """Intersection of two sorted row arrays, probing the longer with the shorter"""
+    if len(first) > len(second):
+        first, second = second, first
+    if len(second) == 0:
+        return second
+    pos = np.minimum(np.searchsorted(second, first), len(second) - 1)
+    return first[second[pos] == first]
+
+
+def _encode_frames(frames: List[pd.DataFrame], leagues: List[str], seasons: List[str],
+                   teams: List[str], labels: Dict[str, List[str]]) -> Dict[str, np.ndarray]:
+    """Columns for a list of matches frames, encoded against (and extending) the vocabularies"""
+    frames = [df for df in frames if not df.empty]
+    if not frames:
+        columns = {name: np.empty(0, dtype=np.int32) for name in
+                   ['league', 'season', 'team1', 'team2', 'round', 'time', 'seq']}
+        columns['date'] = np.empty(0, dtype='datetime64[D]')
+        for name in SCORE_COLUMNS:
+            columns[name] = np.empty(0, dtype=np.int16)
+        return columns
+
+    df = pd.concat(frames, ignore_index=True)
+    columns = {
+        'league': _encode(df['league'], leagues),
+        'season': _encode(df['season'], seasons),
+        # Position within the source file, to restore file order per season
+        'seq': np.concatenate([np.arange(len(frame), dtype=np.int32) for frame in frames]),
+        'date': pd.to_datetime(df['date'], errors='coerce').to_numpy().astype('datetime64[D]'),
+    }
+    home_away = _encode(np.concatenate([df['team1'].to_numpy(), df['team2'].to_numpy()]), teams)
+    columns['team1'], columns['team2'] = home_away[:len(df)], home_away[len(df):]
+    for name in ('round', 'time'):
+        values = df[name] if name in df else pd.Series([None] * len(df))
+        columns[name] = _encode(values, labels[name])
+    for name in SCORE_COLUMNS:
+        values = pd.to_numeric(df[name], errors='coerce') if name in df else pd.Series(np.nan, index=df.index)
+        columns[name] = values.fillna(MISSING_SCORE).to_numpy().astype(np.int16)
+    return columns
+
+
+class MatchStore:
+    """
+    Immutable columnar table of matches across leagues and seasons
+
+    Rows are sorted by (league, season, date, position in the source file),
+    so every league and every league/season is a contiguous slice, and
+    dates are sorted within a league/season. `team_rows()` gives the sorted
+    rows a team played in (home or away).
+
+    Build with `MatchStore.from_frames()` and add seasons with
+    `with_seasons()`, which returns a new store, so readers holding the
+    old one are never affected.
+    """
+
+    def __init__(self, columns: Dict[str, np.ndarray], leagues: List[str], seasons: List[str],
+                 teams: List[str], labels: Dict[str, List[str]]):
+        self.leagues = leagues
+        self.seasons = seasons
+        self.teams = teams
+        self._labels = labels  # vocabularies for 'round' and 'time'
+        self._league_ids = {name: i for i, name in enumerate(leagues)}
+        self._season_ids = {name: i for i, name in enumerate(seasons)}
+        self._team_ids = {name: i for i, name in enumerate(teams)}
+
+        order = np.lexsort((columns['seq'], columns['date'], columns['season'], columns['league']))
+        self._columns = {name: values[order] for name, values in columns.items()}
+
+        # Partition key: league-major, so leagues and league/seasons are contiguous ranges
+        self._partition_key = (self._columns['league'].astype(np.int64) * max(len(seasons), 1)
+                               + self._columns['season'])
+
+        # Per-team posting lists (home and away) and per-round posting lists
+        n = len(self)
+        team_of = np.concatenate([self._columns['team1'], self._columns['team2']])
+        self._postings, self._posting_offsets = _posting_lists(
+            team_of, np.concatenate([np.arange(n), np.arange(n)]), len(teams))
+        self._round_ids = {name: i for i, name in enumerate(labels['round'])}
+        has_round = self._columns['round'] >= 0
+        self._round_postings, self._round_offsets = _posting_lists(
+            self._columns['round'][has_round], np.flatnonzero(has_round), len(labels['round']))
+
+    def __len__(self) -> int:
+        return len(self._columns['seq'])
+
+    @classmethod
+    def empty(cls) -> 'MatchStore':
+        return cls.from_frames([])
+
+    @classmethod
+    def from_frames(cls, frames: Iterable[pd.DataFrame]) -> 'MatchStore':
+        """
+        Build a store from matches frames (FootballJSONLoader layout, one frame per league/season)
+        """
+        leagues, seasons, teams = [], [], []
+        labels = {'round': [], 'time': []}
+        columns = _encode_frames(list(frames), leagues, seasons, teams, labels)
+        return cls(columns, leagues, seasons, teams, labels)
+
+    def with_seasons(self, frames: Iterable[pd.DataFrame]) -> 'MatchStore':
+        """
+        New store with league/season frames added, replacing any rows already
+        held for those league/seasons (this store is left unchanged)
+        """
+        frames = [df for df in frames if not df.empty]
+        if not frames:
+            return self
+        leagues, seasons, teams = list(self.leagues), list(self.seasons), list(self.teams)
+        labels = {name: list(values) for name, values in self._labels.items()}
+        added = _encode_frames(frames, leagues, seasons, teams, labels)
+
+        replaced = np.unique(added['league'].astype(np.int64) * len(seasons) + added['season'])
+        kept = ~np.isin(self._columns['league'].astype(np.int64) * len(seasons) + self._columns['season'],
+                        replaced)
+        columns = {name: np.concatenate([values[kept], added[name]])
+                   for name, values in self._columns.items()}
+        return MatchStore(columns, leagues, seasons, teams, labels)
+
+    def with_season(self, matches: pd.DataFrame) -> 'MatchStore':
+        """New store with one league/season frame added (see with_seasons)"""
+        return self.with_seasons([matches])
+
+    # -- indexes -------------------------------------------------------
+
+    def _range(self, league: Optional[str], season: Optional[str]) -> Optional[Tuple[int, int]]:
+        """Contiguous row range for a league (and season); None when unknown"""
+        if league is None:
+            return (0, len(self)) if season is None else None
+        league_id = self._league_ids.get(league)
+        if league_id is None:
+            return None
+        width = max(len(self.seasons), 1)
+        if season is None:
+            lo, hi = league_id * width, (league_id + 1) * width
+        else:
+            season_id = self._season_ids.get(season)
+            if season_id is None:
+                return None
+            lo = league_id * width + season_id
+            hi = lo + 1
+        return (int(np.searchsorted(self._partition_key, lo, 'left')),
+                int(np.searchsorted(self._partition_key, hi, 'left')))
+
+    def seasons_for(self, league: str) -> List[str]:
+        """Seasons loaded for a league"""
+        bounds = self._range(league, None)
+        if bounds is None:
+            return []
+        ids = np.unique(self._columns['season'][bounds[0]:bounds[1]])
+        return [self.seasons[i] for i in ids]
+
+    def team_rows(self, team: str) -> np.ndarray:
+        """Sorted rows of every match a team played (home or away)"""
+        team_id = self._team_ids.get(team)
+        if team_id is None:
+            return np.empty(0, dtype=np.int64)
+        return self._postings[self._posting_offsets[team_id]:self._posting_offsets[team_id + 1]]
+
+    def meeting_rows(self, team1: str, team2: str) -> np.ndarray:
+        """Sorted rows of matches between two teams (either venue)"""
+        return _intersect(self.team_rows(team1), self.team_rows(team2))
+
+    def round_rows(self, round_name: str) -> np.ndarray:
+        """Sorted rows of every match in rounds with this name (across leagues/seasons)"""
+        round_id = self._round_ids.get(round_name)
+        if round_id is None:
+            return np.empty(0, dtype=np.int64)
+        return self._round_postings[self._round_offsets[round_id]:self._round_offsets[round_id + 1]]
+
+    def rounds_for(self, league: str, season: str) -> List[str]:
+        """Round names of a league/season in order of first appearance in the source file"""
+        bounds = self._range(league, season)
+        if bounds is None or bounds[0] == bounds[1]:
+            return []
+        rows = np.arange(*bounds)
+        rows = rows[np.argsort(self._columns['seq'][rows], kind='stable')]
+        codes = pd.unique(self._columns['round'][rows])
+        return [self._labels['round'][code] for code in codes if code >= 0]
+
+    # -- queries -------------------------------------------------------
+
+    def query_rows(self, league: Optional[str] = None, season: Optional[str] = None,
+                   team: Optional[str] = None, opponent: Optional[str] = None,
+                   date_from: Optional[str] = None, date_to: Optional[str] = None,
+                   played: Optional[bool] = None, season_from: Optional[str] = None,
+                   round_name: Optional[str] = None) -> np.ndarray:
+        """
+        Rows matching every given filter, in store order
+
+        Filters are pushed down to the indexes: league/season pick a slice,
+        team/opponent/round pick (and intersect) posting lists, and dates are
+        binary-searched within a single league/season. `season_from` keeps
+        seasons from that one on ('2010-11' style names sort chronologically).
+        """
+        bounds = self._range(league, season)
+        if bounds is None:
+            return np.empty(0, dtype=np.int64)
+        lo, hi = bounds
+
+        postings = [self.team_rows(name) for name in (team, opponent) if name is not None]
+        if round_name is not None:
+            postings.append(self.round_rows(round_name))
+        rows = None
+        for posting in sorted(postings, key=len):
+            rows = posting if rows is None else _intersect(rows, posting)
+
+        start = np.datetime64(date_from, 'D') if date_from else None
+        end = np.datetime64(date_to, 'D') if date_to else None
+        if rows is None and league is not None and season is not None:
+            # Dates are sorted inside a league/season slice
+            dates = self._columns['date'][lo:hi]
+            valid_hi = lo + int(np.searchsorted(dates, np.datetime64('NaT'), 'left')) if len(dates) else lo
+            if start is not None:
+                lo = lo + int(np.searchsorted(dates, start, 'left'))
+            if end is not None:
+                hi = min(valid_hi, bounds[0] + int(np.searchsorted(dates, end, 'right')))
+            elif start is not None:
+                hi = valid_hi
+            start = end = None
+
+        if rows is None:
+            rows = np.arange(lo, hi, dtype=np.int64)
+        else:
+            rows = rows[np.searchsorted(rows, lo, 'left'):np.searchsorted(rows, hi, 'left')]
+
+        mask = None
+        if start is not None or end is not None:
+            dates = self._columns['date'][rows]
+            mask = ~np.isnat(dates)
+            if start is not None:
+                mask &= dates >= start
+            if end is not None:
+                mask &= dates <= end
+        if played is not None:
+            has_score = ((self._columns['score1'][rows] != MISSING_SCORE) &
+                         (self._columns['score2'][rows] != MISSING_SCORE))
+            has_score = has_score if played else ~has_score
+            mask = has_score if mask is None else mask & has_score
+        if season_from is not None:
+            allowed = np.array([name >= season_from for name in self.seasons], dtype=bool)
+            in_range = allowed[self._columns['season'][rows]] if len(allowed) else np.zeros(len(rows), bool)
+            mask = in_range if mask is None else mask & in_range
+        return rows if mask is None else rows[mask]
+
+    # -- aggregates ----------------------------------------------------
+
+    def _team_goals(self, rows: np.ndarray, team: str) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """(rows, goals for, goals against) from a team's point of view, played matches only"""
+        team_id = self._team_ids.get(team, -1)
+        score1, score2 = self._columns['score1'][rows], self._columns['score2'][rows]
+        played = (score1 != MISSING_SCORE) & (score2 != MISSING_SCORE)
+        rows, score1, score2 = rows[played], score1[played], score2[played]
+        at_home = self._columns['team1'][rows] == team_id
+        goals_for = np.where(at_home, score1, score2).astype(np.int64)
+        goals_against = np.where(at_home, score2, score1).astype(np.int64)
+        return rows, goals_for, goals_against
+
+    def record(self, rows: np.ndarray, team: str) -> Dict[str, int]:
+        """
+        Win/draw/loss record and goals for a team over the given rows
+        (unplayed matches are ignored)
+        """
+        _, goals_for, goals_against = self._team_goals(rows, team)
+        wins = int((goals_for > goals_against).sum())
+        draws = int((goals_for == goals_against).sum())
+        return {
+            'played': len(goals_for),
+            'wins': wins,
+            'draws': draws,
+            'losses': len(goals_for) - wins - draws,
+            'goals_for': int(goals_for.sum()),
+            'goals_against': int(goals_against.sum()),
+        }
+
+    def season_records(self, rows: np.ndarray, team: str) -> List[Dict]:
+        """record() per league/season, oldest first"""
+        rows, goals_for, goals_against = self._team_goals(rows, team)
+        if not len(rows):
+            return []
+        key = self._partition_key[rows]
+        groups, inverse = np.unique(key, return_inverse=True)
+        won = np.bincount(inverse, goals_for > goals_against, len(groups)).astype(int)
+        drawn = np.bincount(inverse, goals_for == goals_against, len(groups)).astype(int)
+        played = np.bincount(inverse, minlength=len(groups))
+        scored = np.bincount(inverse, goals_for, len(groups)).astype(int)
+        conceded = np.bincount(inverse, goals_against, len(groups)).astype(int)
+        first_row = rows[np.searchsorted(key, groups)]
+
+        records = []
+        for g, row in enumerate(first_row):
+            records.append({
+                'league': self.leagues[self._columns['league'][row]],
+                'season': self.seasons[self._columns['season'][row]],
+                'played': int(played[g]),
+                'wins': int(won[g]),
+                'draws': int(drawn[g]),
+                'losses': int(played[g] - won[g] - drawn[g]),
+                'goals_for': int(scored[g]),
+                'goals_against': int(conceded[g]),
+                'points': int(3 * won[g] + drawn[g]),
+            })
+        records.sort(key=lambda r: (r['season'], r['league']))
+        return records
+
+    def recent_results(self, rows: np.ndarray, team: str, last_n: int = 5) -> List[Dict]:
+        """The team's last `last_n` played matches among the rows, newest first"""
+        rows, goals_for, goals_against = self._team_goals(rows, team)
+        dates = self._columns['date'][rows]
+        # Newest first; undated matches last
+        order = np.lexsort((-dates.view(np.int64), np.isnat(dates)))[:last_n]
+        frame = self.frame(rows[order])
+        results = np.where(goals_for[order] > goals_against[order], 'W',
+                           np.where(goals_for[order] == goals_against[order], 'D', 'L'))
+        recent = []
+        for record, result in zip(frame.to_dict('records'), results):
+            recent.append({
+                'date': record['date'],
+                'league': record['league'],
+                'season': record['season'],
+                'round': record['round'],
+                'home_team': record['team1'],
+                'away_team': record['team2'],
+                'score': f"{int(record['score1'])}-{int(record['score2'])}",
+                'result': str(result),
+            })
+        return recent
+
+    def file_order(self, rows: np.ndarray) -> np.ndarray:
+        """Rows reordered as they appear in the source files (per league/season)"""
+        if not len(rows):
+            return rows
+        return rows[np.lexsort((self._columns['seq'][rows], self._partition_key[rows]))]
+
+    def page(self, rows: np.ndarray, after: Optional[int] = None,
+             limit: Optional[int] = None) -> Tuple[np.ndarray, Optional[int]]:
+        """
+        One page of rows from a single league/season, in file order
+
+        Pages are keyed on the match's position in the source file, so a
+        cursor stays valid while scores are updated.
+
+        Args:
+            rows: Rows of one league/season (e.g. from query_rows)
+            after: Position returned as the previous page's cursor
+            limit: Page size (None for all remaining rows)
+
+        Returns:
+            Tuple of (rows, cursor for the next page or None)
+        """
+        rows = self.file_order(rows)
+        if after is not None:
+            rows = rows[np.searchsorted(self._columns['seq'][rows], after, 'right'):]
+        if limit is None or len(rows) <= limit:
+            return rows, None
+        rows = rows[:limit]
+        return rows, int(self._columns['seq'][rows[-1]])
+
+    def frame(self, rows: np.ndarray, order: str = 'store',
+              columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        Decode rows into a matches DataFrame
+
+        Args:
+            rows: Row positions (e.g. from query_rows)
+            order: 'store' keeps (league, season, date) order, 'file' restores
+                the order matches appear in the source file within each season,
+                'rows' keeps the given order
+            columns: Subset of MATCH_COLUMNS to decode (default: all)
+        """
+        if order == 'file':
+            rows = self.file_order(rows)
+        names = MATCH_COLUMNS if columns is None else [name for name in MATCH_COLUMNS if name in columns]
+        if not len(rows):
+            return pd.DataFrame(columns=names)
+
+        stored = self._columns
+        decoders = {
+            'time': lambda: _decode(stored['time'][rows], self._labels['time']),
+            'round': lambda: _decode(stored['round'][rows], self._labels['round']),
+            'team1': lambda: _decode(stored['team1'][rows], self.teams),
+            'team2': lambda: _decode(stored['team2'][rows], self.teams),
+            'league': lambda: _decode(stored['league'][rows], self.leagues),
+            'season': lambda: _decode(stored['season'][rows], self.seasons),
+        }
+        data = {}
+        for name in names:
+            if name == 'date':
+                dates = stored['date'][rows]
+                data[name] = np.where(np.isnat(dates), None,
+                                      np.datetime_as_string(dates, unit='D').astype(object))
+            elif name in SCORE_COLUMNS:
+                data[name] = _decode_scores(stored[name][rows])
+            else:
+                data[name] = decoders[name]()
+        return pd.DataFrame(data, columns=names)
+
+    def query(self, league: Optional[str] = None, season: Optional[str] = None,
+              order: str = 'store', columns: Optional[List[str]] = None, **filters) -> pd.DataFrame:
+        """
+        Matches as a DataFrame (see query_rows for the filters)
+        """
+        return self.frame(self.query_rows(league, season, **filters), order=order, columns=columns)
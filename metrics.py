@@ -0,0 +1,202 @@
+"""
+Request Metrics in Prometheus Text Format
+Per-route latency histograms, request and error counts, response sizes
+and cache hit ratios, recorded in-process (a few microseconds and one
+short lock per request) and rendered for /metrics
+"""
+
+import bisect
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Optional
+
+from flask import Flask, g, request
+
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _labels(**labels) -> str:
+    return ','.join(f'{name}="{_escape(str(value))}"' for name, value in labels.items())
+
+
+def _number(value: float) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Histogram:
+    """Cumulative-bucket histogram (Prometheus semantics: bucket le=b counts values <= b)"""
+
+    def __init__(self, buckets: Iterable[float]):
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * (len(self.buckets) + 1)  # Last slot: above the largest bucket
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def lines(self, name: str, labels: str) -> List[str]:
+        prefix = labels + ',' if labels else ''
+        lines, cumulative = [], 0
+        for bound, count in zip(self.buckets, self.counts):
+            cumulative += count
+            lines.append(f'{name}_bucket{{{prefix}le="{bound:g}"}} {cumulative}')
+        lines.append(f'{name}_bucket{{{prefix}le="+Inf"}} {self.count}')
+        lines.append(f'{name}_sum{{{labels}}} {self.sum!r}')
+        lines.append(f'{name}_count{{{labels}}} {self.count}')
+        return lines
+
+
+class _RouteStats:
+    __slots__ = ('latency', 'size', 'statuses', 'errors')
+
+    def __init__(self, latency_buckets, size_buckets):
+        self.latency = Histogram(latency_buckets)
+        self.size = Histogram(size_buckets)
+        self.statuses = {}  # status code -> count
+        self.errors = 0
+
+
+class RequestMetrics:
+    """
+    Registry of request and cache metrics for one process
+
+    Each worker of a preforking server keeps its own registry, so
+    /metrics reports the worker that answered the scrape.
+
+    Args:
+        namespace: Prefix for every metric name
+        latency_buckets: Upper bounds (seconds) of the latency histogram
+        size_buckets: Upper bounds (bytes) of the response size histogram
+    """
+
+    def __init__(self, namespace: str = 'football',
+                 latency_buckets: Iterable[float] = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 5),
+                 size_buckets: Iterable[float] = (256, 1024, 4096, 16384, 65536, 262144, 1048576)):
+        self.namespace = namespace
+        self.latency_buckets = tuple(latency_buckets)
+        self.size_buckets = tuple(size_buckets)
+        self._routes = {}  # (route, method) -> _RouteStats
+        self._caches = {}  # name -> stats callable
+        self._lock = threading.Lock()
+
+    # -- recording -----------------------------------------------------
+
+    def observe(self, route: str, method: str, status: int, seconds: float, size: Optional[int]):
+        """Record one finished request (size None: streamed, not measured)"""
+        key = (route, method)
+        with self._lock:
+            stats = self._routes.get(key)
+            if stats is None:
+                stats = self._routes[key] = _RouteStats(self.latency_buckets, self.size_buckets)
+            stats.latency.observe(seconds)
+            if size is not None:
+                stats.size.observe(size)
+            stats.statuses[status] = stats.statuses.get(status, 0) + 1
+            if status >= 500:
+                stats.errors += 1
+
+    def register_cache(self, name: str, stats: Callable[[], Optional[Dict[str, int]]]):
+        """
+        Report a cache's counters
+
+        Args:
+            name: Value of the `cache` label
+            stats: Returns TTLCache.stats()-style counters, or None to skip
+                (e.g. while the owning object has not been created yet)
+        """
+        self._caches[name] = stats
+
+    def init_app(self, app: Flask):
+        """Time every request handled by `app`"""
+
+        @app.before_request
+        def _start_timer():
+            g._metrics_start = time.perf_counter()
+
+        @app.after_request
+        def _record(response):
+            start = g.pop('_metrics_start', None)
+            if start is not None:
+                # Unmatched URLs share one label so 404 scans cannot grow the registry
+                route = request.url_rule.rule if request.url_rule is not None else '<unmatched>'
+                size = None if response.is_streamed else response.calculate_content_length()
+                self.observe(route, request.method, response.status_code,
+                             time.perf_counter() - start, size)
+            return response
+
+    # -- rendering -----------------------------------------------------
+
+    def _route_lines(self) -> List[str]:
+        ns = self.namespace
+        with self._lock:
+            routes = sorted(self._routes.items())
+            snapshot = [(key, dict(stats.statuses), stats.errors,
+                         stats.latency.lines(f'{ns}_http_request_duration_seconds', _labels(route=key[0], method=key[1])),
+                         stats.size.lines(f'{ns}_http_response_size_bytes', _labels(route=key[0], method=key[1])))
+                        for key, stats in routes]
+
+        requests_total = [f'# HELP {ns}_http_requests_total Requests handled, by route, method and status',
+                          f'# TYPE {ns}_http_requests_total counter']
+        errors_total = [f'# HELP {ns}_http_request_errors_total Requests answered with a 5xx status',
+                        f'# TYPE {ns}_http_request_errors_total counter']
+        latency = [f'# HELP {ns}_http_request_duration_seconds Time spent in the Flask app per request',
+                   f'# TYPE {ns}_http_request_duration_seconds histogram']
+        size = [f'# HELP {ns}_http_response_size_bytes Response body size (streamed responses excluded)',
+                f'# TYPE {ns}_http_response_size_bytes histogram']
+        for (route, method), statuses, errors, latency_lines, size_lines in snapshot:
+            for status, count in sorted(statuses.items()):
+                requests_total.append(f'{ns}_http_requests_total{{{_labels(route=route, method=method, status=status)}}} {count}')
+            errors_total.append(f'{ns}_http_request_errors_total{{{_labels(route=route, method=method)}}} {errors}')
+            latency.extend(latency_lines)
+            size.extend(size_lines)
+        return requests_total + errors_total + latency + size
+
+    def _cache_lines(self) -> List[str]:
+        ns = self.namespace
+        series = {
+            'hits_total': ('counter', 'Cache lookups that found a live entry'),
+            'misses_total': ('counter', 'Cache lookups that found nothing'),
+            'evictions_total': ('counter', 'Entries evicted to stay within size limits'),
+            'entries': ('gauge', 'Entries currently cached'),
+            'bytes': ('gauge', 'Estimated bytes currently cached'),
+            'hit_ratio': ('gauge', 'hits / (hits + misses) since start'),
+        }
+        values = {name: [] for name in series}
+        for cache, stats_fn in sorted(self._caches.items()):
+            try:
+                stats = stats_fn()
+            except Exception:
+                stats = None
+            if not stats:
+                continue
+            lookups = stats.get('hits', 0) + stats.get('misses', 0)
+            label = _labels(cache=cache)
+            values['hits_total'].append((label, stats.get('hits', 0)))
+            values['misses_total'].append((label, stats.get('misses', 0)))
+            values['evictions_total'].append((label, stats.get('evictions', 0)))
+            values['entries'].append((label, stats.get('entries', 0)))
+            values['bytes'].append((label, stats.get('bytes', 0)))
+            values['hit_ratio'].append((label, stats.get('hits', 0) / lookups if lookups else 0.0))
+
+        lines = []
+        for name, (kind, help_text) in series.items():
+            lines.append(f'# HELP {ns}_cache_{name} {help_text}')
+            lines.append(f'# TYPE {ns}_cache_{name} {kind}')
+            lines.extend(f'{ns}_cache_{name}{{{label}}} {_number(value)}' for label, value in values[name])
+        return lines
+
+    def render(self) -> str:
+        """All metrics in the Prometheus text exposition format"""
+        return '\n'.join(self._route_lines() + self._cache_lines()) + '\n'
+
+    def reset(self):
+        with self._lock:
+            self._routes.clear()
@@ -0,0 +1,86 @@
+"""
+Normalized Player Name Index
+Maps case/accent/whitespace-insensitive player names to the canonical
+name, row positions and photo URL so lookups are O(1)
+"""
+
+import unicodedata
+import numpy as np
+import pandas as pd
+from typing import Dict, List, Optional
+
+
+# Letters like 'Ø' / 'ß' have no combining-mark decomposition
+_SPECIAL_LETTERS = str.maketrans({
+    'Ø': 'O', 'ø': 'o', 'Đ': 'D', 'đ': 'd', 'Ł': 'L', 'ł': 'l',
+    'Æ': 'Ae', 'æ': 'ae', 'Œ': 'Oe', 'œ': 'oe', 'ß': 'ss', 'ı': 'i',
+})
+
+
+def normalize_name(name: str) -> str:
+    """
+    Casefold, strip accents and collapse whitespace
+    ('  Martin Ødegaard ' and 'martin odegaard' normalize to the same key)
+    """
+    decomposed = unicodedata.normalize('NFKD', str(name))
+    stripped = ''.join(c for c in decomposed if unicodedata.category(c) != 'Mn')
+    stripped = stripped.translate(_SPECIAL_LETTERS)
+    return ' '.join(stripped.casefold().split())
+
+
+class PlayerEntry:
+    """One player in the index"""
+
+    __slots__ = ('key', 'name', 'rows', 'photo_url')
+
+    def __init__(self, key: str, name: str, rows: np.ndarray, photo_url: Optional[str]):
+        self.key = key              # Stripped name, as used by the stats table
+        self.name = name            # Name exactly as it appears in the data
+        self.rows = rows            # Row positions in the snapshot DataFrame
+        self.photo_url = photo_url
+
+
+class PlayerNameIndex:
+    """
+    Player lookup shared by the player page, stats API and photo lookup
+    """
+
+    def __init__(self, df: Optional[pd.DataFrame], photos: Optional[Dict[str, str]] = None):
+        self._photos = {}
+        for photo_name, url in (photos or {}).items():
+            self._photos.setdefault(normalize_name(photo_name), url)
+        self._photos_exact = dict(photos or {})
+
+        self._exact = {}
+        self._normalized = {}
+        if df is None or df.empty:
+            return
+
+        keys = df['player_name'].str.strip()
+        names = df['player_name'].to_numpy()
+        for key, rows in df.groupby(keys, sort=False).indices.items():
+            name = str(names[rows[0]])
+            entry = PlayerEntry(key, name, rows, self.photo_url(name))
+            self._exact[key] = entry
+            self._normalized.setdefault(normalize_name(key), entry)
+
+    def __len__(self):
+        return len(self._exact)
+
+    def canonical_names(self) -> List[str]:
+        """Every player name as it appears in the data (one per player)"""
+        return [entry.name for entry in self._exact.values()]
+
+    def lookup(self, player_name: str) -> Optional[PlayerEntry]:
+        """Exact (stripped) match first, then normalized match"""
+        entry = self._exact.get(player_name.strip())
+        if entry is None:
+            entry = self._normalized.get(normalize_name(player_name))
+        return entry
+
+    def photo_url(self, player_name: str) -> Optional[str]:
+        """Photo URL for a player, None if we have no photo"""
+        url = self._photos_exact.get(player_name)
+        if url is None:
+            url = self._photos.get(normalize_name(player_name))
+        return url
@@ -0,0 +1,179 @@
+"""
+Local Mirror of the OpenFootball JSON Repository
+Downloads every season x league file from openfootball/football.json into
+<mirror_dir>/<season>/<code>.json so request handlers never depend on GitHub.
+
+Usage:
+    python openfootball_mirror.py                      # all seasons, all leagues
+    python openfootball_mirror.py --seasons 2024-25 --leagues en.1 de.1
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+import config
+
+
+OPENFOOTBALL_URL = "https://raw.githubusercontent.com/openfootball/football.json/master"
+MANIFEST_FILE = 'manifest.json'
+
+
+def mirror_path(mirror_dir: str, season: str, league_code: str) -> str:
+    """Location of a league/season file inside the mirror"""
+    return os.path.join(mirror_dir, season, f"{league_code}.json")
+
+
+def read_mirror(mirror_dir: str, season: str, league_code: str) -> Optional[bytes]:
+    """
+    Raw JSON for a league/season from the mirror (or a bundled file)
+
+    Returns:
+        File contents, or None if neither the mirror nor the repo has a copy
+    """
+    candidates = [mirror_path(mirror_dir, season, league_code)]
+    bundled = config.MIRROR_CONFIG['bundled_files'].get((season, league_code))
+    if bundled:
+        candidates.append(bundled)
+
+    for path in candidates:
+        try:
+            with open(path, 'rb') as f:
+                return f.read()
+        except OSError:
+            continue
+    return None
+
+
+def _write_atomic(path: str, body: bytes):
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(body)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+def _load_manifest(mirror_dir: str) -> Dict[str, Dict]:
+    try:
+        with open(os.path.join(mirror_dir, MANIFEST_FILE), 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def sync_mirror(mirror_dir: Optional[str] = None, seasons: Optional[Iterable[str]] = None,
+                league_codes: Optional[Iterable[str]] = None, base_url: str = OPENFOOTBALL_URL,
+                max_workers: Optional[int] = None, session: Optional[requests.Session] = None) -> Dict[str, int]:
+    """
+    Bring the mirror up to date with the remote repository
+
+    Files already mirrored are revalidated with their ETag and only rewritten
+    when the remote copy changed. League/season combinations that do not
+    exist upstream (404) are skipped.
+
+    Args:
+        mirror_dir: Target directory (default: config.MIRROR_CONFIG)
+        seasons: Seasons to mirror (default: config.SEASONS)
+        league_codes: League codes to mirror (default: every FootballJSONLoader league)
+        base_url: Root of the football.json tree
+        max_workers: Concurrent downloads
+        session: requests.Session to use (a new pooled one by default)
+
+    Returns:
+        Counts of 'downloaded', 'unchanged', 'missing' and 'failed' files
+    """
+    if mirror_dir is None:
+        mirror_dir = config.MIRROR_CONFIG['mirror_dir']
+    if seasons is None:
+        seasons = config.SEASONS
+    if league_codes is None:
+        from football_json_loader import FootballJSONLoader
+        league_codes = [info['code'] for info in FootballJSONLoader.LEAGUES.values()]
+    if max_workers is None:
+        max_workers = config.MIRROR_CONFIG['max_workers']
+    if session is None:
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_maxsize=max_workers)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+    timeout = config.MIRROR_CONFIG['timeout']
+
+    os.makedirs(mirror_dir, exist_ok=True)
+    manifest = _load_manifest(mirror_dir)
+    manifest_lock = threading.Lock()
+    counts = {'downloaded': 0, 'unchanged': 0, 'missing': 0, 'failed': 0}
+
+    def sync_one(job):
+        season, code = job
+        key = f"{season}/{code}.json"
+        path = mirror_path(mirror_dir, season, code)
+        headers = {}
+        etag = manifest.get(key, {}).get('etag')
+        if etag and os.path.exists(path):
+            headers['If-None-Match'] = etag
+
+        try:
+            response = session.get(f"{base_url}/{key}", headers=headers, timeout=timeout)
+            if response.status_code == 304:
+                return 'unchanged'
+            if response.status_code == 404:
+                return 'missing'
+            response.raise_for_status()
+        except requests.exceptions.RequestException as e:
+            print(f"   ❌ {key}: {e}")
+            return 'failed'
+
+        body = response.content
+        sha1 = hashlib.sha1(body).hexdigest()
+        with manifest_lock:
+            entry = manifest.get(key, {})
+        if entry.get('sha1') == sha1 and os.path.exists(path):
+            status = 'unchanged'
+        else:
+            _write_atomic(path, body)
+            status = 'downloaded'
+        with manifest_lock:
+            manifest[key] = {'etag': response.headers.get('ETag'), 'sha1': sha1}
+        return status
+
+    jobs = [(season, code) for season in seasons for code in league_codes]
+    print(f"📥 Syncing {len(jobs)} files into {mirror_dir}...")
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='mirror-sync') as pool:
+        for status in pool.map(sync_one, jobs):
+            counts[status] += 1
+
+    _write_atomic(os.path.join(mirror_dir, MANIFEST_FILE),
+                  json.dumps(manifest, indent=2, sort_keys=True).encode('utf-8'))
+    print(f"✅ {counts['downloaded']} downloaded, {counts['unchanged']} unchanged, "
+          f"{counts['missing']} not published, {counts['failed']} failed")
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Mirror openfootball/football.json locally')
+    parser.add_argument('--dir', default=config.MIRROR_CONFIG['mirror_dir'], help='Mirror directory')
+    parser.add_argument('--seasons', nargs='+', default=config.SEASONS, help='Seasons to mirror')
+    parser.add_argument('--leagues', nargs='+', default=None, help='League codes (e.g. en.1 de.1)')
+    parser.add_argument('--workers', type=int, default=config.MIRROR_CONFIG['max_workers'])
+    args = parser.parse_args()
+
+    counts = sync_mirror(args.dir, args.seasons, args.leagues, max_workers=args.workers)
+    return 1 if counts['failed'] else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
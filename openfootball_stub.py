@@ -0,0 +1,151 @@
+"""
+Local Stand-In for the OpenFootball Server
+Serves recorded league JSON over HTTP (with ETag/Last-Modified support and
+optional injected latency) so tests and benchmarks never touch GitHub
+"""
+
+import hashlib
+import socket
+import threading
+import time
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional
+
+
+class _TrackingHTTPServer(ThreadingHTTPServer):
+    """Remembers open connections so stop() can drop keep-alive clients too"""
+
+    daemon_threads = True
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.connections = set()
+        self.connections_opened = 0
+
+    def process_request(self, request, client_address):
+        self.connections.add(request)
+        self.connections_opened += 1
+        super().process_request(request, client_address)
+
+    def shutdown_request(self, request):
+        self.connections.discard(request)
+        super().shutdown_request(request)
+
+
+class StubOpenFootballServer:
+    """
+    Threaded HTTP server serving `files` (URL path -> body bytes)
+
+    Usage:
+        with StubOpenFootballServer({'/2024-25/en.1.json': body}) as server:
+            loader.BASE_URL = server.base_url
+
+    Args:
+        files: Mapping of URL path to response body
+        latency: Seconds to sleep before answering each request
+    """
+
+    def __init__(self, files: Optional[Dict[str, bytes]] = None, latency: float = 0.0):
+        self.files = dict(files or {})
+        self.latency = latency
+        self.requests = []  # (method, path, status) for every request served
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+        self._last_modified = formatdate(time.time(), usegmt=True)
+        self._server = None
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def connections_opened(self) -> int:
+        """TCP connections accepted so far (lower than requests when keep-alive works)"""
+        return self._server.connections_opened
+
+    def set_file(self, path: str, body: bytes):
+        """Add or replace a file (changes its ETag)"""
+        with self._lock:
+            self.files[path] = body
+            self._last_modified = formatdate(time.time(), usegmt=True)
+
+    def _handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self):
+                with stub._lock:
+                    stub.active += 1
+                    stub.max_active = max(stub.max_active, stub.active)
+                try:
+                    if stub.latency:
+                        time.sleep(stub.latency)
+                    self._respond()
+                finally:
+                    with stub._lock:
+                        stub.active -= 1
+
+            def _start(self, status: int):
+                # Recorded before the client can see the response, so tests never race it
+                with stub._lock:
+                    stub.requests.append(('GET', self.path, status))
+                self.send_response(status)
+
+            def _respond(self) -> int:
+                body = stub.files.get(self.path)
+                if body is None:
+                    self._start(404)
+                    self.send_header('Content-Length', '0')
+                    self.end_headers()
+                    return 404
+
+                etag = '"' + hashlib.sha1(body).hexdigest() + '"'
+                if self.headers.get('If-None-Match') == etag:
+                    self._start(304)
+                    self.send_header('ETag', etag)
+                    self.send_header('Content-Length', '0')
+                    self.end_headers()
+                    return 304
+
+                self._start(200)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.send_header('ETag', etag)
+                self.send_header('Last-Modified', stub._last_modified)
+                self.end_headers()
+                self.wfile.write(body)
+                return 200
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def start(self):
+        self._server = _TrackingHTTPServer(('127.0.0.1', 0), self._handler())
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            for connection in list(self._server.connections):
+                try:
+                    connection.shutdown(socket.SHUT_RDWR)
+                except OSError:
+                    pass
+            self._server = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
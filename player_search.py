@@ -0,0 +1,138 @@
+"""
+Player Name Autocomplete
+Prefix trie plus a character trigram index for typo-tolerant matches,
+built once per data snapshot
+"""
+
+import numpy as np
+from typing import Dict, Iterable, List
+
+from name_index import normalize_name
+
+
+# Each trie node keeps at most this many full-name and this many word-prefix
+# candidates, which bounds both memory and the work done per query regardless
+# of how many players share a prefix
+MAX_NODE_CANDIDATES = 64
+MAX_LIMIT = 50
+
+# Minimum share of the query's trigrams a name must contain to be a fuzzy match
+MIN_FUZZY_SCORE = 0.5
+
+
+def _trigrams(text: str) -> set:
+    """Trigrams of each word padded with spaces (' ha', 'haa', ..., 'nd ')"""
+    grams = set()
+    for word in text.split(' '):
+        padded = f" {word} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+class _TrieNode:
+    __slots__ = ('children', 'name_ids', 'word_ids')
+
+    def __init__(self):
+        self.children = {}
+        self.name_ids = []  # Names whose full name starts with this prefix
+        self.word_ids = []  # Names with a later word starting with it
+
+
+class PlayerSearchIndex:
+    """
+    Autocomplete over player names
+
+    Queries match the start of the full name or of any word in it
+    ('haal' finds 'Erling Haaland'); when that yields fewer than `limit`
+    results the trigram index fills the rest with close spellings
+    ('halaand' also finds 'Erling Haaland').
+    """
+
+    def __init__(self, names: Iterable[str]):
+        self.names = sorted(set(names))
+        self._normalized = [normalize_name(name) for name in self.names]
+        self._root = _TrieNode()
+        grams: Dict[str, List[int]] = {}
+
+        # Names are inserted alphabetically so each node's capped lists keep
+        # the alphabetically first candidates. Full-name and word-prefix
+        # matches are capped separately, so word matches can never crowd out
+        # a name that starts with the query
+        for name_id, normalized in enumerate(self._normalized):
+            self._insert(normalized, name_id, full_name=True)
+            offset = 0
+            for word in normalized.split(' ')[:-1]:
+                offset += len(word) + 1
+                self._insert(normalized[offset:], name_id, full_name=False)
+
+            for gram in _trigrams(normalized):
+                grams.setdefault(gram, []).append(name_id)
+
+        self._grams = {gram: np.array(ids, dtype=np.int32) for gram, ids in grams.items()}
+        self._lengths = np.array([len(name) for name in self._normalized], dtype=np.int32)
+
+    def __len__(self):
+        return len(self.names)
+
+    def _insert(self, text: str, name_id: int, full_name: bool):
+        node = self._root
+        for char in text:
+            child = node.children.get(char)
+            if child is None:
+                child = node.children[char] = _TrieNode()
+            node = child
+            ids = node.name_ids if full_name else node.word_ids
+            if len(ids) < MAX_NODE_CANDIDATES and (not ids or ids[-1] != name_id):
+                ids.append(name_id)
+
+    def _prefix_matches(self, query: str) -> List[int]:
+        """Names starting with the query, then names with a word starting with it"""
+        node = self._root
+        for char in query:
+            node = node.children.get(char)
+            if node is None:
+                return []
+        full = set(node.name_ids)
+        return node.name_ids + [i for i in node.word_ids if i not in full]
+
+    def _fuzzy_matches(self, query: str, limit: int, exclude: set) -> List[int]:
+        grams = _trigrams(query)
+        postings = [self._grams[gram] for gram in grams if gram in self._grams]
+        if not postings:
+            return []
+
+        # Count shared trigrams for every name at once
+        overlap = np.bincount(np.concatenate(postings), minlength=len(self.names))
+        candidates = np.flatnonzero(overlap >= MIN_FUZZY_SCORE * len(grams))
+        if exclude:
+            candidates = candidates[~np.isin(candidates, list(exclude))]
+        if len(candidates) == 0:
+            return []
+
+        # Most shared trigrams first, then shorter names, then alphabetical
+        order = np.lexsort((candidates, self._lengths[candidates], -overlap[candidates]))
+        return candidates[order[:limit]].tolist()
+
+    def search(self, query: str, limit: int = 8) -> List[str]:
+        """
+        Find player names matching a (partial, possibly misspelled) query
+
+        Args:
+            query: Text typed by the user
+            limit: Maximum number of names to return (capped at MAX_LIMIT)
+
+        Returns:
+            Matching canonical player names, best matches first
+        """
+        query = normalize_name(query)
+        limit = max(1, min(limit, MAX_LIMIT))
+        if not query:
+            return []
+
+        # Names that start with the query rank before word-prefix matches
+        results = self._prefix_matches(query)[:limit]
+
+        if len(results) < limit and len(query) >= 3:
+            results += self._fuzzy_matches(query, limit - len(results), set(results))
+
+        return [self.names[i] for i in results]
@@ -0,0 +1,157 @@
+"""
+Precomputed Per-Player Aggregates
+Builds the /api/player payload for every player in one vectorized pass,
+so serving a player becomes a dictionary lookup
+"""
+
+import pandas as pd
+from typing import Dict, Optional
+
+
+# Columns summed / averaged per player
+SUM_COLUMNS = [
+    'goals', 'assists', 'shots', 'shots_on_target', 'passes_completed',
+    'tackles', 'interceptions',
+]
+MEAN_COLUMNS = [
+    'performance_rating', 'goals', 'assists', 'shots', 'shots_on_target',
+    'passes_completed', 'pass_accuracy', 'tackles', 'interceptions', 'dribbles_completed',
+]
+
+# Per-player profile columns (taken from the player's first row)
+PROFILE_COLUMNS = [
+    'player_name', 'full_name', 'birth_date', 'age', 'height_cm', 'weight_kg', 'nationality',
+    'position', 'preferred_foot', 'market_value_euro', 'team', 'Appearances',
+]
+
+RECENT_MATCHES = 10
+
+
+def _safe_str(val):
+    if pd.isna(val) or val is None or str(val).strip() in ['', 'nan', 'NaN', 'None']:
+        return ''
+    return str(val).strip()
+
+
+def _safe_int(val):
+    try:
+        if pd.isna(val) or val is None or val == '':
+            return 0
+        return int(float(val))
+    except:
+        return 0
+
+
+def _safe_float(val):
+    try:
+        if pd.isna(val) or val is None or val == '':
+            return 0.0
+        return float(val)
+    except:
+        return 0.0
+
+
+class PlayerStatsTable:
+    """
+    Player name -> precomputed stats payload (everything except the photo URL)
+    """
+
+    def __init__(self, stats: Dict[str, dict]):
+        self.stats = stats
+
+    def __len__(self):
+        return len(self.stats)
+
+    def get(self, key: str) -> Optional[dict]:
+        """Payload for a stripped player name (see PlayerNameIndex.lookup)"""
+        return self.stats.get(key)
+
+
+def build_player_stats(df: pd.DataFrame) -> PlayerStatsTable:
+    """
+    Aggregate every player's rows into the /api/player response payload
+
+    Args:
+        df: Player data (one or more rows per player)
+
+    Returns:
+        PlayerStatsTable keyed by stripped player name
+    """
+    if df is None or df.empty:
+        return PlayerStatsTable({})
+
+    keys = df['player_name'].str.strip()
+    grouped = df.groupby(keys, sort=False)
+
+    sums = grouped[SUM_COLUMNS].sum()
+    means = grouped[MEAN_COLUMNS].mean()
+    profiles = grouped[[name for name in PROFILE_COLUMNS if name in df]].first()
+    positions = grouped.indices
+
+    # Recent matches for every player in one fillna/to_dict call
+    recent_df = grouped.head(RECENT_MATCHES)
+    recent_keys = keys.loc[recent_df.index].tolist()
+    recent_records = recent_df.fillna('').to_dict('records')
+    recent_matches = {}
+    for key, record in zip(recent_keys, recent_records):
+        recent_matches.setdefault(key, []).append(record)
+
+    match_ids = df['match_id'].to_numpy()
+    ratings = df['performance_rating'].to_numpy()
+
+    sums_records = sums.to_dict('index')
+    # Rounded column-wise with NumPy, as the per-request code did on NumPy scalars
+    means_2dp = means.round(2).to_dict('index')
+    means_1dp = means.round(1).to_dict('index')
+    shot_accuracy = (sums['shots_on_target'] / sums['shots'].clip(lower=1) * 100).round(1).to_dict()
+    profile_records = profiles.to_dict('index')
+
+    stats = {}
+    for key, rows in positions.items():
+        profile = profile_records[key]
+        actual_player_name = str(profile['player_name'])
+        total = sums_records[key]
+        mean, mean_1dp = means_2dp[key], means_1dp[key]
+
+        stats[key] = {
+            'player_name': actual_player_name,
+            'full_name': _safe_str(profile.get('full_name')) or actual_player_name,
+            'birth_date': _safe_str(profile.get('birth_date')),
+            'age': _safe_int(profile.get('age')),
+            'height_cm': f"{_safe_int(profile.get('height_cm'))} cm",
+            'weight_kg': f"{_safe_int(profile.get('weight_kg'))} kg",
+            'nationality': _safe_str(profile.get('nationality')) or 'Unknown',
+            'position': _safe_str(profile.get('position')) or 'Unknown',
+            'positions_full': _safe_str(profile.get('position')) or 'Unknown',
+            'preferred_foot': _safe_str(profile.get('preferred_foot')) or 'Unknown',
+            'overall_rating': _safe_int(_safe_float(profile.get('market_value_euro')) / 5000000),
+            'current_team': _safe_str(profile.get('team')) or 'Unknown',
+            'total_matches': _safe_int(profile.get('Appearances')) or 35,
+            'avg_performance': mean['performance_rating'],
+            'total_goals': int(total['goals']),
+            'total_assists': int(total['assists']),
+            'avg_shots': mean['shots'],
+            'shot_accuracy': shot_accuracy[key],
+            'total_passes': int(total['passes_completed']),
+            'avg_pass_accuracy': mean_1dp['pass_accuracy'],
+            'avg_passes_per_match': mean_1dp['passes_completed'],
+            'total_tackles': int(total['tackles']),
+            'total_interceptions': int(total['interceptions']),
+            'avg_dribbles': mean['dribbles_completed'],
+            'radar_stats': {
+                'goals': mean['goals'],
+                'assists': mean['assists'],
+                'shots_on_target': mean['shots_on_target'],
+                'pass_accuracy': mean['pass_accuracy'],
+                'tackles': mean['tackles'],
+                'interceptions': mean['interceptions'],
+                'dribbles_completed': mean['dribbles_completed'],
+            },
+            'performance_trend': {
+                'matches': match_ids[rows].tolist(),
+                'ratings': ratings[rows].tolist(),
+            },
+            'recent_matches': recent_matches.get(key, []),
+        }
+
+    return PlayerStatsTable(stats)
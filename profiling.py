@@ -0,0 +1,164 @@
+"""
+On-Demand Request Profiling
+Runs cProfile around a sampled subset of requests (or any request carrying
+the admin header) and keeps each one's hottest functions in a ring buffer
+served at /debug/profiles. When disabled no hooks are installed at all.
+"""
+
+import cProfile
+import os
+import pstats
+import random
+import threading
+import time
+from collections import deque
+from typing import Dict, List, Optional
+
+from flask import Flask, g, request
+
+
+SORT_KEYS = {'cumulative': 3, 'tottime': 2, 'calls': 1}  # Index into the pstats tuple
+
+
+def _function_name(key) -> str:
+    filename, line, name = key
+    if filename == '~':  # Built-in
+        return name
+    return f"{os.path.relpath(filename) if filename.startswith(os.getcwd()) else filename}:{line}({name})"
+
+
+def hot_functions(profile: cProfile.Profile, top_n: int, sort_by: str = 'cumulative') -> List[Dict]:
+    """
+    Top-N functions of a finished profile
+
+    Args:
+        profile: Disabled profiler
+        top_n: Number of functions to keep
+        sort_by: 'cumulative', 'tottime' or 'calls'
+
+    Returns:
+        [{'function', 'calls', 'total_time', 'cumulative_time'}], hottest first
+    """
+    stats = pstats.Stats(profile).stats  # (file, line, name) -> (primitive calls, calls, tottime, cumtime, callers)
+    index = SORT_KEYS[sort_by]
+    rows = sorted(stats.items(), key=lambda item: item[1][index], reverse=True)[:top_n]
+    return [{'function': _function_name(key), 'calls': calls,
+             'total_time': round(tottime, 6), 'cumulative_time': round(cumtime, 6)}
+            for key, (_, calls, tottime, cumtime, _) in rows]
+
+
+class RequestProfiler:
+    """
+    Profiles sampled requests and keeps their summaries
+
+    A request is profiled when `enabled` and it falls in the `sample_rate`
+    sample, or when it sends `header` with the admin `token` (works even
+    while sampling is off). With neither configured, init_app() installs
+    nothing, so requests pay no cost.
+
+    Args:
+        enabled: Profile a random sample of all requests
+        sample_rate: Fraction of requests profiled when enabled
+        header: Request header that asks for a profile (value: the token)
+        token: Admin token for the header and /debug/profiles (None: both off)
+        top_n: Functions kept per profile
+        buffer_size: Profiles kept (oldest dropped first)
+        sort_by: 'cumulative', 'tottime' or 'calls'
+    """
+
+    def __init__(self, enabled: bool = False, sample_rate: float = 0.01, header: str = 'X-Profile',
+                 token: Optional[str] = None, top_n: int = 25, buffer_size: int = 50,
+                 sort_by: str = 'cumulative'):
+        if sort_by not in SORT_KEYS:
+            raise ValueError(f"Unknown sort_by '{sort_by}' (expected one of {', '.join(SORT_KEYS)})")
+        self.enabled = enabled
+        self.sample_rate = sample_rate
+        self.header = header
+        self.token = token
+        self.top_n = top_n
+        self.sort_by = sort_by
+        self._profiles = deque(maxlen=buffer_size)
+        self._lock = threading.Lock()
+        self._next_id = 0
+
+    @property
+    def active(self) -> bool:
+        """True if any request can be profiled"""
+        return (self.enabled and self.sample_rate > 0) or self.token is not None
+
+    def authorized(self) -> bool:
+        """
+        The current request carries the admin token in `header`
+        
+        Never read from the query string, which ends up in access logs and
+        in each profile's recorded path. Always False without a token.
+        """
+        return self.token is not None and request.headers.get(self.header) == self.token
+
+    def _wanted(self) -> bool:
+        if self.token is not None and request.headers.get(self.header) == self.token:
+            return True
+        return self.enabled and random.random() < self.sample_rate
+
+    def init_app(self, app: Flask):
+        """Install the profiling hooks on `app` (nothing when inactive)"""
+        if not self.active:
+            return
+
+        @app.before_request
+        def _start_profile():
+            if not self._wanted():
+                return
+            profile = cProfile.Profile()
+            try:
+                profile.enable()
+            except ValueError:  # Another profiler is already running in this thread
+                return
+            g._profile = (profile, time.perf_counter())
+
+        @app.after_request
+        def _finish_profile(response):
+            started = g.pop('_profile', None)
+            if started is not None:
+                profile_id = self._record(*started, status=response.status_code)
+                response.headers['X-Profile-Id'] = str(profile_id)
+            return response
+
+        @app.teardown_request
+        def _stop_profile(exc):
+            # Only reached with a profile still running if after_request was skipped
+            started = g.pop('_profile', None)
+            if started is not None:
+                started[0].disable()
+
+    def _record(self, profile: cProfile.Profile, start: float, status: int) -> int:
+        profile.disable()
+        elapsed = time.perf_counter() - start
+        functions = hot_functions(profile, self.top_n, self.sort_by)
+        with self._lock:
+            self._next_id += 1
+            profile_id = self._next_id
+            self._profiles.append({
+                'id': profile_id,
+                'route': request.url_rule.rule if request.url_rule is not None else None,
+                'method': request.method,
+                'path': request.full_path.rstrip('?'),
+                'status': status,
+                'duration_ms': round(elapsed * 1000, 3),
+                'timestamp': time.time(),
+                'functions': functions,
+            })
+        return profile_id
+
+    def profiles(self, route: Optional[str] = None, limit: Optional[int] = None) -> List[Dict]:
+        """Stored profiles, newest first (optionally for one route template)"""
+        with self._lock:
+            profiles = list(self._profiles)
+        profiles.reverse()
+        if route is not None:
+            profiles = [p for p in profiles if p['route'] == route]
+        return profiles[:limit] if limit is not None else profiles
+
+    def clear(self):
+        with self._lock:
+            self._profiles.clear()
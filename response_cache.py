@@ -0,0 +1,135 @@
+"""
+Server-Side Response Cache for Read-Only Endpoints
+Stores serialized (and gzip-compressed) response bodies keyed by route,
+arguments and data version, and answers conditional requests with 304
+"""
+
+import gzip
+import hashlib
+from functools import wraps
+from typing import Callable, Optional
+
+from flask import Response, make_response, request
+
+from cache import TTLCache
+
+
+class CachedBody:
+    """A serialized 200 response plus its compressed form and strong ETag"""
+
+    __slots__ = ('body', 'gzipped', 'mimetype', 'etag')
+
+    def __init__(self, body: bytes, mimetype: str, compress: bool = True,
+                 min_size: int = 1024, level: int = 6):
+        self.body = body
+        self.mimetype = mimetype
+        self.etag = hashlib.sha1(body).hexdigest()
+        self.gzipped = None
+        if compress and len(body) >= min_size:
+            gzipped = gzip.compress(body, compresslevel=level, mtime=0)
+            if len(gzipped) < len(body):
+                self.gzipped = gzipped
+
+    def size(self) -> int:
+        return len(self.body) + (len(self.gzipped) if self.gzipped else 0)
+
+    def respond(self) -> Response:
+        """Response for the current request (304, gzip or identity)"""
+        use_gzip = self.gzipped is not None and 'gzip' in request.headers.get('Accept-Encoding', '')
+        # Each encoding is a different representation, so it gets its own strong ETag
+        etag = f'"{self.etag}-gzip"' if use_gzip else f'"{self.etag}"'
+
+        if _etag_matches(request.headers.get('If-None-Match'), self.etag):
+            response = Response(status=304)
+        else:
+            response = Response(self.gzipped if use_gzip else self.body, mimetype=self.mimetype)
+            if use_gzip:
+                response.headers['Content-Encoding'] = 'gzip'
+        response.headers['ETag'] = etag
+        response.headers['Cache-Control'] = 'no-cache'  # Always revalidate; a 304 is nearly free
+        if self.gzipped is not None:
+            response.headers['Vary'] = 'Accept-Encoding'
+        return response
+
+
+def _etag_matches(header: Optional[str], digest: str) -> bool:
+    """Whether an If-None-Match header names either representation of `digest`"""
+    if not header:
+        return False
+    if header.strip() == '*':
+        return True
+    for tag in header.split(','):
+        tag = tag.strip()
+        if tag.startswith('W/'):
+            tag = tag[2:]
+        if tag in (f'"{digest}"', f'"{digest}-gzip"'):
+            return True
+    return False
+
+
+class ResponseCache:
+    """
+    Memoizes GET endpoints whose output depends only on their arguments
+    and a data version
+
+    Usage:
+        response_cache = ResponseCache(**config.RESPONSE_CACHE_CONFIG)
+
+        @app.route('/api/thing/<name>')
+        @response_cache.cached(lambda name: data_version())
+        def thing(name): ...
+
+    Args:
+        max_entries: Maximum cached responses
+        max_bytes: Byte budget for stored bodies (identity + gzip)
+        ttl: Seconds an entry lives (None: until evicted or the version changes)
+        compress: Also store a gzip-compressed body
+        min_compress_size: Smallest body worth compressing
+        compress_level: gzip compression level
+    """
+
+    def __init__(self, max_entries: int = 512, max_bytes: Optional[int] = None, ttl: Optional[float] = None,
+                 compress: bool = True, min_compress_size: int = 1024, compress_level: int = 6):
+        self.cache = TTLCache(max_entries=max_entries, max_bytes=max_bytes, ttl=ttl,
+                              sizeof=lambda entry: entry.size())
+        self.compress = compress
+        self.min_compress_size = min_compress_size
+        self.compress_level = compress_level
+
+    def cached(self, version: Callable[..., Optional[str]]):
+        """
+        Decorator caching a view's 200 responses
+
+        Args:
+            version: Called with the view's arguments; returns the version of
+                the data the response is built from (None: do not cache)
+        """
+        def decorator(view):
+            @wraps(view)
+            def wrapper(**kwargs):
+                try:
+                    data_version = version(**kwargs)
+                except Exception:
+                    data_version = None  # Let the view produce its own error response
+                if data_version is None:
+                    return view(**kwargs)
+
+                key = (request.endpoint, tuple(sorted(kwargs.items())),
+                       tuple(sorted(request.args.items(multi=True))), data_version)
+                entry = self.cache.get(key)
+                if entry is None:
+                    response = make_response(view(**kwargs))
+                    if response.status_code != 200 or response.direct_passthrough:
+                        return response
+                    entry = CachedBody(response.get_data(), response.mimetype, self.compress,
+                                       self.min_compress_size, self.compress_level)
+                    self.cache.set(key, entry)
+                return entry.respond()
+            return wrapper
+        return decorator
+
+    def clear(self):
+        self.cache.clear()
+
+    def stats(self):
+        return self.cache.stats()
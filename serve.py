@@ -0,0 +1,205 @@
+"""
+Built-In Preforking Server (for hosts without gunicorn)
+Loads all data once, opens the listening socket, then forks worker
+processes that accept on the shared socket, each serving requests from a
+bounded thread pool. Dead workers are replaced; SIGTERM/SIGINT stop all.
+
+Usage:
+    python serve.py                                   # settings from config.SERVER_CONFIG
+    python serve.py --bind 0.0.0.0:8080 --workers 4 --threads 8
+"""
+
+import argparse
+import os
+import signal
+import socket
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Tuple
+
+from werkzeug.serving import BaseWSGIServer
+
+import config
+
+
+# Sent straight from the accept loop when every thread is busy and the queue is full
+BUSY_RESPONSE = (b'HTTP/1.1 503 Service Unavailable\r\n'
+                 b'Content-Type: text/plain\r\n'
+                 b'Content-Length: 20\r\n'
+                 b'Retry-After: 1\r\n'
+                 b'Connection: close\r\n\r\n'
+                 b'Server busy, retry.\n')
+
+
+class PooledWSGIServer(BaseWSGIServer):
+    """
+    Werkzeug server handling connections on a fixed-size thread pool
+
+    A connection occupies a pool thread for as long as it stays open.
+    Werkzeug closes it after each response (no keep-alive), but a client
+    that connects and then stalls would hold the thread indefinitely, so
+    sockets get an idle timeout. At most `max_pending` connections wait for
+    a thread; past that new connections are answered 503 right away
+    instead of queueing without bound.
+
+    Args:
+        host: Address the server reports
+        port: Port the server reports
+        app: WSGI application
+        threads: Pool size
+        fd: Inherited listening socket
+        keepalive_timeout: Seconds a connection may sit idle or stall before it is closed
+        max_pending: Accepted connections allowed to wait for a free thread
+    """
+
+    multithread = True
+
+    def __init__(self, host: str, port: int, app, threads: int, fd: int = None,
+                 keepalive_timeout: Optional[float] = config.SERVER_CONFIG['keepalive_timeout'],
+                 max_pending: int = config.SERVER_CONFIG['max_pending']):
+        self._pool = None
+        super().__init__(host, port, app, fd=fd)  # Closes its own socket first when given fd
+        self.keepalive_timeout = keepalive_timeout
+        self._slots = threading.BoundedSemaphore(threads + max_pending)
+        self._pool = ThreadPoolExecutor(max_workers=threads, thread_name_prefix='request')
+
+    def process_request(self, request, client_address):
+        if not self._slots.acquire(blocking=False):
+            self._reject(request)
+            return
+        self._pool.submit(self._handle, request, client_address)
+
+    def _reject(self, request):
+        try:
+            request.settimeout(1)
+            request.sendall(BUSY_RESPONSE)
+        except OSError:
+            pass
+        finally:
+            self.shutdown_request(request)
+
+    def _handle(self, request, client_address):
+        try:
+            # Bounds the wait for a request that never arrives and any stalled read/write
+            request.settimeout(self.keepalive_timeout)
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+            self._slots.release()
+
+    def server_close(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=False)
+        super().server_close()
+
+
+def parse_bind(bind: str) -> Tuple[str, int]:
+    host, _, port = bind.rpartition(':')
+    return host or '0.0.0.0', int(port)
+
+
+def listen(host: str, port: int, backlog: int) -> socket.socket:
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(backlog)
+    sock.set_inheritable(True)
+    return sock
+
+
+def run_worker(sock: socket.socket, application, threads: int):
+    """Worker process body (never returns)"""
+    import wsgi
+
+    status = 1
+    try:
+        signal.signal(signal.SIGTERM, lambda *_: os._exit(0))
+        signal.signal(signal.SIGINT, signal.SIG_IGN)  # The master handles Ctrl+C
+        wsgi.post_fork()
+        host, port = sock.getsockname()[:2]
+        PooledWSGIServer(host, port, application, threads, fd=sock.fileno()).serve_forever()
+        status = 0
+    except BaseException:
+        import traceback
+        traceback.print_exc()
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os._exit(status)
+
+
+def serve(bind: str, workers: int, threads: int, backlog: int = 1024):
+    """
+    Preload, fork `workers` processes and supervise them until signalled
+    """
+    import wsgi
+
+    host, port = parse_bind(bind)
+    application = wsgi.application  # Importing wsgi preloads everything
+    sock = listen(host, port, backlog)
+
+    if not hasattr(os, 'fork'):
+        print("⚠️  fork() not available: serving from a single process")
+        wsgi.post_fork()
+        PooledWSGIServer(host, port, application, threads, fd=sock.fileno()).serve_forever()
+        return
+
+    children = set()
+    stopping = False
+
+    def spawn():
+        pid = os.fork()
+        if pid == 0:
+            run_worker(sock, application, threads)
+        children.add(pid)
+
+    def stop(signum, frame):
+        nonlocal stopping
+        stopping = True
+        for pid in list(children):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+
+    for _ in range(workers):
+        spawn()
+    print(f"🚀 Serving on http://{host}:{port} with {workers} workers x {threads} threads "
+          f"(master pid {os.getpid()})")
+    sys.stdout.flush()
+
+    while children:
+        try:
+            pid, status = os.wait()
+        except ChildProcessError:
+            break
+        except InterruptedError:
+            continue
+        children.discard(pid)
+        if not stopping:
+            print(f"⚠️  Worker {pid} exited (status {status}), starting a new one")
+            time.sleep(1)  # Avoid a tight loop if workers crash on start
+            spawn()
+    sock.close()
+
+
+def main():
+    settings = config.SERVER_CONFIG
+    parser = argparse.ArgumentParser(description='Preforking production server')
+    parser.add_argument('--bind', default=settings['bind'], help='host:port')
+    parser.add_argument('--workers', type=int, default=settings['workers'])
+    parser.add_argument('--threads', type=int, default=settings['threads'])
+    parser.add_argument('--backlog', type=int, default=settings['backlog'])
+    args = parser.parse_args()
+    serve(args.bind, args.workers, args.threads, args.backlog)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,506 @@
+"""
+Columnar Standings Engine
+Computes league tables from a matches DataFrame with NumPy instead of
+iterating over rows
+"""
+
+import bisect
+import numpy as np
+import pandas as pd
+from typing import Dict, List, Optional
+
+
+STANDINGS_COLUMNS = [
+    'team', 'played', 'wins', 'draws', 'losses',
+    'goals_for', 'goals_against', 'goal_difference', 'points',
+]
+
+
+def intern_teams(matches: pd.DataFrame):
+    """
+    Map team names to integer IDs in order of first appearance
+    (home team before away team within each match)
+
+    Returns:
+        Tuple of (home_ids, away_ids, team_names)
+    """
+    n = len(matches)
+    interleaved = np.empty(2 * n, dtype=object)
+    interleaved[0::2] = matches['team1'].to_numpy()
+    interleaved[1::2] = matches['team2'].to_numpy()
+    codes, teams = pd.factorize(interleaved)
+    return codes[0::2], codes[1::2], np.asarray(teams, dtype=object)
+
+
+def _goals_dtype(matches: pd.DataFrame):
+    """Goals keep the dtype of the score column (float when the season has unplayed matches)"""
+    dtype = matches['score1'].dtype
+    return dtype if dtype.kind in 'if' else np.int64
+
+
+def compute_standings(matches: pd.DataFrame, league_name: str, season: str) -> pd.DataFrame:
+    """
+    Calculate the league table from completed matches
+
+    Home and away results are stacked into one team-per-row array and
+    summed per interned team ID with np.bincount, so the cost is a handful
+    of array passes regardless of the number of matches.
+
+    Args:
+        matches: Matches DataFrame (team1, team2, score1, score2)
+        league_name: Name of the league
+        season: Season string
+
+    Returns:
+        DataFrame with team statistics sorted by points, goal difference, goals scored
+    """
+    if matches.empty:
+        return pd.DataFrame()
+
+    # Filter only completed matches (with scores)
+    matches = matches[matches['score1'].notna() & matches['score2'].notna()]
+
+    if matches.empty:
+        return pd.DataFrame()
+
+    home_ids, away_ids, teams = intern_teams(matches)
+    n_teams = len(teams)
+
+    score1 = matches['score1'].to_numpy()
+    score2 = matches['score2'].to_numpy()
+
+    team_ids = np.concatenate([home_ids, away_ids])
+    goals_for = np.concatenate([score1, score2])
+    goals_against = np.concatenate([score2, score1])
+
+    wins = np.bincount(team_ids[goals_for > goals_against], minlength=n_teams)
+    draws = np.bincount(team_ids[goals_for == goals_against], minlength=n_teams)
+    losses = np.bincount(team_ids[goals_for < goals_against], minlength=n_teams)
+
+    goals_dtype = _goals_dtype(matches)
+    total_for = np.bincount(team_ids, weights=goals_for, minlength=n_teams).astype(goals_dtype)
+    total_against = np.bincount(team_ids, weights=goals_against, minlength=n_teams).astype(goals_dtype)
+
+    stats_df = pd.DataFrame({
+        'team': teams,
+        'played': np.bincount(team_ids, minlength=n_teams),
+        'wins': wins,
+        'draws': draws,
+        'losses': losses,
+        'goals_for': total_for,
+        'goals_against': total_against,
+        'goal_difference': total_for - total_against,
+        'points': 3 * wins + draws,
+    }, columns=STANDINGS_COLUMNS)
+
+    stats_df = stats_df.sort_values(
+        ['points', 'goal_difference', 'goals_for'],
+        ascending=[False, False, False]
+    ).reset_index(drop=True)
+
+    # Add position
+    stats_df.insert(0, 'position', range(1, len(stats_df) + 1))
+
+    stats_df['league'] = league_name
+    stats_df['season'] = season
+
+    return stats_df
+
+
+def compute_form(matches: pd.DataFrame, last_n: int = 5) -> Dict[str, List[str]]:
+    """
+    Recent form ('W'/'D'/'L', oldest first) of every team in one pass
+
+    Each completed match contributes one row per team; rows are stably
+    sorted by team, and the last `last_n` rows of each team are kept.
+
+    Args:
+        matches: Matches DataFrame in chronological order
+        last_n: Number of recent matches per team
+
+    Returns:
+        Dictionary mapping every team in `matches` to its form list
+    """
+    if matches.empty:
+        return {}
+
+    home_ids, away_ids, teams = intern_teams(matches)
+    form = {team: [] for team in teams}
+    if last_n <= 0:
+        return form
+
+    completed = (matches['score1'].notna() & matches['score2'].notna()).to_numpy()
+    score1 = matches['score1'].to_numpy()[completed]
+    score2 = matches['score2'].to_numpy()[completed]
+    order = np.flatnonzero(completed)
+
+    team_ids = np.concatenate([home_ids[completed], away_ids[completed]])
+    match_order = np.concatenate([order, order])
+    goals_for = np.concatenate([score1, score2])
+    goals_against = np.concatenate([score2, score1])
+    results = np.where(goals_for > goals_against, 'W',
+                       np.where(goals_for < goals_against, 'L', 'D'))
+
+    # Group rows by team, chronological within each team
+    by_team = np.lexsort((match_order, team_ids))
+    team_ids = team_ids[by_team]
+    results = results[by_team]
+
+    counts = np.bincount(team_ids, minlength=len(teams))
+    ends = np.cumsum(counts)
+    from_end = ends[team_ids] - np.arange(len(team_ids))
+    recent = from_end <= last_n
+
+    starts = np.searchsorted(team_ids[recent], np.arange(len(teams)))
+    recent_results = results[recent].tolist()
+    bounds = list(starts) + [len(recent_results)]
+    for team_id, team in enumerate(teams):
+        form[team] = recent_results[bounds[team_id]:bounds[team_id + 1]]
+
+    return form
+
+
+class _TeamRecord:
+    __slots__ = ('played', 'wins', 'draws', 'losses', 'goals_for', 'goals_against', 'slots')
+
+    def __init__(self):
+        self.played = self.wins = self.draws = self.losses = 0
+        self.goals_for = self.goals_against = 0
+        self.slots = []  # Sorted appearance slots (2 * match position, +1 for away)
+
+    @property
+    def points(self) -> int:
+        return 3 * self.wins + self.draws
+
+
+class IncrementalStandings:
+    """
+    League table kept up to date one match result at a time
+
+    Teams are held in a sorted list of keys (points, goal difference, goals
+    scored, first appearance), so inserting, correcting or deleting a result
+    is a bisect (O(log n)) per affected team plus a short list shift, instead
+    of recomputing the table from every match. Ordering (including ties)
+    matches compute_standings on the same matches.
+
+    Matches are identified by their position in the season's match list.
+    sync() keeps the last matches it saw as arrays and finds changed results
+    with a vectorized comparison, so only those rows are touched in Python.
+    """
+
+    def __init__(self):
+        self._teams: Dict[str, _TeamRecord] = {}
+        self._order = []
+        self._results = {}  # match position -> (team1, team2, score1, score2)
+        self._synced = None  # Columns of the last synced matches (None after apply/retract)
+
+    @staticmethod
+    def _columns(matches: pd.DataFrame) -> tuple:
+        """(team1, team2, score1, score2, completed) arrays; scores as floats for comparison"""
+        score1 = matches['score1'].to_numpy(dtype=np.float64, na_value=np.nan)
+        score2 = matches['score2'].to_numpy(dtype=np.float64, na_value=np.nan)
+        return (matches['team1'].to_numpy(dtype=object), matches['team2'].to_numpy(dtype=object),
+                score1, score2, ~(np.isnan(score1) | np.isnan(score2)))
+
+    @classmethod
+    def from_matches(cls, matches: pd.DataFrame) -> 'IncrementalStandings':
+        """Build the table from a matches DataFrame (aggregated with np.bincount)"""
+        table = cls()
+        columns = cls._columns(matches)
+        completed = columns[-1]
+        positions = np.flatnonzero(completed)
+        team1, team2 = columns[0][completed], columns[1][completed]
+        score1 = matches['score1'].to_numpy()[completed]
+        score2 = matches['score2'].to_numpy()[completed]
+        table._results = dict(zip(positions.tolist(),
+                                  zip(team1.tolist(), team2.tolist(), score1.tolist(), score2.tolist())))
+        table._synced = columns
+        if not len(positions):
+            return table
+
+        # Interleave home/away so slots (2 * position, +1 for away) ascend within each team
+        n = len(positions)
+        names = np.empty(2 * n, dtype=object)
+        names[0::2], names[1::2] = team1, team2
+        slots = np.empty(2 * n, dtype=np.int64)
+        slots[0::2], slots[1::2] = 2 * positions, 2 * positions + 1
+        goals_for = np.empty(2 * n, dtype=np.float64)
+        goals_for[0::2], goals_for[1::2] = columns[2][completed], columns[3][completed]
+        goals_against = np.empty(2 * n, dtype=np.float64)
+        goals_against[0::2], goals_against[1::2] = goals_for[1::2], goals_for[0::2]
+
+        team_ids, teams = pd.factorize(names)
+        n_teams = len(teams)
+        played = np.bincount(team_ids, minlength=n_teams)
+        wins = np.bincount(team_ids[goals_for > goals_against], minlength=n_teams)
+        draws = np.bincount(team_ids[goals_for == goals_against], minlength=n_teams)
+        total_for = np.bincount(team_ids, weights=goals_for, minlength=n_teams).round().astype(np.int64)
+        total_against = np.bincount(team_ids, weights=goals_against, minlength=n_teams).round().astype(np.int64)
+        team_slots = np.split(slots[np.argsort(team_ids, kind='stable')], np.cumsum(played)[:-1])
+
+        for i, team in enumerate(teams.tolist()):
+            record = table._teams[team] = _TeamRecord()
+            record.played, record.wins, record.draws = int(played[i]), int(wins[i]), int(draws[i])
+            record.losses = record.played - record.wins - record.draws
+            record.goals_for, record.goals_against = int(total_for[i]), int(total_against[i])
+            record.slots = team_slots[i].tolist()
+        table._order = sorted(table._sort_key(team, record) for team, record in table._teams.items())
+        return table
+
+    def __len__(self):
+        return len(self._teams)
+
+    def _sort_key(self, team: str, record: _TeamRecord) -> tuple:
+        return (-record.points, -(record.goals_for - record.goals_against),
+                -record.goals_for, record.slots[0], team)
+
+    def _update(self, team: str, goals_for, goals_against, sign: int, slot: int):
+        record = self._teams.get(team)
+        if record is None:
+            record = self._teams[team] = _TeamRecord()
+        else:
+            del self._order[bisect.bisect_left(self._order, self._sort_key(team, record))]
+
+        record.played += sign
+        record.goals_for += sign * goals_for
+        record.goals_against += sign * goals_against
+        if goals_for > goals_against:
+            record.wins += sign
+        elif goals_for < goals_against:
+            record.losses += sign
+        else:
+            record.draws += sign
+        if sign > 0:
+            bisect.insort(record.slots, slot)
+        else:
+            record.slots.remove(slot)
+
+        if record.played == 0:
+            del self._teams[team]
+        else:
+            bisect.insort(self._order, self._sort_key(team, record))
+
+    def apply(self, position: int, team1: str, team2: str, score1, score2):
+        """Insert a result, or correct it if the match already has one"""
+        self._apply(position, team1, team2, score1, score2)
+        self._synced = None
+
+    def retract(self, position: int):
+        """Remove a match's result (e.g. a result entered by mistake)"""
+        self._retract(position)
+        self._synced = None
+
+    def _apply(self, position: int, team1: str, team2: str, score1, score2):
+        if position in self._results:
+            self._retract(position)
+        self._update(team1, score1, score2, +1, 2 * position)
+        self._update(team2, score2, score1, +1, 2 * position + 1)
+        self._results[position] = (team1, team2, score1, score2)
+
+    def _retract(self, position: int):
+        result = self._results.pop(position, None)
+        if result is None:
+            return
+        team1, team2, score1, score2 = result
+        self._update(team1, score1, score2, -1, 2 * position)
+        self._update(team2, score2, score1, -1, 2 * position + 1)
+
+    def _changed_positions(self, columns: tuple) -> np.ndarray:
+        """Positions whose result differs between the last synced matches and `columns`"""
+        previous = self._synced
+        if previous is None:
+            # Results were applied by hand since the last sync: compare against them
+            n = max(len(columns[-1]), max(self._results, default=-1) + 1)
+            previous = (np.full(n, None, dtype=object), np.full(n, None, dtype=object),
+                        np.full(n, np.nan), np.full(n, np.nan), np.zeros(n, dtype=bool))
+            for position, result in self._results.items():
+                for values, value in zip(previous, result):
+                    values[position] = value
+                previous[-1][position] = True
+
+        n = min(len(previous[-1]), len(columns[-1]))
+        was_completed, completed = previous[-1], columns[-1]
+        changed = np.zeros(max(len(was_completed), len(completed)), dtype=bool)
+        changed[n:len(was_completed)] = was_completed[n:]
+        changed[n:len(completed)] |= completed[n:]
+
+        both = was_completed[:n] & completed[:n]
+        differs = was_completed[:n] != completed[:n]
+        for old, new in zip(previous[:4], columns[:4]):
+            differs |= both & (old[:n] != new[:n])
+        changed[:n] = differs
+        return np.flatnonzero(changed)
+
+    def sync(self, matches: pd.DataFrame) -> int:
+        """
+        Apply the differences between the stored results and `matches`
+
+        Returns:
+            Number of results inserted, corrected or retracted
+        """
+        columns = self._columns(matches)
+        positions = self._changed_positions(columns)
+        completed = columns[-1]
+        applied = positions[positions < len(completed)]
+        applied = applied[completed[applied]]
+
+        for position in np.setdiff1d(positions, applied).tolist():
+            self._retract(position)
+        for result in zip(applied.tolist(), columns[0][applied].tolist(), columns[1][applied].tolist(),
+                          matches['score1'].to_numpy()[applied].tolist(),
+                          matches['score2'].to_numpy()[applied].tolist()):
+            self._apply(*result)
+        self._synced = columns
+        return len(positions)
+
+    def to_frame(self, league_name: str, season: str, goals_dtype=np.int64) -> pd.DataFrame:
+        """Current table in the same layout as compute_standings"""
+        if not self._teams:
+            return pd.DataFrame()
+
+        teams = [key[-1] for key in self._order]
+        records = [self._teams[team] for team in teams]
+        goals_for = np.array([r.goals_for for r in records]).astype(goals_dtype)
+        goals_against = np.array([r.goals_against for r in records]).astype(goals_dtype)
+
+        stats_df = pd.DataFrame({
+            'position': range(1, len(teams) + 1),
+            'team': np.array(teams, dtype=object),
+            'played': np.array([r.played for r in records], dtype=np.int64),
+            'wins': np.array([r.wins for r in records], dtype=np.int64),
+            'draws': np.array([r.draws for r in records], dtype=np.int64),
+            'losses': np.array([r.losses for r in records], dtype=np.int64),
+            'goals_for': goals_for,
+            'goals_against': goals_against,
+            'goal_difference': goals_for - goals_against,
+            'points': np.array([r.points for r in records], dtype=np.int64),
+        })
+        stats_df['league'] = league_name
+        stats_df['season'] = season
+
+        return stats_df
+
+
+class SeasonTimeline:
+    """
+    Cumulative standings after every round of a season
+
+    Per-team increments are scattered into (team x round) arrays once and
+    cumulated along the round axis, so the table after any round, or a team's
+    position in every round, is an array slice instead of a recomputation.
+    Rounds are ordered by first appearance in the match list.
+    """
+
+    def __init__(self, matches: pd.DataFrame):
+        self.rounds = []
+        self.teams = np.array([], dtype=object)
+        self._round_index = {}
+        if matches.empty:
+            return
+
+        round_ids, rounds = pd.factorize(matches['round'], use_na_sentinel=False)
+        self.rounds = [str(r) for r in rounds]
+        home_ids, away_ids, self.teams = intern_teams(matches)
+        self.goals_dtype = _goals_dtype(matches)
+        n_teams, n_rounds = len(self.teams), len(self.rounds)
+        self._round_index = {name: i for i, name in enumerate(self.rounds)}
+
+        completed = (matches['score1'].notna() & matches['score2'].notna()).to_numpy()
+        positions = np.flatnonzero(completed)
+        score1 = matches['score1'].to_numpy()[completed].astype(np.float64)
+        score2 = matches['score2'].to_numpy()[completed].astype(np.float64)
+
+        team_ids = np.concatenate([home_ids[completed], away_ids[completed]])
+        cells = team_ids * n_rounds + np.concatenate([round_ids[completed]] * 2)
+        goals_for = np.concatenate([score1, score2])
+        goals_against = np.concatenate([score2, score1])
+        slots = np.concatenate([2 * positions, 2 * positions + 1])
+
+        def cumulative(weights=None, mask=None):
+            if mask is not None:
+                counts = np.bincount(cells[mask], minlength=n_teams * n_rounds)
+            else:
+                counts = np.bincount(cells, weights=weights, minlength=n_teams * n_rounds)
+            return np.cumsum(counts.reshape(n_teams, n_rounds), axis=1)
+
+        self.played = cumulative().astype(np.int64)
+        self.wins = cumulative(mask=goals_for > goals_against).astype(np.int64)
+        self.draws = cumulative(mask=goals_for == goals_against).astype(np.int64)
+        self.losses = cumulative(mask=goals_for < goals_against).astype(np.int64)
+        self.goals_for = cumulative(goals_for)
+        self.goals_against = cumulative(goals_against)
+        self.points = 3 * self.wins + self.draws
+
+        # First appearance (tie-break used by compute_standings) up to each round
+        first_slot = np.full(n_teams * n_rounds, np.iinfo(np.int64).max, dtype=np.int64)
+        np.minimum.at(first_slot, cells, slots)
+        self.first_slot = np.minimum.accumulate(first_slot.reshape(n_teams, n_rounds), axis=1)
+
+        # Position of every team after every round (0 = not played yet)
+        self.positions = np.zeros((n_teams, n_rounds), dtype=np.int64)
+        for r in range(n_rounds):
+            order = self._order(r)
+            self.positions[order, r] = np.arange(1, len(order) + 1)
+
+    def _order(self, r: int) -> np.ndarray:
+        """Team IDs in table order after round index r"""
+        active = np.flatnonzero(self.played[:, r] > 0)
+        gd = self.goals_for[active, r] - self.goals_against[active, r]
+        keys = (self.first_slot[active, r], -self.goals_for[active, r], -gd, -self.points[active, r])
+        return active[np.lexsort(keys)]
+
+    def round_index(self, round_name: str) -> Optional[int]:
+        return self._round_index.get(round_name)
+
+    def table_as_of(self, round_name: str, league_name: str, season: str) -> pd.DataFrame:
+        """
+        League table counting only matches of rounds up to and including `round_name`
+
+        Raises:
+            KeyError: if the round does not exist in this season
+        """
+        r = self._round_index[round_name]
+        order = self._order(r)
+        if len(order) == 0:
+            return pd.DataFrame()
+
+        goals_for = self.goals_for[order, r].astype(self.goals_dtype)
+        goals_against = self.goals_against[order, r].astype(self.goals_dtype)
+        stats_df = pd.DataFrame({
+            'position': range(1, len(order) + 1),
+            'team': self.teams[order],
+            'played': self.played[order, r],
+            'wins': self.wins[order, r],
+            'draws': self.draws[order, r],
+            'losses': self.losses[order, r],
+            'goals_for': goals_for,
+            'goals_against': goals_against,
+            'goal_difference': goals_for - goals_against,
+            'points': self.points[order, r],
+        })
+        stats_df['league'] = league_name
+        stats_df['season'] = season
+
+        return stats_df
+
+    def position_history(self, team_name: str) -> List[dict]:
+        """
+        A team's position and points after every round
+
+        Raises:
+            KeyError: if the team does not play in this season
+        """
+        found = np.flatnonzero(self.teams == team_name)
+        if len(found) == 0:
+            raise KeyError(team_name)
+        t = found[0]
+
+        return [
+            {
+                'round': round_name,
+                'position': int(self.positions[t, r]) or None,
+                'played': int(self.played[t, r]),
+                'points': int(self.points[t, r]),
+            }
+            for r, round_name in enumerate(self.rounds)
+        ]
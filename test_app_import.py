@@ -0,0 +1,44 @@
+"""
+Tests for deferred initialization: importing app.py and serving the static
+pages must not load pandas, scikit-learn or the match loader
+"""
+
+import subprocess
+import sys
+import threading
+
+from lazy import LazyObject
+
+
+HEAVY_MODULES = ['pandas', 'numpy', 'sklearn', 'requests', 'joblib', 'football_json_loader', 'data_store']
+
+
+def test_light_routes_do_not_import_heavy_modules():
+    script = (
+        "import sys, app\n"
+        "client = app.app.test_client()\n"
+        "for path in ('/', '/about', '/leagues', '/api/leagues'):\n"
+        "    assert client.get(path).status_code == 200, path\n"
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))\n"
+    )
+    result = subprocess.run([sys.executable, '-c', script], capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == ''
+
+
+def test_lazy_object_builds_once_on_first_use():
+    calls = []
+
+    def factory():
+        calls.append(1)
+        return {'a': 1}
+
+    lazy = LazyObject(factory)
+    assert not lazy.loaded and calls == []
+
+    threads = [threading.Thread(target=lambda: lazy.get('a')) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert lazy.loaded and calls == [1]
+    assert len(lazy) == 1 and list(lazy) == ['a']
@@ -0,0 +1,56 @@
+"""
+Tests for the bounded TTL + LRU cache
+"""
+
+import time
+
+from cache import TTLCache
+
+
+def test_lru_eviction_by_entry_count():
+    cache = TTLCache(max_entries=2, ttl=None)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    assert cache.get('a') == 1     # 'a' is now most recently used
+    cache.set('c', 3)
+
+    assert 'b' not in cache
+    assert cache.get('a') == 1
+    assert cache.get('c') == 3
+    assert cache.stats()['evictions'] == 1
+
+
+def test_byte_budget():
+    cache = TTLCache(max_entries=None, max_bytes=100, ttl=None, sizeof=len)
+    cache.set('a', 'x' * 60)
+    cache.set('b', 'y' * 60)
+    assert 'a' not in cache
+    assert cache.stats()['bytes'] == 60
+
+    cache.set('huge', 'z' * 500)
+    assert 'huge' not in cache
+    assert 'b' in cache
+
+
+def test_known_size_skips_sizeof():
+    def sizeof(value):
+        raise AssertionError('sizeof should not be called')
+
+    cache = TTLCache(max_entries=None, max_bytes=100, ttl=None, sizeof=sizeof)
+    cache.set('a', {'matches': []}, size=40)
+    assert cache.stats()['bytes'] == 40
+
+
+def test_ttl_expiry():
+    cache = TTLCache(ttl=0.05)
+    cache.set('a', 1)
+    cache.set('forever', 2, ttl=None)
+    assert cache.get('a') == 1
+    time.sleep(0.06)
+    assert cache.get('a') is None
+    assert cache.get('forever') == 2
+
+    stats = cache.stats()
+    assert stats['expirations'] == 1
+    assert stats['hits'] == 2
+    assert stats['misses'] == 1
@@ -0,0 +1,56 @@
+"""
+Tests for the vectorized synthetic player data generator
+"""
+
+import pandas as pd
+import pytest
+
+import config
+from data_generator import POSITION_PROFILES, generate_player_chunks, generate_player_data, write_player_data
+from player_stats import build_player_stats
+
+
+def test_stats_respect_position_profiles():
+    df = generate_player_data(n_players=200, n_matches=10, seed=1)
+    assert len(df) == 2000 and df['player_name'].nunique() == 200
+    assert (df.groupby('player_id')['position'].nunique() == 1).all()
+    assert (df['shots_on_target'] <= df['shots']).all()
+    assert (df['total_passes'] >= df['passes_completed']).all()
+    assert df['performance_rating'].between(0, 100).all()
+
+    for position, profile in POSITION_PROFILES.items():
+        rows = df[df['position'] == position]
+        low, high = profile['minutes']
+        assert rows['minutes_played'].between(low, high - 1).all()
+    keepers = df[df['position'] == 'Goalkeeper']
+    assert (keepers[['goals', 'assists', 'shots', 'tackles', 'dribbles_completed']] == 0).all().all()
+
+
+def test_seed_makes_output_reproducible():
+    assert generate_player_data(50, 5, seed=7).equals(generate_player_data(50, 5, seed=7))
+    assert not generate_player_data(50, 5, seed=7).equals(generate_player_data(50, 5, seed=8))
+
+
+def test_chunks_cover_every_player_once():
+    chunks = list(generate_player_chunks(25, n_matches=4, chunk_players=10))
+    assert [len(chunk) for chunk in chunks] == [40, 40, 20]
+    ids = pd.concat(chunks)['player_id']
+    assert ids.tolist() == sorted(ids.tolist()) and ids.nunique() == 25
+
+
+def test_streamed_csv_matches_chunks_and_loads_in_the_app(tmp_path):
+    path = str(tmp_path / 'players.csv')
+    assert write_player_data(path, 25, n_matches=4, seed=3, chunk_players=10) == 100
+
+    written = pd.read_csv(path)
+    expected = pd.concat(generate_player_chunks(25, 4, seed=3, chunk_players=10), ignore_index=True)
+    pd.testing.assert_frame_equal(written, expected, check_dtype=False)
+    assert set(config.FEATURE_COLUMNS) <= set(written.columns)
+    assert build_player_stats(written).get('Player_1')['total_matches'] is not None
+
+
+def test_streamed_parquet(tmp_path):
+    pytest.importorskip('pyarrow')
+    path = str(tmp_path / 'players.parquet')
+    assert write_player_data(path, 25, n_matches=4, chunk_players=10) == 100
+    assert len(pd.read_parquet(path)) == 100
@@ -0,0 +1,166 @@
+"""
+Tests for the player data lifecycle layer (load once, hot reload on change)
+"""
+
+import os
+
+import pandas as pd
+
+from data_store import DataStore
+from model import PlayerPerformanceModel
+from player_stats import _safe_float, _safe_int, _safe_str, build_player_stats
+import config
+
+
+def _write_players(path, names):
+    rows = ["player_name,match_id," + ",".join(config.FEATURE_COLUMNS) + ",performance_rating"]
+    for i, name in enumerate(names):
+        rows.append(f"{name},1," + ",".join(str(i + j) for j in range(len(config.FEATURE_COLUMNS))) + f",{50 + i}")
+    path.write_text("\n".join(rows) + "\n")
+
+
+def _train_model(data_path, model_path):
+    model = PlayerPerformanceModel()
+    model.scaler.fit(pd.read_csv(data_path)[config.FEATURE_COLUMNS])
+    model.model = None
+    model.is_trained = True
+    model.save_model(str(model_path))
+
+
+def test_missing_files_report_message(tmp_path):
+    store = DataStore(str(tmp_path / 'players.csv'), str(tmp_path / 'model.pkl'))
+    snapshot = store.snapshot
+    assert not snapshot.ok
+    assert snapshot.df is None
+    assert 'Run:' in snapshot.message
+
+
+def test_snapshot_loaded_once_and_swapped_on_change(tmp_path):
+    data_path = tmp_path / 'players.csv'
+    model_path = tmp_path / 'model.pkl'
+    _write_players(data_path, ['Alice', 'Bob'])
+    _train_model(data_path, model_path)
+
+    store = DataStore(str(data_path), str(model_path))
+    first = store.snapshot
+    assert first.ok
+    assert first.version == 1
+    assert store.snapshot is first
+    assert store.reload_if_changed() is False
+
+    _write_players(data_path, ['Alice', 'Bob', 'Carol'])
+    os.utime(data_path, ns=(first.signature[0][0] + 10**9,) * 2)
+
+    assert store.reload_if_changed() is True
+    second = store.snapshot
+    assert second.version == 2
+    assert len(second.df) == 3
+    entry = second.name_index.lookup(' CAROL ')
+    assert entry.name == 'Carol'
+    assert second.player_stats.get(entry.key)['player_name'] == 'Carol'
+    # In-flight readers holding the old snapshot keep a consistent view
+    assert len(first.df) == 2
+
+
+def test_failed_reload_keeps_previous_snapshot(tmp_path):
+    data_path = tmp_path / 'players.csv'
+    model_path = tmp_path / 'model.pkl'
+    _write_players(data_path, ['Alice'])
+    _train_model(data_path, model_path)
+
+    store = DataStore(str(data_path), str(model_path))
+    first = store.snapshot
+    model_path.write_bytes(b'not a pickle')
+
+    assert store.reload_if_changed() is False
+    assert store.snapshot is first
+
+
+def _legacy_player_stats(df, key):
+    """The /api/player payload as it was computed per request before the aggregate table"""
+    player_data = df[df['player_name'].str.strip() == key]
+    profile = player_data.iloc[0]
+    actual_player_name = str(profile['player_name'])
+    return {
+        'player_name': actual_player_name,
+        'full_name': _safe_str(profile.get('full_name')) or actual_player_name,
+        'birth_date': _safe_str(profile.get('birth_date')),
+        'age': _safe_int(profile.get('age')),
+        'height_cm': f"{_safe_int(profile.get('height_cm'))} cm",
+        'weight_kg': f"{_safe_int(profile.get('weight_kg'))} kg",
+        'nationality': _safe_str(profile.get('nationality')) or 'Unknown',
+        'position': _safe_str(profile.get('position')) or 'Unknown',
+        'positions_full': _safe_str(profile.get('position')) or 'Unknown',
+        'preferred_foot': _safe_str(profile.get('preferred_foot')) or 'Unknown',
+        'overall_rating': _safe_int(_safe_float(profile.get('market_value_euro')) / 5000000),
+        'current_team': _safe_str(profile.get('team')) or 'Unknown',
+        'total_matches': _safe_int(profile.get('Appearances')) or 35,
+        'avg_performance': round(player_data['performance_rating'].mean(), 2),
+        'total_goals': int(player_data['goals'].sum()),
+        'total_assists': int(player_data['assists'].sum()),
+        'avg_shots': round(player_data['shots'].mean(), 2),
+        'shot_accuracy': round((player_data['shots_on_target'].sum() / max(player_data['shots'].sum(), 1) * 100), 1),
+        'total_passes': int(player_data['passes_completed'].sum()),
+        'avg_pass_accuracy': round(player_data['pass_accuracy'].mean(), 1),
+        'avg_passes_per_match': round(player_data['passes_completed'].mean(), 1),
+        'total_tackles': int(player_data['tackles'].sum()),
+        'total_interceptions': int(player_data['interceptions'].sum()),
+        'avg_dribbles': round(player_data['dribbles_completed'].mean(), 2),
+        'radar_stats': {
+            'goals': round(player_data['goals'].mean(), 2),
+            'assists': round(player_data['assists'].mean(), 2),
+            'shots_on_target': round(player_data['shots_on_target'].mean(), 2),
+            'pass_accuracy': round(player_data['pass_accuracy'].mean(), 2),
+            'tackles': round(player_data['tackles'].mean(), 2),
+            'interceptions': round(player_data['interceptions'].mean(), 2),
+            'dribbles_completed': round(player_data['dribbles_completed'].mean(), 2),
+        },
+        'performance_trend': {
+            'matches': player_data['match_id'].tolist(),
+            'ratings': player_data['performance_rating'].tolist(),
+        },
+        'recent_matches': player_data.head(10).fillna('').to_dict('records'),
+    }
+
+
+def test_player_stats_match_the_per_request_computation():
+    df = pd.read_csv(config.DATA_CONFIG['data_file'])
+    # A second match for every player, so sums, means and trends cover several rows
+    later = df.assign(match_id=df['match_id'] + 1, goals=df['goals'] + 1,
+                      performance_rating=df['performance_rating'] / 2)
+    for players in (df, pd.concat([df, later], ignore_index=True)):
+        table = build_player_stats(players)
+        keys = players['player_name'].str.strip().unique()
+        assert len(table) == len(keys) == 562
+        for key in keys:
+            assert table.get(key) == _legacy_player_stats(players, key), key
+
+
+def test_prediction_page_uses_the_snapshot_model(tmp_path, monkeypatch):
+    import app as app_module
+    from sklearn.dummy import DummyRegressor
+
+    data_path = tmp_path / 'players.csv'
+    model_path = tmp_path / 'model.pkl'
+    _write_players(data_path, ['Alice', 'Bob'])
+    store = DataStore(str(data_path), str(model_path), poll_interval=3600)
+    monkeypatch.setattr(app_module, 'data_store', store)
+    client = app_module.app.test_client()
+    form = {'age': 26, 'position': 'FW', 'minutes_played': 90, 'goals': 1, 'assists': 0, 'shots': 4,
+            'shots_on_target': 2, 'passes': 30, 'pass_accuracy': 80, 'tackles': 1}
+    try:
+        assert 'model.pkl file' in client.get('/player-prediction').get_data(as_text=True)
+
+        players = pd.read_csv(data_path)
+        model = PlayerPerformanceModel()
+        model.scaler.fit(players[config.FEATURE_COLUMNS])
+        model.model = DummyRegressor(constant=42.5, strategy='constant').fit(
+            players[config.FEATURE_COLUMNS], players['performance_rating'])
+        model.is_trained = True
+        model.save_model(str(model_path))
+        assert store.reload_if_changed() is True
+
+        page = client.post('/player-prediction', data=form).get_data(as_text=True)
+        assert '42.5' in page
+    finally:
+        store.stop()
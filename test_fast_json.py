@@ -0,0 +1,62 @@
+"""
+Tests for the column-wise JSON serializer
+"""
+
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import config
+import fast_json
+from fast_json import dumps, frame_json, json_response
+
+
+FRAME = pd.DataFrame({
+    'team': ['Arsenal FC', 'Brighton & Hove Albion FC', 'Quote "FC"', 'Back\\slash","FC', 'Émile Ünited', None],
+    'score': [2, 0, 1, 3, 1, 0],
+    'xg': [1.5, np.nan, 0.25, np.inf, 2.0, 1e20],
+    'home': [True, False, True, False, True, False],
+})
+
+
+def _expected_records(df):
+    return [{k: (None if isinstance(v, float) and not np.isfinite(v) else v) for k, v in row.items()}
+            for row in df.astype(object).where(df.notna(), None).to_dict('records')]
+
+
+@pytest.fixture(params=['orjson', 'json'])
+def backend(request, monkeypatch):
+    if request.param == 'orjson' and fast_json.orjson is None:
+        pytest.skip('orjson not installed')
+    monkeypatch.setitem(config.JSON_CONFIG, 'serializer', request.param)
+    return request.param
+
+
+def test_records_match_per_row_serialization(backend):
+    assert json.loads(frame_json(FRAME)) == _expected_records(FRAME)
+
+
+def test_columns_orient(backend):
+    columns = json.loads(frame_json(FRAME, orient='columns'))
+    records = _expected_records(FRAME)
+    assert list(columns) == list(FRAME.columns)
+    assert columns['team'] == [r['team'] for r in records]
+    assert columns['xg'] == [r['xg'] for r in records]
+
+
+def test_empty_frame_and_unknown_orient(backend):
+    assert frame_json(FRAME.iloc[:0]) == b'[]'
+    assert json.loads(frame_json(FRAME.iloc[:0], orient='columns')) == {c: [] for c in FRAME.columns}
+    with pytest.raises(ValueError):
+        frame_json(FRAME, orient='split')
+
+
+def test_json_response_splices_frames(backend):
+    response = json_response({'league': 'Test', 'count': np.int64(6)}, frames={'rows': FRAME})
+    body = json.loads(response.get_data())
+    assert body['league'] == 'Test' and body['count'] == 6
+    assert body['rows'] == _expected_records(FRAME)
+    assert json.loads(json_response({}, frames={'rows': FRAME.iloc[:1]}).get_data())['rows'][0]['score'] == 2
+    assert json.loads(dumps({'a': np.arange(3)})) == {'a': [0, 1, 2]}
@@ -0,0 +1,179 @@
+"""
+Tests for FootballJSONLoader against recorded Premier League 2024-25 data
+served by a local OpenFootball stand-in
+"""
+
+import json
+import time
+
+import pytest
+from pandas.testing import assert_frame_equal
+
+from football_json_loader import FootballJSONLoader
+from http_cache import DiskHTTPCache
+from openfootball_stub import StubOpenFootballServer
+from standings import IncrementalStandings, compute_standings
+
+
+PL_PATH = '/2024-25/en.1.json'
+
+with open('premier_league_2024_25_matches.json', 'rb') as f:
+    PL_BODY = f.read()
+
+
+@pytest.fixture
+def server():
+    with StubOpenFootballServer({PL_PATH: PL_BODY}) as stub:
+        yield stub
+
+
+def make_loader(server, tmp_path, max_age=60):
+    loader = FootballJSONLoader(http_cache=DiskHTTPCache(str(tmp_path), max_age=max_age), mirror_dir=None)
+    loader.BASE_URL = server.base_url
+    return loader
+
+
+def test_league_page_parses_match_json_once(server, tmp_path, monkeypatch):
+    loader = make_loader(server, tmp_path)
+    calls = []
+    parse = loader._parse_matches
+    monkeypatch.setattr(loader, '_parse_matches', lambda *args: calls.append(args) or parse(*args))
+
+    table = loader.get_team_statistics('Premier League', '2024-25')
+    for team in table['team']:
+        loader.get_team_form(team, 'Premier League', '2024-25')
+    loader.get_upcoming_fixtures('Premier League', '2024-25')
+    loader.get_league_matches('Premier League', '2024-25')
+
+    assert len(calls) == 1
+
+
+def test_derived_results_are_independent_copies(server, tmp_path):
+    loader = make_loader(server, tmp_path)
+    table = loader.get_team_statistics('Premier League', '2024-25')
+    table['league'] = 'changed'
+    assert (loader.get_team_statistics('Premier League', '2024-25')['league'] == 'Premier League').all()
+
+
+def test_derived_results_invalidated_when_data_changes(server, tmp_path):
+    loader = make_loader(server, tmp_path, max_age=0)
+    before = loader.get_team_statistics('Premier League', '2024-25')
+    version = loader.data_version('Premier League', '2024-25')
+
+    data = json.loads(PL_BODY)
+    data['matches'] = data['matches'][:10]
+    server.set_file(PL_PATH, json.dumps(data).encode('utf-8'))
+    loader.cache.clear()
+
+    after = loader.get_team_statistics('Premier League', '2024-25')
+    assert loader.data_version('Premier League', '2024-25') != version
+    assert after['played'].sum() == 20
+    assert before['played'].sum() == 760
+
+
+def test_store_follows_data_reverting_to_a_memoized_version(server, tmp_path):
+    loader = make_loader(server, tmp_path, max_age=0)
+    first = loader.get_matches_page('Premier League', '2024-25')[1]
+
+    data = json.loads(PL_BODY)
+    data['matches'] = data['matches'][:10]
+    for body in (json.dumps(data).encode('utf-8'), PL_BODY):
+        server.set_file(PL_PATH, body)
+        loader.cache.clear()
+        loader.get_matches_page('Premier League', '2024-25')
+
+    # The 'matches' frame of the original version is a derived-cache hit; the store must match it
+    assert loader.get_matches_page('Premier League', '2024-25')[1] == first == 380
+
+
+def test_refresh_updates_standings_incrementally(server, tmp_path, monkeypatch):
+    data = json.loads(PL_BODY)
+    for match in data['matches'][300:]:
+        match.pop('score')
+    server.set_file(PL_PATH, json.dumps(data).encode('utf-8'))
+    loader = make_loader(server, tmp_path, max_age=0)
+    loader.get_team_statistics('Premier League', '2024-25')
+
+    # Three more results come in
+    for match in data['matches'][300:303]:
+        match['score'] = {'ft': [1, 1]}
+    server.set_file(PL_PATH, json.dumps(data).encode('utf-8'))
+    loader.cache.clear()
+
+    synced = []
+    sync = IncrementalStandings.sync
+    monkeypatch.setattr(IncrementalStandings, 'sync', lambda self, df: synced.append(sync(self, df)) or synced[-1])
+    table = loader.get_team_statistics('Premier League', '2024-25')
+
+    assert synced[-1] == 3  # Only the three new results are applied
+    assert_frame_equal(table, compute_standings(loader.get_league_matches('Premier League', '2024-25'),
+                                                'Premier League', '2024-25'))
+
+
+def _all_league_files(season='2024-25', missing=()):
+    return {
+        f"/{season}/{info['code']}.json": PL_BODY
+        for league, info in FootballJSONLoader.LEAGUES.items() if league not in missing
+    }
+
+
+def test_all_leagues_fetched_concurrently_over_pooled_connections(tmp_path):
+    latency = 0.2
+    with StubOpenFootballServer(_all_league_files(), latency=latency) as stub:
+        cache = DiskHTTPCache(str(tmp_path), max_age=60, max_per_host=4)
+        loader = FootballJSONLoader(http_cache=cache, mirror_dir=None)
+        loader.BASE_URL = stub.base_url
+
+        start = time.perf_counter()
+        all_data = loader.get_all_leagues_data('2024-25', max_workers=8)
+        elapsed = time.perf_counter() - start
+
+        assert set(all_data) == set(FootballJSONLoader.LEAGUES)
+        # 10 files, at most 4 in flight: three waves instead of ten
+        assert elapsed < latency * len(FootballJSONLoader.LEAGUES) / 2
+        assert 1 < stub.max_active <= 4
+        assert stub.connections_opened <= 4
+
+
+def test_failed_league_does_not_sink_the_batch(tmp_path):
+    with StubOpenFootballServer(_all_league_files(missing={'Serie B'})) as stub:
+        loader = make_loader(stub, tmp_path)
+        all_data = loader.fetch_leagues(FootballJSONLoader.LEAGUES, '2024-25')
+
+        assert 'Serie B' not in all_data
+        assert len(all_data) == len(FootballJSONLoader.LEAGUES) - 1
+
+
+def test_live_refresh_ignores_the_league_cache_ttl(server, tmp_path):
+    loader = make_loader(server, tmp_path, max_age=0)
+    assert loader.get_league_matches('Premier League', '2024-25')['score1'].notna().sum() == 380
+    version = loader.data_version('Premier League', '2024-25')
+
+    # Unchanged file: same version, nothing re-parsed
+    loader.refresh_league_matches('Premier League', '2024-25')
+    assert loader.data_version('Premier League', '2024-25') == version
+
+    data = json.loads(PL_BODY)
+    data['matches'][0].pop('score')
+    server.set_file(PL_PATH, json.dumps(data).encode('utf-8'))
+    assert loader.get_league_matches('Premier League', '2024-25')['score1'].notna().sum() == 380
+
+    refreshed = loader.refresh_league_matches('Premier League', '2024-25')
+    assert refreshed['score1'].notna().sum() == 379
+    # Pages see the new version too
+    assert loader.get_team_statistics('Premier League', '2024-25')['played'].sum() == 2 * 379
+
+
+def test_live_refresh_reads_the_mirror_first(server, tmp_path):
+    mirror = tmp_path / 'mirror' / '2024-25'
+    mirror.mkdir(parents=True)
+    (mirror / 'en.1.json').write_bytes(PL_BODY)
+    loader = FootballJSONLoader(http_cache=DiskHTTPCache(str(tmp_path / 'http')),
+                                mirror_dir=str(tmp_path / 'mirror'))
+    loader.BASE_URL = server.base_url
+    version = loader.data_version('Premier League', '2024-25')
+
+    server.set_file(PL_PATH, b'{"matches": []}')
+    assert len(loader.refresh_league_matches('Premier League', '2024-25')) == 380
+    assert loader.data_version('Premier League', '2024-25') == version
+    assert server.requests == []
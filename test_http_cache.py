@@ -0,0 +1,89 @@
+"""
+Tests for the on-disk HTTP cache, run against a local OpenFootball stand-in
+"""
+
+import json
+
+import pytest
+import requests
+
+from football_json_loader import FootballJSONLoader
+from http_cache import DiskHTTPCache
+from openfootball_stub import StubOpenFootballServer
+
+
+PATH = '/2024-25/en.1.json'
+SEASON = {'name': 'Test League', 'matches': [
+    {'round': 'Matchday 1', 'date': '2024-08-16', 'team1': 'A FC', 'team2': 'B FC', 'score': {'ft': [1, 0]}},
+]}
+
+
+def _body(data):
+    return json.dumps(data).encode('utf-8')
+
+
+def test_revalidates_with_etag(tmp_path):
+    with StubOpenFootballServer({PATH: _body(SEASON)}) as server:
+        cache = DiskHTTPCache(str(tmp_path), max_age=0)
+        url = server.base_url + PATH
+
+        first = cache.get(url)
+        second = cache.get(url)
+
+        assert first.source == 'network'
+        assert second.source == 'revalidated'
+        assert second.json() == SEASON
+        assert [status for _, _, status in server.requests] == [200, 304]
+
+
+def test_shared_across_instances_within_max_age(tmp_path):
+    with StubOpenFootballServer({PATH: _body(SEASON)}) as server:
+        url = server.base_url + PATH
+        DiskHTTPCache(str(tmp_path), max_age=60).get(url)
+
+        # A second process (new instance, same directory) does not hit the network
+        response = DiskHTTPCache(str(tmp_path), max_age=60).get(url)
+        assert response.source == 'fresh'
+        assert len(server.requests) == 1
+
+
+def test_changed_file_is_refetched(tmp_path):
+    with StubOpenFootballServer({PATH: _body(SEASON)}) as server:
+        cache = DiskHTTPCache(str(tmp_path), max_age=0)
+        url = server.base_url + PATH
+        cache.get(url)
+
+        updated = dict(SEASON, name='Updated')
+        server.set_file(PATH, _body(updated))
+        response = cache.get(url)
+        assert response.source == 'network'
+        assert response.json()['name'] == 'Updated'
+
+
+def test_serves_from_disk_when_remote_unreachable(tmp_path):
+    server = StubOpenFootballServer({PATH: _body(SEASON)}).start()
+    url = server.base_url + PATH
+    cache = DiskHTTPCache(str(tmp_path), max_age=0, timeout=2)
+    cache.get(url)
+    server.stop()
+
+    response = cache.get(url)
+    assert response.source == 'stale'
+    assert response.json() == SEASON
+
+
+def test_missing_file_raises_without_cached_copy(tmp_path):
+    with StubOpenFootballServer({}) as server:
+        cache = DiskHTTPCache(str(tmp_path), max_age=0)
+        with pytest.raises(requests.exceptions.HTTPError):
+            cache.get(server.base_url + PATH)
+
+
+def test_loader_fetches_through_disk_cache(tmp_path):
+    with StubOpenFootballServer({PATH: _body(SEASON)}) as server:
+        loader = FootballJSONLoader(http_cache=DiskHTTPCache(str(tmp_path), max_age=60), mirror_dir=None)
+        loader.BASE_URL = server.base_url
+
+        matches = loader.get_league_matches('Premier League', '2024-25')
+        assert len(matches) == 1
+        assert loader.fetch_league_data('en.1', '2023-24') is None
@@ -0,0 +1,70 @@
+"""
+Tests for filtering, projection and cursor pagination on /api/league/matches
+(served from the bundled Premier League 2024-25 file)
+"""
+
+import json
+
+import pytest
+
+import app as app_module
+
+
+URL = '/api/league/matches/Premier League'
+
+with open('premier_league_2024_25_matches.json') as f:
+    FIXTURES = json.load(f)['matches']
+
+
+@pytest.fixture
+def client():
+    app_module.response_cache.clear()
+    return app_module.app.test_client()
+
+
+def test_unfiltered_response_lists_every_match_in_fixture_order(client):
+    body = client.get(URL).get_json()
+    assert body['total_matches'] == body['count'] == len(FIXTURES)
+    assert body['next_cursor'] is None
+    assert [(m['team1'], m['team2']) for m in body['matches']] == [(m['team1'], m['team2']) for m in FIXTURES]
+
+
+def test_filters_and_projection(client):
+    body = client.get(URL, query_string={'round': 'Matchday 3', 'team': 'Arsenal FC',
+                                         'fields': 'date,team1,team2,score1,score2'}).get_json()
+    expected = [m for m in FIXTURES if m['round'] == 'Matchday 3' and 'Arsenal FC' in (m['team1'], m['team2'])]
+    assert body['total_matches'] == len(expected) == 1
+    assert set(body['matches'][0]) == {'date', 'team1', 'team2', 'score1', 'score2'}
+
+    december = client.get(URL, query_string={'date_from': '2024-12-01', 'date_to': '2024-12-31'}).get_json()
+    assert december['total_matches'] == sum('2024-12-01' <= m['date'] <= '2024-12-31' for m in FIXTURES)
+    # Unpadded dates are accepted and mean the same day
+    unpadded = client.get(URL, query_string={'date_from': '2024-12-1', 'date_to': '2024-12-31'}).get_json()
+    assert unpadded['total_matches'] == december['total_matches']
+
+    finished = client.get(URL, query_string={'status': 'finished'}).get_json()
+    scheduled = client.get(URL, query_string={'status': 'scheduled'}).get_json()
+    assert finished['total_matches'] + scheduled['total_matches'] == len(FIXTURES)
+
+
+def test_cursor_pagination_walks_the_whole_season(client):
+    seen, cursor = [], None
+    while True:
+        query = {'limit': 100, 'fields': 'team1,team2'}
+        if cursor:
+            query['cursor'] = cursor
+        body = client.get(URL, query_string=query).get_json()
+        assert body['total_matches'] == len(FIXTURES)
+        seen += [(m['team1'], m['team2']) for m in body['matches']]
+        cursor = body['next_cursor']
+        if cursor is None:
+            break
+    assert seen == [(m['team1'], m['team2']) for m in FIXTURES]
+
+
+@pytest.mark.parametrize('query', [
+    {'status': 'live'}, {'fields': 'date,venue'}, {'limit': 0}, {'limit': 'abc'}, {'limit': 501}, {'cursor': 'not-a-cursor'},
+    {'date_from': '12/01/2024'},
+])
+def test_invalid_parameters_are_rejected(client, query):
+    assert client.get(URL, query_string=query).status_code == 400
@@ -0,0 +1,181 @@
+"""
+Tests for the live-score SSE channel, driven by a replay of the recorded
+Premier League 2024-25 season
+"""
+
+import json
+
+import pytest
+
+from football_json_loader import FootballJSONLoader
+from live_stream import LeagueFeed, LiveScoreHub, ReplaySource
+from standings import compute_standings
+
+
+def _season():
+    with open('premier_league_2024_25_matches.json') as f:
+        data = json.load(f)
+    loader = FootballJSONLoader.__new__(FootballJSONLoader)
+    return loader._parse_matches('Premier League', '2024-25', data)
+
+
+def _events(subscription):
+    """Parse the messages queued for a subscription"""
+    events = []
+    while not subscription.messages.empty():
+        message = subscription.messages.get_nowait().decode()
+        fields = dict(line.split(': ', 1) for line in message.strip().split('\n'))
+        events.append((int(fields['id']), fields['event'], json.loads(fields['data'])))
+    return events
+
+
+@pytest.fixture
+def replay():
+    return ReplaySource(_season(), step=10)
+
+
+def test_new_subscriber_gets_snapshot_then_only_deltas(replay):
+    feed = LeagueFeed('Premier League', '2024-25', replay)
+    client = feed.subscribe()
+    assert _events(client) == []  # Subscribing never reads the source
+    assert feed.poll_once() is None
+    [(_, kind, snapshot)] = _events(client)
+    assert kind == 'snapshot'
+    assert len(snapshot['matches']) == 380
+    assert all(m['status'] == 'scheduled' for m in snapshot['matches'])
+
+    replay.advance()
+    delta = feed.poll_once()
+    [(version, kind, sent)] = _events(client)
+    assert kind == 'delta' and version == delta['version']
+    assert len(sent['matches']) == 10
+    assert all(m['status'] == 'finished' and m['previous_status'] == 'scheduled' for m in sent['matches'])
+    assert {row['team'] for row in sent['table']} >= {m['team1'] for m in sent['matches']}
+
+    # Nothing changed: nothing sent
+    assert feed.poll_once() is None
+    assert _events(client) == []
+
+
+def test_fixture_edits_and_removals_are_pushed():
+    season = _season()
+    matches = [season]
+    feed = LeagueFeed('Premier League', '2024-25', lambda: matches[0])
+    feed.poll_once()
+
+    edited = season.copy()
+    edited.loc[3, 'team2'] = 'Renamed FC'
+    edited.loc[5, 'round'] = 'Matchday 2'
+    matches[0] = edited.iloc[:-2]
+    delta = feed.poll_once()
+    assert [m['index'] for m in delta['matches']] == [3, 5]
+    assert delta['matches'][0]['team2'] == 'Renamed FC' and delta['matches'][1]['round'] == 'Matchday 2'
+    assert delta['removed'] == [378, 379]
+
+    # A client starting now sees the edited, shorter list
+    snapshot = _events(feed.subscribe())[0][2]
+    assert len(snapshot['matches']) == 378 and snapshot['matches'][3]['team2'] == 'Renamed FC'
+
+
+def test_deltas_rebuild_the_final_table(replay):
+    feed = LeagueFeed('Premier League', '2024-25', replay)
+    client = feed.subscribe()
+    table = {}
+    while replay.completed < 380:
+        replay.advance(37)
+        feed.poll_once()
+    for _, kind, data in _events(client):
+        for row in data['table']:
+            table[row['team']] = row
+
+    expected = compute_standings(_season(), 'Premier League', '2024-25')
+    assert sorted(table.values(), key=lambda row: row['position'])[0]['team'] == expected['team'].iloc[0]
+    assert {team: row['points'] for team, row in table.items()} == dict(zip(expected['team'], expected['points']))
+
+
+def test_one_producer_serves_every_client(replay):
+    calls = []
+
+    def source():
+        calls.append(1)
+        return replay()
+
+    hub = LiveScoreHub(lambda league, season: source)
+    feed = hub.feed('Premier League', '2024-25')
+    clients = [feed.subscribe() for _ in range(50)]
+    assert hub.feed('Premier League', '2024-25') is feed
+    assert calls == []
+
+    hub.poll()
+    replay.advance()
+    hub.poll()
+    assert len(calls) == 2  # initial read + one poll, regardless of 50 clients
+    messages = {client.messages.queue[-1] for client in clients}
+    assert len(messages) == 1  # serialized once, shared by everyone
+
+
+def test_resume_from_last_event_id(replay):
+    feed = LeagueFeed('Premier League', '2024-25', replay)
+    first = feed.subscribe()
+    replay.advance()
+    feed.poll_once()
+    seen = _events(first)[-1][0]
+    feed.unsubscribe(first)
+
+    replay.advance()
+    feed.poll_once()
+    replay.advance()
+    feed.poll_once()
+
+    resumed = feed.subscribe(last_event_id=str(seen))
+    events = _events(resumed)
+    assert [kind for _, kind, _ in events] == ['delta', 'delta']
+    assert [version for version, _, _ in events] == [seen + 1, seen + 2]
+
+    # Too old (or unknown) ids fall back to a snapshot
+    assert _events(feed.subscribe(last_event_id='nonsense'))[0][1] == 'snapshot'
+
+
+def test_slow_client_is_dropped(replay):
+    feed = LeagueFeed('Premier League', '2024-25', replay, queue_size=2)
+    slow = feed.subscribe()  # snapshot occupies one slot
+    for _ in range(3):
+        replay.advance()
+        feed.poll_once()
+    assert slow.closed
+    assert feed.subscriber_count == 0
+
+
+def test_stream_endpoint_sends_snapshot(replay, monkeypatch):
+    import app as app_module
+    hub = LiveScoreHub(lambda league, season: replay, poll_interval=3600)
+    monkeypatch.setattr(app_module, 'live_scores_hub', hub)
+    client = app_module.app.test_client()
+
+    assert client.get('/api/stream/scores?league=Nowhere').status_code == 400
+
+    response = client.get('/api/stream/scores?league=Premier League&season=2024-25')
+    assert response.mimetype == 'text/event-stream'
+    chunks = iter(response.response)
+    assert next(chunks).startswith(b'id: 1\nevent: snapshot\n')
+    response.close()
+    hub.stop()
+    assert hub.feed('Premier League', '2024-25').subscriber_count == 0
+
+
+def test_streams_past_the_limit_are_told_to_poll(replay, monkeypatch):
+    import app as app_module
+    hub = LiveScoreHub(lambda league, season: replay, poll_interval=3600, max_connections=1)
+    monkeypatch.setattr(app_module, 'live_scores_hub', hub)
+    client = app_module.app.test_client()
+
+    first = client.get('/api/stream/scores?league=Premier League&season=2024-25')
+    next(iter(first.response))
+    refused = client.get('/api/stream/scores?league=Premier League&season=2024-25')
+    assert refused.status_code == 503 and refused.headers['Retry-After']
+    assert refused.get_json()['poll'] == '/api/league/matches/Premier%20League?season=2024-25'
+
+    first.close()
+    assert hub.connection_count == 0
+    assert hub.subscribe('Premier League', '2024-25') is not None
+    hub.stop()
@@ -0,0 +1,200 @@
+"""
+Tests for the columnar multi-season match store
+"""
+
+import json
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+from pandas.testing import assert_frame_equal
+
+import config
+from football_json_loader import FootballJSONLoader, HistoryNotReady
+from http_cache import DiskHTTPCache
+from match_store import MatchStore
+from openfootball_stub import StubOpenFootballServer
+
+
+LEAGUE = 'English Premier League'
+
+with open('premier_league_2024_25_matches.json', 'rb') as f:
+    PL_BODY = f.read()
+
+
+def _frame(data, season):
+    loader = FootballJSONLoader.__new__(FootballJSONLoader)
+    return loader._parse_matches('Premier League', season, data)
+
+
+def _two_seasons():
+    data = json.loads(PL_BODY)
+    earlier = json.loads(PL_BODY)
+    for match in earlier['matches'][300:]:
+        del match['score']
+    return _frame(data, '2024-25'), _frame(earlier, '2023-24')
+
+
+def test_round_trips_frames_in_file_order():
+    current, earlier = _two_seasons()
+    store = MatchStore.from_frames([current, earlier])
+
+    assert len(store) == len(current) + len(earlier)
+    assert_frame_equal(store.query(LEAGUE, '2024-25', order='file'), current)
+    assert_frame_equal(store.query(LEAGUE, '2023-24', order='file'), earlier)
+
+
+def test_filters_match_a_full_scan():
+    current, earlier = _two_seasons()
+    store = MatchStore.from_frames([current, earlier])
+    everything = pd.concat([current, earlier], ignore_index=True)
+
+    def scan(mask):
+        return everything[mask].sort_values(['season', 'date'], kind='stable')
+
+    arsenal = store.query(team='Arsenal FC')
+    assert len(arsenal) == len(scan((everything.team1 == 'Arsenal FC') | (everything.team2 == 'Arsenal FC')))
+
+    meetings = store.query(team='Arsenal FC', opponent='Chelsea FC')
+    expected = scan(everything.team1.isin(['Arsenal FC', 'Chelsea FC']) &
+                    everything.team2.isin(['Arsenal FC', 'Chelsea FC']))
+    assert sorted(meetings['date']) == sorted(expected['date'])
+
+    december = store.query(LEAGUE, '2024-25', date_from='2024-12-01', date_to='2024-12-31')
+    assert list(december['date']) == sorted(current.date[(current.date >= '2024-12-01') &
+                                                         (current.date <= '2024-12-31')])
+
+    unplayed = store.query(played=False)
+    assert len(unplayed) == len(earlier) - 300
+    assert store.query(LEAGUE, '1999-00').empty
+    assert store.query(team='Nobody FC').empty
+
+
+def test_with_seasons_replaces_only_the_given_season():
+    current, earlier = _two_seasons()
+    store = MatchStore.from_frames([current, earlier])
+    updated = earlier.copy()
+    updated.loc[0, 'score1'] = 9
+
+    newer = store.with_seasons([updated])
+    assert len(newer) == len(store)
+    assert newer.query(LEAGUE, '2023-24', order='file')['score1'].iloc[0] == 9
+    assert_frame_equal(newer.query(LEAGUE, '2024-25', order='file'), current)
+    # The original store is untouched
+    assert store.query(LEAGUE, '2023-24', order='file')['score1'].iloc[0] == earlier['score1'].iloc[0]
+
+
+def test_loader_runs_on_the_store(tmp_path):
+    earlier = json.loads(PL_BODY)
+    files = {'/2024-25/en.1.json': PL_BODY, '/2023-24/en.1.json': json.dumps(earlier).encode(),
+             '/2024-25/de.1.json': PL_BODY}
+    with StubOpenFootballServer(files) as server:
+        loader = FootballJSONLoader(http_cache=DiskHTTPCache(str(tmp_path)), mirror_dir=None)
+        loader.BASE_URL = server.base_url
+
+        store = loader.load_history(['Premier League', 'Bundesliga'], ['2023-24', '2024-25'])
+        assert len(store) == 3 * 380
+        assert set(store.leagues) == {LEAGUE, 'German Bundesliga'}
+
+        # Already indexed: no rebuild, same frame from the store
+        matches = loader.get_league_matches('Premier League', '2024-25')
+        assert loader.match_store is store
+        assert_frame_equal(matches, _frame(json.loads(PL_BODY), '2024-25'))
+
+        history = loader.query_matches('Premier League', team='Arsenal FC')
+        assert len(history) == 76
+        assert np.all(history['season'].to_numpy()[:38] == '2023-24')
+
+
+def test_head_to_head_and_team_history(tmp_path):
+    files = {'/2023-24/en.1.json': PL_BODY, '/2024-25/en.1.json': PL_BODY}
+    with StubOpenFootballServer(files) as server:
+        loader = FootballJSONLoader(http_cache=DiskHTTPCache(str(tmp_path)), mirror_dir=None)
+        loader.BASE_URL = server.base_url
+        loader.refresh_history()
+
+        h2h = loader.get_head_to_head('Arsenal FC', 'Chelsea FC', 'Premier League', since='2023-24')
+        season = _frame(json.loads(PL_BODY), '2024-25')
+        meetings = season[season.team1.isin(['Arsenal FC', 'Chelsea FC']) &
+                          season.team2.isin(['Arsenal FC', 'Chelsea FC'])]
+        assert h2h['total_matches'] == 2 * len(meetings)
+        assert h2h['team1_wins'] + h2h['draws'] + h2h['team2_wins'] == h2h['played']
+        assert h2h['recent'][0]['date'] == max(meetings['date'])
+
+        history = loader.get_team_history('Arsenal FC', 'Premier League', since='2024-25', last_n=3)
+        table = loader.get_team_statistics('Premier League', '2024-25').set_index('team')
+        assert history['seasons'] == [{
+            'league': LEAGUE, 'season': '2024-25',
+            'played': 38, 'wins': int(table.loc['Arsenal FC', 'wins']),
+            'draws': int(table.loc['Arsenal FC', 'draws']), 'losses': int(table.loc['Arsenal FC', 'losses']),
+            'goals_for': int(table.loc['Arsenal FC', 'goals_for']),
+            'goals_against': int(table.loc['Arsenal FC', 'goals_against']),
+            'points': int(table.loc['Arsenal FC', 'points']),
+        }]
+        assert len(history['recent']) == 3
+        assert history['recent'][0]['date'] >= history['recent'][1]['date']
+
+
+def test_history_is_built_in_the_background_and_missing_seasons_are_remembered(tmp_path, monkeypatch):
+    files = {'/2023-24/en.1.json': PL_BODY, '/2024-25/en.1.json': PL_BODY}
+    with StubOpenFootballServer(files) as server:
+        loader = FootballJSONLoader(http_cache=DiskHTTPCache(str(tmp_path)), mirror_dir=None)
+        loader.BASE_URL = server.base_url
+
+        # The first request starts the build and is told to come back
+        with pytest.raises(HistoryNotReady):
+            loader.get_head_to_head('Arsenal FC', 'Chelsea FC')
+        deadline = time.monotonic() + 10
+        while loader.history_store() is None and time.monotonic() < deadline:
+            time.sleep(0.01)
+        store = loader.history_store()
+        assert len(store) == 2 * 380
+        assert len(server.requests) == len(loader.LEAGUES) * len(config.SEASONS)
+        assert len(loader.cache) == 0  # The bulk load bypasses the league cache
+        assert len(loader.match_store) == 0  # ... and leaves the per-page store alone
+
+        served = len(server.requests)
+        monkeypatch.setattr(loader, 'refresh_history', lambda *args: pytest.fail('history reloaded'))
+        loader.get_head_to_head('Arsenal FC', 'Chelsea FC')
+        loader.get_team_history('Arsenal FC', 'Premier League')
+        assert loader.history_store() is store and len(server.requests) == served
+
+        # A season that 404'd is not requested again, through either path
+        assert loader.fetch_league_data('de.1', '2024-25') is None
+        assert len(server.requests) == served
+
+
+def test_history_preload_reads_the_mirror_only(tmp_path):
+    mirror = tmp_path / 'mirror' / '2023-24'
+    mirror.mkdir(parents=True)
+    (mirror / 'en.1.json').write_bytes(PL_BODY)
+    with StubOpenFootballServer({'/2022-23/en.1.json': PL_BODY}) as server:
+        loader = FootballJSONLoader(http_cache=DiskHTTPCache(str(tmp_path / 'http')),
+                                    mirror_dir=str(tmp_path / 'mirror'))
+        loader.BASE_URL = server.base_url
+
+        store = loader.refresh_history(network=False)
+        assert server.requests == []
+        # The mirrored season plus the bundled 2024-25 file
+        assert sorted(store.seasons_for(LEAGUE)) == ['2023-24', '2024-25']
+        assert len(loader.match_store) == 0
+
+        # Indexing a season for a page does not touch the history store
+        loader.get_league_matches('Premier League', '2024-25')
+        assert loader.history_store() is store
+
+
+def test_history_routes_answer_503_until_the_history_is_built(tmp_path, monkeypatch):
+    import app as app_module
+    with StubOpenFootballServer({}) as server:
+        loader = FootballJSONLoader(http_cache=DiskHTTPCache(str(tmp_path)), mirror_dir=None)
+        loader.BASE_URL = server.base_url
+        monkeypatch.setattr(loader, '_refresh_history', lambda: None)  # Keep the build "running"
+        monkeypatch.setattr(app_module, 'football_loader', loader)
+        client = app_module.app.test_client()
+
+        for url in ('/api/h2h/Arsenal FC/Chelsea FC', '/api/team/history/Arsenal FC'):
+            response = client.get(url)
+            assert response.status_code == 503
+            assert response.headers['Retry-After'] == str(config.HISTORY_CONFIG['retry_after'])
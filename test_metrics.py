@@ -0,0 +1,71 @@
+"""
+Tests for the per-route request metrics and the /metrics endpoint
+"""
+
+from flask import Flask
+
+import app as app_module
+from metrics import Histogram, RequestMetrics
+
+
+def _samples(text):
+    """{series with labels: value} from Prometheus text, comments skipped"""
+    samples = {}
+    for line in text.splitlines():
+        if line and not line.startswith('#'):
+            name, value = line.rsplit(' ', 1)
+            samples[name] = float(value)
+    return samples
+
+
+def test_histogram_buckets_are_cumulative():
+    histogram = Histogram([0.01, 0.1, 1])
+    for value in (0.005, 0.01, 0.05, 2):
+        histogram.observe(value)
+    lines = histogram.lines('h', 'route="/x"')
+    assert lines[:4] == ['h_bucket{route="/x",le="0.01"} 2', 'h_bucket{route="/x",le="0.1"} 3',
+                         'h_bucket{route="/x",le="1"} 3', 'h_bucket{route="/x",le="+Inf"} 4']
+    assert lines[-1] == 'h_count{route="/x"} 4'
+
+
+def test_requests_are_recorded_per_route_template():
+    flask_app = Flask(__name__)
+    metrics = RequestMetrics(namespace='t')
+    metrics.init_app(flask_app)
+
+    @flask_app.route('/items/<name>')
+    def item(name):
+        if name == 'boom':
+            raise RuntimeError(name)
+        return 'x' * 100
+
+    client = flask_app.test_client()
+    for name in ('a', 'b', 'boom'):
+        client.get(f'/items/{name}')
+    client.get('/nowhere')
+    metrics.register_cache('things', lambda: {'hits': 3, 'misses': 1, 'entries': 2})
+    metrics.register_cache('not_loaded', lambda: None)
+
+    samples = _samples(metrics.render())
+    assert samples['t_http_requests_total{route="/items/<name>",method="GET",status="200"}'] == 2
+    assert samples['t_http_requests_total{route="/items/<name>",method="GET",status="500"}'] == 1
+    assert samples['t_http_request_errors_total{route="/items/<name>",method="GET"}'] == 1
+    assert samples['t_http_requests_total{route="<unmatched>",method="GET",status="404"}'] == 1
+    assert samples['t_http_request_duration_seconds_count{route="/items/<name>",method="GET"}'] == 3
+    assert samples['t_http_response_size_bytes_bucket{route="/items/<name>",method="GET",le="256"}'] == 2
+    assert samples['t_cache_hit_ratio{cache="things"}'] == 0.75
+    assert not any('not_loaded' in name for name in samples)
+
+
+def test_metrics_endpoint_reports_response_cache():
+    app_module.response_cache.clear()
+    client = app_module.app.test_client()
+    client.get('/api/leagues')
+    client.get('/api/leagues')
+
+    response = client.get('/metrics')
+    assert response.status_code == 200
+    assert response.content_type.startswith('text/plain; version=0.0.4')
+    samples = _samples(response.get_data(as_text=True))
+    assert samples['football_http_requests_total{route="/api/leagues",method="GET",status="200"}'] >= 2
+    assert samples['football_cache_hits_total{cache="response"}'] >= 1
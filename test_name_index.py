@@ -0,0 +1,51 @@
+"""
+Tests for normalized player name lookups and photo URLs
+"""
+
+import pandas as pd
+
+from name_index import PlayerNameIndex, normalize_name
+
+
+def _df(names):
+    return pd.DataFrame({'player_name': names, 'match_id': range(len(names))})
+
+
+def test_normalize_name():
+    assert normalize_name('  Martin   Ødegaard ') == 'martin odegaard'
+    assert normalize_name('Rúben Dias') == normalize_name('ruben dias') == 'ruben dias'
+    assert normalize_name('Mesut Özil') == 'mesut ozil'
+    assert normalize_name('Leon Goretzka-Weiß') == 'leon goretzka-weiss'
+    assert normalize_name('STRASSE') == normalize_name('Straße')
+    assert normalize_name('Søren Kragh') == 'soren kragh'
+
+
+def test_lookup_exact_then_normalized():
+    index = PlayerNameIndex(_df(['Martin Ødegaard', ' Rúben Dias ', 'Rúben Dias', 'Thomas Weiß']))
+    assert len(index) == 3  # ' Rúben Dias ' and 'Rúben Dias' are one player
+
+    entry = index.lookup('martin odegaard')
+    assert entry.name == 'Martin Ødegaard' and entry.key == 'Martin Ødegaard'
+    assert index.lookup('RUBEN DIAS').rows.tolist() == [1, 2]
+    assert index.lookup('thomas weiss').name == 'Thomas Weiß'
+    assert index.lookup('Nobody') is None
+
+
+def test_exact_match_wins_over_normalized_match():
+    # Both normalize to 'joao felix'; each spelling finds its own player
+    index = PlayerNameIndex(_df(['Joao Felix', 'João Félix']))
+    assert index.lookup('João Félix').name == 'João Félix'
+    assert index.lookup('Joao Felix').name == 'Joao Felix'
+    assert index.lookup('joão felix').name == 'Joao Felix'  # Normalized: first in the data
+
+
+def test_photo_url():
+    photos = {'Martin Ødegaard': 'https://example.com/odegaard.jpg',
+              'Joao Felix': 'https://example.com/plain.jpg',
+              'João Félix': 'https://example.com/accented.jpg'}
+    index = PlayerNameIndex(_df(['Martin Ødegaard', 'João Félix']), photos)
+    assert index.photo_url('martin odegaard') == 'https://example.com/odegaard.jpg'
+    assert index.photo_url('João Félix') == 'https://example.com/accented.jpg'
+    assert index.photo_url('joao felix') == 'https://example.com/plain.jpg'
+    assert index.lookup('João Félix').photo_url == 'https://example.com/accented.jpg'
+    assert index.photo_url('Nobody') is None
@@ -0,0 +1,52 @@
+"""
+Tests for the local OpenFootball mirror and offline-first loading
+"""
+
+import json
+import os
+
+from football_json_loader import FootballJSONLoader
+from http_cache import DiskHTTPCache
+from openfootball_mirror import mirror_path, read_mirror, sync_mirror
+from openfootball_stub import StubOpenFootballServer
+
+
+SEASON = {'name': 'Test League', 'matches': [
+    {'round': 'Matchday 1', 'date': '2023-08-12', 'team1': 'A FC', 'team2': 'B FC', 'score': {'ft': [2, 1]}},
+]}
+BODY = json.dumps(SEASON).encode('utf-8')
+
+
+def test_sync_mirrors_published_files_and_revalidates(tmp_path):
+    files = {'/2023-24/en.1.json': BODY, '/2023-24/de.1.json': BODY}
+    with StubOpenFootballServer(files) as server:
+        first = sync_mirror(str(tmp_path), ['2023-24'], ['en.1', 'de.1', 'it.1'], base_url=server.base_url)
+        assert first == {'downloaded': 2, 'unchanged': 0, 'missing': 1, 'failed': 0}
+        assert open(mirror_path(str(tmp_path), '2023-24', 'en.1'), 'rb').read() == BODY
+
+        second = sync_mirror(str(tmp_path), ['2023-24'], ['en.1', 'de.1'], base_url=server.base_url)
+        assert second['unchanged'] == 2
+        assert [status for _, _, status in server.requests[-2:]] == [304, 304]
+
+
+def test_loader_reads_mirror_without_network(tmp_path):
+    mirror_dir = tmp_path / 'mirror'
+    path = mirror_path(str(mirror_dir), '2023-24', 'en.1')
+    os.makedirs(os.path.dirname(path))
+    with open(path, 'wb') as f:
+        f.write(BODY)
+
+    with StubOpenFootballServer({}) as server:
+        loader = FootballJSONLoader(http_cache=DiskHTTPCache(str(tmp_path / 'http')), mirror_dir=str(mirror_dir))
+        loader.BASE_URL = server.base_url
+
+        assert len(loader.get_league_matches('Premier League', '2023-24')) == 1
+        # Not in the mirror: falls back to the network
+        assert loader.get_league_matches('Bundesliga', '2023-24').empty
+        assert [path for _, path, _ in server.requests] == ['/2023-24/de.1.json']
+
+
+def test_bundled_premier_league_file_is_part_of_the_mirror(tmp_path):
+    body = read_mirror(str(tmp_path), '2024-25', 'en.1')
+    assert body is not None
+    assert len(json.loads(body)['matches']) == 380
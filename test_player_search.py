@@ -0,0 +1,43 @@
+"""
+Tests for the player autocomplete index
+"""
+
+from player_search import PlayerSearchIndex, MAX_LIMIT
+
+
+NAMES = ['Erling Haaland', 'Mohamed Salah', 'William Saliba', 'Martin Ødegaard',
+         'Kevin De Bruyne', 'Marcus Rashford', 'Salomon Rondón']
+
+
+def test_prefix_matches_full_name_before_word_prefix():
+    index = PlayerSearchIndex(NAMES)
+    assert index.search('sal') == ['Salomon Rondón', 'Mohamed Salah', 'William Saliba']
+    assert index.search('haal') == ['Erling Haaland']
+    assert index.search('de br') == ['Kevin De Bruyne']
+
+
+def test_full_name_match_survives_many_word_prefix_matches():
+    # Alphabetically every 'Aaron Zz...' comes before 'Zz Top', so a single
+    # capped candidate list would keep only word-prefix matches
+    names = [f"Aaron Zz{i:03d}" for i in range(200)] + ['Zz Top']
+    index = PlayerSearchIndex(names)
+    assert index.search('zz')[0] == 'Zz Top'
+    assert index.search('zz', limit=3) == ['Zz Top', 'Aaron Zz000', 'Aaron Zz001']
+
+
+def test_case_and_accent_insensitive():
+    index = PlayerSearchIndex(NAMES)
+    assert index.search('  MARTIN odegaard') == ['Martin Ødegaard']
+
+
+def test_typo_tolerant_matches():
+    index = PlayerSearchIndex(NAMES)
+    assert index.search('halaand') == ['Erling Haaland']
+    assert index.search('rashfrd') == ['Marcus Rashford']
+
+
+def test_limits():
+    index = PlayerSearchIndex([f"Player {i:05d}" for i in range(500)])
+    assert len(index.search('player', limit=5)) == 5
+    assert len(index.search('player', limit=10_000)) == MAX_LIMIT
+    assert index.search('') == []
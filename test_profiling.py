@@ -0,0 +1,65 @@
+"""
+Tests for opt-in request profiling and /debug/profiles
+"""
+
+from flask import Flask
+
+import app as app_module
+from profiling import RequestProfiler
+
+
+def _app(profiler):
+    flask_app = Flask(__name__)
+    profiler.init_app(flask_app)
+
+    @flask_app.route('/work/<int:n>')
+    def work(n):
+        return str(sum(i * i for i in range(n)))
+
+    return flask_app
+
+
+def test_disabled_profiler_installs_no_hooks():
+    flask_app = _app(RequestProfiler(enabled=False, token=None))
+    assert not flask_app.before_request_funcs and not flask_app.after_request_funcs
+
+
+def test_admin_header_profiles_only_that_request():
+    profiler = RequestProfiler(enabled=False, token='secret', top_n=5)
+    client = _app(profiler).test_client()
+
+    assert 'X-Profile-Id' not in client.get('/work/10').headers
+    assert 'X-Profile-Id' not in client.get('/work/10', headers={'X-Profile': 'wrong'}).headers
+    response = client.get('/work/20000', headers={'X-Profile': 'secret'})
+
+    [profile] = profiler.profiles()
+    assert response.headers['X-Profile-Id'] == str(profile['id'])
+    assert profile['route'] == '/work/<int:n>' and profile['status'] == 200
+    assert len(profile['functions']) == 5
+    cumulative = [f['cumulative_time'] for f in profile['functions']]
+    assert cumulative == sorted(cumulative, reverse=True)
+
+
+def test_sampled_profiles_are_kept_in_a_ring_buffer():
+    profiler = RequestProfiler(enabled=True, sample_rate=1.0, buffer_size=3)
+    client = _app(profiler).test_client()
+    for n in range(5):
+        client.get(f'/work/{n}')
+    assert [p['path'] for p in profiler.profiles()] == ['/work/4', '/work/3', '/work/2']
+    assert profiler.profiles(route='/nowhere') == []
+
+
+def test_profiles_endpoint_is_off_by_default():
+    assert not app_module.profiler.active
+    assert app_module.app.test_client().get('/debug/profiles').status_code == 404
+
+
+def test_profiles_endpoint_needs_the_token_in_the_header(monkeypatch):
+    client = app_module.app.test_client()
+    monkeypatch.setattr(app_module, 'profiler', RequestProfiler(enabled=True, token=None))
+    assert client.get('/debug/profiles').status_code == 404  # Sampling alone never exposes it
+
+    monkeypatch.setattr(app_module, 'profiler', RequestProfiler(enabled=True, token='secret'))
+    assert client.get('/debug/profiles').status_code == 403
+    assert client.get('/debug/profiles', query_string={'token': 'secret'}).status_code == 403
+    assert client.get('/debug/profiles', headers={'X-Profile': 'secret'}).status_code == 200
@@ -0,0 +1,93 @@
+"""
+Tests for the server-side response cache (ETag/304, gzip, version keys)
+"""
+
+import gzip
+import json
+
+from flask import Flask, jsonify, request
+
+from response_cache import ResponseCache
+
+
+def _app(version, min_compress_size=64):
+    app = Flask(__name__)
+    cache = ResponseCache(min_compress_size=min_compress_size)
+    calls = []
+
+    @app.route('/api/items/<name>')
+    @cache.cached(lambda name: version['value'])
+    def items(name):
+        calls.append((name, dict(request.args)))
+        if name == 'missing':
+            return jsonify({'error': 'not found'}), 404
+        return jsonify({'name': name, 'version': version['value'], 'items': list(range(50))})
+
+    return app, cache, calls
+
+
+def test_serves_cached_body_until_version_changes():
+    version = {'value': 'v1'}
+    app, cache, calls = _app(version)
+    client = app.test_client()
+
+    first = client.get('/api/items/a')
+    second = client.get('/api/items/a')
+    assert first.get_data() == second.get_data()
+    assert len(calls) == 1
+
+    # Different arguments are different entries
+    client.get('/api/items/a?season=2023-24')
+    assert len(calls) == 2
+
+    version['value'] = 'v2'
+    third = client.get('/api/items/a')
+    assert third.get_json()['version'] == 'v2'
+    assert third.headers['ETag'] != first.headers['ETag']
+    assert len(calls) == 3
+
+
+def test_if_none_match_returns_304():
+    app, _, calls = _app({'value': 'v1'})
+    client = app.test_client()
+
+    etag = client.get('/api/items/a').headers['ETag']
+    assert etag.startswith('"') and not etag.startswith('W/')
+
+    revalidated = client.get('/api/items/a', headers={'If-None-Match': etag})
+    assert revalidated.status_code == 304
+    assert revalidated.get_data() == b''
+    assert revalidated.headers['ETag'] == etag
+    assert len(calls) == 1
+
+
+def test_gzip_representation_has_its_own_etag():
+    app, _, _ = _app({'value': 'v1'})
+    client = app.test_client()
+
+    plain = client.get('/api/items/a')
+    compressed = client.get('/api/items/a', headers={'Accept-Encoding': 'gzip, deflate'})
+    assert compressed.headers['Content-Encoding'] == 'gzip'
+    assert compressed.headers['Vary'] == 'Accept-Encoding'
+    assert json.loads(gzip.decompress(compressed.get_data())) == plain.get_json()
+    assert compressed.headers['ETag'] != plain.headers['ETag']
+
+    # Either representation's tag revalidates
+    assert client.get('/api/items/a', headers={'If-None-Match': compressed.headers['ETag'],
+                                               'Accept-Encoding': 'gzip'}).status_code == 304
+
+
+def test_errors_and_unversioned_responses_are_not_cached():
+    version = {'value': 'v1'}
+    app, cache, calls = _app(version)
+    client = app.test_client()
+
+    assert client.get('/api/items/missing').status_code == 404
+    assert client.get('/api/items/missing').status_code == 404
+    assert len(calls) == 2
+
+    version['value'] = None
+    client.get('/api/items/a')
+    client.get('/api/items/a')
+    assert len(calls) == 4
+    assert cache.stats()['entries'] == 0
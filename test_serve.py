@@ -0,0 +1,75 @@
+"""
+Tests for the built-in preforking server (serve.py)
+"""
+
+import http.client
+import socket
+import threading
+import time
+
+from serve import PooledWSGIServer, listen, parse_bind
+
+
+def _app(environ, start_response):
+    body = environ['PATH_INFO'].encode()
+    start_response('200 OK', [('Content-Type', 'text/plain'), ('Content-Length', str(len(body)))])
+    return [body]
+
+
+def test_parse_bind():
+    assert parse_bind('127.0.0.1:8080') == ('127.0.0.1', 8080)
+    assert parse_bind(':9000') == ('0.0.0.0', 9000)
+
+
+def test_pooled_server_serves_from_inherited_socket():
+    sock = listen('127.0.0.1', 0, 16)
+    host, port = sock.getsockname()
+    server = PooledWSGIServer(host, port, _app, threads=2, fd=sock.fileno())
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        # No keep-alive: every response closes its connection (http.client reconnects)
+        connections = [http.client.HTTPConnection(host, port, timeout=5) for _ in range(2)]
+        for i in range(3):
+            for n, conn in enumerate(connections):
+                conn.request('GET', f'/{n}/{i}')
+                response = conn.getresponse()
+                assert response.status == 200
+                assert response.getheader('Connection') == 'close'
+                assert response.read() == f'/{n}/{i}'.encode()
+                assert conn.sock is None
+        for conn in connections:
+            conn.close()
+    finally:
+        server.shutdown()
+        server.server_close()
+        sock.close()
+
+
+def test_idle_connections_time_out_and_excess_ones_get_503():
+    sock = listen('127.0.0.1', 0, 16)
+    host, port = sock.getsockname()
+    server = PooledWSGIServer(host, port, _app, threads=1, fd=sock.fileno(),
+                              keepalive_timeout=0.5, max_pending=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        # Connects but never sends a request: holds the only thread, and nothing may queue
+        idle = socket.create_connection((host, port))
+        time.sleep(0.1)
+        busy = http.client.HTTPConnection(host, port, timeout=5)
+        busy.request('GET', '/busy')
+        response = busy.getresponse()
+        assert response.status == 503 and response.getheader('Retry-After') == '1'
+        busy.close()
+
+        time.sleep(1)  # Idle timeout frees the thread
+        fresh = http.client.HTTPConnection(host, port, timeout=5)
+        fresh.request('GET', '/fresh')
+        assert fresh.getresponse().read() == b'/fresh'
+        fresh.close()
+        idle.close()
+    finally:
+        server.shutdown()
+        server.server_close()
+        sock.close()
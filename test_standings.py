@@ -0,0 +1,231 @@
+"""
+Tests for the columnar standings engine: output must match the original
+row-by-row implementation exactly
+"""
+
+import json
+
+import numpy as np
+import pandas as pd
+from pandas.testing import assert_frame_equal
+
+from football_json_loader import FootballJSONLoader
+from standings import IncrementalStandings, SeasonTimeline, compute_form, compute_standings
+
+
+def legacy_standings(df, league_name, season):
+    """Reference: the original iterrows implementation"""
+    if df.empty:
+        return pd.DataFrame()
+
+    # Filter only completed matches (with scores)
+    df = df[df['score1'].notna() & df['score2'].notna()].copy()
+
+    if df.empty:
+        return pd.DataFrame()
+
+    teams_stats = {}
+
+    for _, match in df.iterrows():
+        team1, team2 = match['team1'], match['team2']
+        score1, score2 = match['score1'], match['score2']
+
+        # Initialize team stats if not exists
+        for team in [team1, team2]:
+            if team not in teams_stats:
+                teams_stats[team] = {
+                    'team': team,
+                    'played': 0,
+                    'wins': 0,
+                    'draws': 0,
+                    'losses': 0,
+                    'goals_for': 0,
+                    'goals_against': 0,
+                    'goal_difference': 0,
+                    'points': 0,
+                }
+
+        # Update stats for team1
+        teams_stats[team1]['played'] += 1
+        teams_stats[team1]['goals_for'] += score1
+        teams_stats[team1]['goals_against'] += score2
+
+        # Update stats for team2
+        teams_stats[team2]['played'] += 1
+        teams_stats[team2]['goals_for'] += score2
+        teams_stats[team2]['goals_against'] += score1
+
+        # Determine winner
+        if score1 > score2:
+            teams_stats[team1]['wins'] += 1
+            teams_stats[team1]['points'] += 3
+            teams_stats[team2]['losses'] += 1
+        elif score1 < score2:
+            teams_stats[team2]['wins'] += 1
+            teams_stats[team2]['points'] += 3
+            teams_stats[team1]['losses'] += 1
+        else:
+            teams_stats[team1]['draws'] += 1
+            teams_stats[team1]['points'] += 1
+            teams_stats[team2]['draws'] += 1
+            teams_stats[team2]['points'] += 1
+
+    # Calculate goal difference
+    for team in teams_stats:
+        teams_stats[team]['goal_difference'] = (
+            teams_stats[team]['goals_for'] - teams_stats[team]['goals_against']
+        )
+
+    # Convert to DataFrame and sort by points
+    stats_df = pd.DataFrame(list(teams_stats.values()))
+    stats_df = stats_df.sort_values(
+        ['points', 'goal_difference', 'goals_for'],
+        ascending=[False, False, False]
+    ).reset_index(drop=True)
+
+    # Add position
+    stats_df.insert(0, 'position', range(1, len(stats_df) + 1))
+
+    stats_df['league'] = league_name
+    stats_df['season'] = season
+
+    return stats_df
+
+
+def _season_frame(data):
+    loader = FootballJSONLoader.__new__(FootballJSONLoader)
+    return loader._parse_matches('Premier League', '2024-25', data)
+
+
+def _premier_league():
+    with open('premier_league_2024_25_matches.json') as f:
+        return json.load(f)
+
+
+def test_matches_legacy_on_full_season():
+    df = _season_frame(_premier_league())
+    assert_frame_equal(compute_standings(df, 'Premier League', '2024-25'),
+                       legacy_standings(df, 'Premier League', '2024-25'))
+
+
+def test_matches_legacy_on_partial_season_with_ties():
+    data = _premier_league()
+    rng = np.random.default_rng(7)
+    for i, match in enumerate(data['matches']):
+        if i > 150:
+            match.pop('score', None)  # Unplayed: scores become NaN floats
+        elif i % 3 == 0:
+            match['score'] = {'ft': [int(rng.integers(0, 2)), int(rng.integers(0, 2))]}
+    df = _season_frame(data)
+    assert df['score1'].dtype == np.float64
+    assert_frame_equal(compute_standings(df, 'Premier League', '2024-25'),
+                       legacy_standings(df, 'Premier League', '2024-25'))
+
+
+def test_empty_inputs():
+    assert compute_standings(pd.DataFrame(), 'Premier League', '2024-25').empty
+    data = _premier_league()
+    for match in data['matches']:
+        match.pop('score', None)
+    assert compute_standings(_season_frame(data), 'Premier League', '2024-25').empty
+
+
+def legacy_team_form(df, team_name, last_n):
+    """Reference: the original per-team form scan"""
+    team_matches = df[
+        ((df['team1'] == team_name) | (df['team2'] == team_name)) &
+        (df['score1'].notna()) & (df['score2'].notna())
+    ]
+    form = []
+    for _, match in team_matches.tail(last_n).iterrows():
+        own, other = ('score1', 'score2') if match['team1'] == team_name else ('score2', 'score1')
+        form.append('W' if match[own] > match[other] else 'L' if match[own] < match[other] else 'D')
+    return form
+
+
+def test_form_matches_per_team_scan():
+    data = _premier_league()
+    for match in data['matches'][200:]:
+        match.pop('score', None)
+    df = _season_frame(data)
+
+    for last_n in (1, 5, 50):
+        form = compute_form(df, last_n)
+        assert len(form) == 20
+        for team, results in form.items():
+            assert results == legacy_team_form(df, team, last_n)
+
+
+def test_incremental_updates_match_full_recompute():
+    data = _premier_league()
+    for match in data['matches'][300:]:
+        match.pop('score', None)
+    df = _season_frame(data)
+    table = IncrementalStandings.from_matches(df)
+
+    def check():
+        expected = compute_standings(df, 'Premier League', '2024-25')
+        assert_frame_equal(table.to_frame('Premier League', '2024-25', df['score1'].dtype), expected)
+
+    check()
+
+    # New results arrive for three scheduled matches
+    for position, (score1, score2) in zip((300, 301, 302), ((2, 1), (0, 0), (1, 3))):
+        df.loc[position, ['score1', 'score2']] = [score1, score2]
+        table.apply(position, df.at[position, 'team1'], df.at[position, 'team2'], score1, score2)
+    check()
+
+    # Score correction and a deleted result
+    df.loc[301, ['score1', 'score2']] = [1, 0]
+    table.apply(301, df.at[301, 'team1'], df.at[301, 'team2'], 1, 0)
+    df.loc[10, ['score1', 'score2']] = [None, None]
+    table.retract(10)
+    check()
+
+    # sync() finds the same differences on its own
+    df.loc[303, ['score1', 'score2']] = [4, 4]
+    df.loc[0, ['score1', 'score2']] = [0, 5]
+    assert table.sync(df) == 2
+    check()
+
+
+def test_sync_applies_only_changed_results():
+    data = _premier_league()
+    for match in data['matches'][300:]:
+        match.pop('score', None)
+    df = _season_frame(data)
+    table = IncrementalStandings.from_matches(df)
+    assert table.sync(df) == 0
+
+    updated = df.copy()
+    updated.loc[300, ['score1', 'score2']] = [2, 2]  # New result
+    updated.loc[5, ['score1', 'score2']] = [0, 0]  # Correction
+    updated.loc[6, ['score1', 'score2']] = [None, None]  # Retracted
+    assert table.sync(updated) == 3
+    assert_frame_equal(table.to_frame('Premier League', '2024-25', updated['score1'].dtype),
+                       compute_standings(updated, 'Premier League', '2024-25'))
+
+
+def test_timeline_tables_match_recompute_for_every_round():
+    data = _premier_league()
+    for match in data['matches'][350:]:
+        match.pop('score', None)
+    df = _season_frame(data)
+    timeline = SeasonTimeline(df)
+    round_ids, _ = pd.factorize(df['round'])
+
+    assert len(timeline.rounds) == 38
+    for r, round_name in enumerate(timeline.rounds):
+        assert_frame_equal(timeline.table_as_of(round_name, 'Premier League', '2024-25'),
+                           compute_standings(df[round_ids <= r], 'Premier League', '2024-25'))
+
+
+def test_position_history():
+    df = _season_frame(_premier_league())
+    timeline = SeasonTimeline(df)
+    final = compute_standings(df, 'Premier League', '2024-25')
+
+    history = timeline.position_history('Liverpool FC')
+    assert len(history) == 38
+    assert history[-1]['position'] == int(final.loc[final['team'] == 'Liverpool FC', 'position'].iloc[0])
+    assert history[-1]['points'] == 84
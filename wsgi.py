@@ -0,0 +1,41 @@
+"""
+WSGI Entry Point for Production Serving
+Preloads all shared data in the master process before workers are forked,
+so workers share those pages copy-on-write.
+
+Usage:
+    gunicorn -c gunicorn.conf.py wsgi:application     # if gunicorn is installed
+    python serve.py --workers 4 --threads 8           # built-in preforking server
+"""
+
+import gc
+
+import app as app_module
+
+
+def create_app(preload: bool = True):
+    """
+    Build the Flask application for a WSGI server
+
+    Args:
+        preload: Load player data, the model and match data now (in the
+            master, before forking) rather than on first request
+
+    Returns:
+        The Flask application
+    """
+    if preload:
+        app_module.preload()
+        # Move everything loaded so far out of the collector's reach: otherwise
+        # the first collection in each worker touches (and copies) every page
+        gc.collect()
+        gc.freeze()
+    return app_module.app
+
+
+def post_fork():
+    """Per-worker setup: background threads do not survive fork()"""
+    app_module.data_store.start()
+
+
+application = create_app()